@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Concurrent importer for backends without the /parts/bulk-create endpoint.
+
+Items are POSTed to /parts by a fixed number of asyncio workers that share a
+single pooled keep-alive aiohttp session. Requests are paced by a token
+bucket, and transient failures (5xx, 429, timeouts, dropped connections) are
+retried with exponential backoff, so one slow response only holds up its
+own worker instead of the whole import.
+"""
+
+import time
+import random
+import asyncio
+
+import aiohttp
+
+from instrumentation import METRICS
+from import_items_from_pdf import API_BASE_URL, iter_payloads, print_import_summary, part_id_from_response
+
+class TokenBucket:
+    """Allow `rate` acquisitions per second with bursts of up to `capacity`."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class RetryableError(Exception):
+    """A response or failure worth retrying."""
+
+def _backoff_delay(attempt, base, retry_after=None):
+    """Exponential backoff with jitter; honours a Retry-After header if given."""
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return base * (2 ** attempt) * (0.5 + random.random())
+
+async def _post_with_retry(session, url, payload, bucket, max_retries, backoff_base, stats):
+    """POST payload, retrying transient failures; returns (status, text)."""
+    for attempt in range(max_retries + 1):
+        if bucket:
+            await bucket.acquire()
+        retry_after = None
+        start = time.perf_counter()
+        try:
+            async with session.post(url, json=payload) as response:
+                text = await response.text()
+                METRICS.add('http POST /parts', time.perf_counter() - start, payload.get('part_no'))
+                if response.status >= 500 or response.status == 429:
+                    retry_after = response.headers.get('Retry-After')
+                    raise RetryableError(f"{response.status} - {text[:100]}")
+                return response.status, text
+        except (RetryableError, aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == max_retries:
+                raise
+            stats['retries'] += 1
+            METRICS.count('http_retries')
+            await asyncio.sleep(_backoff_delay(attempt, backoff_base, retry_after))
+
+async def _import_async(items, total, api_base_url, concurrency, rate, max_retries, backoff_base, timeout, journal,
+                        references):
+    parts_endpoint = f"{api_base_url}/parts"
+    progress_total = f"/{total}" if total is not None else ""
+    bucket = TokenBucket(rate) if rate else None
+    stats = {'success': 0, 'errors': 0, 'retries': 0, 'done': 0}
+    errors = []
+
+    item_iter = iter_payloads(items, references)
+    loop = asyncio.get_running_loop()
+    iter_lock = asyncio.Lock()
+
+    async def next_item():
+        # items may be a stream still being extracted from the PDF (and
+        # resolving references may create them), so pull from it off the
+        # event loop to keep in-flight requests moving
+        async with iter_lock:
+            return await loop.run_in_executor(None, next, item_iter, None)
+
+    connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=60)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+
+        async def worker():
+            while True:
+                entry = await next_item()
+                if entry is None:
+                    return
+                idx, item, payload, body = entry
+                try:
+                    status, text = await _post_with_retry(
+                        session, parts_endpoint, body,
+                        bucket, max_retries, backoff_base, stats,
+                    )
+                    if status in [200, 201]:
+                        stats['success'] += 1
+                        if journal:
+                            journal.record(payload, True, part_id_from_response(text))
+                    else:
+                        stats['errors'] += 1
+                        error_msg = f"Item {idx} ({item.get('part_no', 'N/A')}): {status} - {text[:100]}"
+                        errors.append(error_msg)
+                        if journal:
+                            journal.record(payload, False, error=error_msg)
+                        print(f"  ❌ Error importing item {idx}: {status}")
+                except Exception as e:
+                    stats['errors'] += 1
+                    message = str(e)[:100] or type(e).__name__
+                    error_msg = f"Item {idx} ({item.get('part_no', 'N/A')}): {message}"
+                    errors.append(error_msg)
+                    if journal:
+                        journal.record(payload, False, error=error_msg)
+                    print(f"  ❌ Exception importing item {idx}: {message}")
+
+                stats['done'] += 1
+                if stats['done'] % 10 == 0:
+                    print(f"  ✅ Imported {stats['done']}{progress_total} items...")
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return stats, errors
+
+def import_items_async(items, total=None, api_base_url=API_BASE_URL, concurrency=8,
+                       rate=0, max_retries=3, backoff_base=0.5, timeout=30, journal=None, references=None):
+    """Import items with `concurrency` parallel POSTs over one pooled session.
+
+    rate limits requests per second across all workers (0 = unlimited);
+    max_retries bounds retries of 5xx/429 responses, timeouts and connection
+    errors. Outcomes are recorded in the optional ImportJournal, and an
+    optional ReferenceCache resolves brands and categories to ids. Returns
+    (success_count, error_count) like import_items_to_app.
+    """
+    if total is None and hasattr(items, '__len__'):
+        total = len(items)
+
+    if total is not None:
+        print(f"\n📤 Importing {total} items to the app ({concurrency} concurrent requests)...")
+    else:
+        print(f"\n📤 Importing items to the app as they are extracted ({concurrency} concurrent requests)...")
+
+    stats, errors = asyncio.run(_import_async(
+        items, total, api_base_url, concurrency, rate, max_retries, backoff_base, timeout, journal, references,
+    ))
+
+    print_import_summary(stats['success'], stats['errors'], errors)
+    print(f"   Retries: {stats['retries']}")
+    return stats['success'], stats['errors']
@@ -468,6 +468,258 @@ router.post('/bulk-update-prices', async (req: Request, res: Response) => {
   }
 });
 
+// Bulk create parts - MUST BE BEFORE /:id routes
+// Accepts { parts: [...] } with the same fields as POST / and reports a result per row,
+// so one bad row does not fail the whole batch.
+router.post('/bulk-create', async (req: Request, res: Response) => {
+  try {
+    const { parts } = req.body;
+
+    if (!parts || !Array.isArray(parts) || parts.length === 0) {
+      return res.status(400).json({ error: 'parts array is required' });
+    }
+
+    if (parts.length > 1000) {
+      return res.status(400).json({ error: 'A maximum of 1000 parts can be created per request' });
+    }
+
+    const isUUID = (str: string) => {
+      const uuidRegex = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+      return uuidRegex.test(str);
+    };
+
+    // Reference data repeats heavily within a batch, so resolve each name only once
+    const masterPartIds = new Map<string, string>();
+    const brandIds = new Map<string, string>();
+    const categoryIds = new Map<string, string | null>();
+    const subcategories = new Map<string, { id: string; categoryId: string } | null>();
+    const applications = new Map<string, { id: string; subcategoryId: string; categoryId: string | null } | null>();
+
+    const resolveMasterPart = async (masterPartNo: string) => {
+      if (!masterPartIds.has(masterPartNo)) {
+        const masterPart = await prisma.masterPart.upsert({
+          where: { masterPartNo },
+          update: {},
+          create: { masterPartNo },
+        });
+        masterPartIds.set(masterPartNo, masterPart.id);
+      }
+      return masterPartIds.get(masterPartNo)!;
+    };
+
+    const resolveBrand = async (name: string) => {
+      if (!brandIds.has(name)) {
+        const brand = await prisma.brand.upsert({
+          where: { name },
+          update: {},
+          create: { name },
+        });
+        brandIds.set(name, brand.id);
+      }
+      return brandIds.get(name)!;
+    };
+
+    const resolveCategory = async (value: string) => {
+      if (!categoryIds.has(value)) {
+        let category = isUUID(value)
+          ? await prisma.category.findUnique({ where: { id: value } })
+          : null;
+        if (!category) {
+          category = await prisma.category.findUnique({ where: { name: value } });
+        }
+        if (!category) {
+          try {
+            category = await prisma.category.create({ data: { name: value, status: 'active' } });
+          } catch (createError: any) {
+            // Created concurrently - look it up again
+            category = await prisma.category.findUnique({ where: { name: value } });
+          }
+        }
+        categoryIds.set(value, category ? category.id : null);
+      }
+      return categoryIds.get(value) || null;
+    };
+
+    const resolveSubcategory = async (value: string, categoryId: string | null) => {
+      const key = `${categoryId || ''}|${value}`;
+      if (!subcategories.has(key)) {
+        let subcategory = isUUID(value)
+          ? await prisma.subcategory.findUnique({ where: { id: value } })
+          : null;
+        if (!subcategory) {
+          subcategory = await prisma.subcategory.findFirst({
+            where: categoryId ? { name: value, categoryId } : { name: value },
+          });
+        }
+        if (!subcategory && categoryId) {
+          try {
+            subcategory = await prisma.subcategory.create({
+              data: { name: value, categoryId, status: 'active' },
+            });
+          } catch (createError: any) {
+            subcategory = await prisma.subcategory.findFirst({ where: { name: value, categoryId } });
+          }
+        }
+        subcategories.set(key, subcategory ? { id: subcategory.id, categoryId: subcategory.categoryId } : null);
+      }
+      return subcategories.get(key) || null;
+    };
+
+    const resolveApplication = async (value: string, subcategoryId: string | null) => {
+      const key = `${subcategoryId || ''}|${value}`;
+      if (!applications.has(key)) {
+        let application = isUUID(value)
+          ? await prisma.application.findUnique({ where: { id: value }, include: { subcategory: true } })
+          : null;
+        if (!application && subcategoryId) {
+          application = await prisma.application.findFirst({
+            where: { name: value, subcategoryId },
+            include: { subcategory: true },
+          });
+        }
+        if (!application) {
+          application = await prisma.application.findFirst({
+            where: { name: value },
+            include: { subcategory: true },
+          });
+        }
+        if (!application && subcategoryId) {
+          try {
+            application = await prisma.application.create({
+              data: { name: value, subcategoryId, status: 'active' },
+              include: { subcategory: true },
+            });
+          } catch (createError: any) {
+            application = await prisma.application.findFirst({
+              where: { name: value, subcategoryId },
+              include: { subcategory: true },
+            });
+          }
+        }
+        applications.set(key, application
+          ? {
+              id: application.id,
+              subcategoryId: application.subcategoryId,
+              categoryId: application.subcategory?.categoryId || null,
+            }
+          : null);
+      }
+      return applications.get(key) || null;
+    };
+
+    const parseNumber = (value: any) =>
+      value !== null && value !== undefined && value !== '' ? parseFloat(String(value)) : null;
+
+    const parseStatus = (status: any) => {
+      if (!status) return 'active';
+      const statusStr = String(status).trim();
+      if (statusStr === 'A' || statusStr === 'a') return 'active';
+      if (statusStr === 'N' || statusStr === 'n') return 'inactive';
+      return statusStr === 'active' || statusStr === 'inactive' ? statusStr : 'active';
+    };
+
+    const results: any[] = [];
+
+    for (let index = 0; index < parts.length; index++) {
+      const item = parts[index] || {};
+      const partNoStr = item.part_no ? String(item.part_no).trim() : '';
+
+      if (!partNoStr) {
+        results.push({ index, part_no: null, status: 'error', error: 'Part number is required' });
+        continue;
+      }
+
+      try {
+        const masterPartId = item.master_part_no
+          ? await resolveMasterPart(String(item.master_part_no).trim())
+          : null;
+        const brandId = item.brand_name ? await resolveBrand(String(item.brand_name).trim()) : null;
+
+        let categoryId = item.category_id && String(item.category_id).trim() !== ''
+          ? await resolveCategory(String(item.category_id).trim())
+          : null;
+
+        let subcategoryId: string | null = null;
+        if (item.subcategory_id && String(item.subcategory_id).trim() !== '') {
+          const subcategory = await resolveSubcategory(String(item.subcategory_id).trim(), categoryId);
+          if (subcategory) {
+            subcategoryId = subcategory.id;
+            categoryId = categoryId || subcategory.categoryId;
+          }
+        }
+
+        let applicationId: string | null = null;
+        if (item.application_id && String(item.application_id).trim() !== '') {
+          const application = await resolveApplication(String(item.application_id).trim(), subcategoryId);
+          if (application) {
+            applicationId = application.id;
+            if (!subcategoryId) {
+              subcategoryId = application.subcategoryId;
+              categoryId = application.categoryId || categoryId;
+            }
+          }
+        }
+
+        const part = await prisma.part.create({
+          data: {
+            masterPartId,
+            partNo: partNoStr,
+            brandId,
+            description: item.description ? String(item.description).trim() : null,
+            categoryId,
+            subcategoryId,
+            applicationId,
+            hsCode: item.hs_code ? String(item.hs_code).trim() : null,
+            weight: item.weight ? parseFloat(String(item.weight)) : null,
+            reorderLevel: item.reorder_level ? parseInt(String(item.reorder_level)) : 0,
+            uom: item.uom ? String(item.uom).trim() : 'pcs',
+            cost: parseNumber(item.cost),
+            priceA: parseNumber(item.price_a),
+            priceB: parseNumber(item.price_b),
+            priceM: parseNumber(item.price_m),
+            smc: item.smc ? String(item.smc).trim() : null,
+            size: item.size ? String(item.size).trim() : null,
+            status: parseStatus(item.status),
+            models: item.models && Array.isArray(item.models) && item.models.length > 0
+              ? {
+                  create: item.models
+                    .filter((m: any) => m && m.name && String(m.name).trim() !== '')
+                    .map((m: any) => ({
+                      name: String(m.name).trim(),
+                      qtyUsed: m.qty_used || m.qtyUsed || 1,
+                    })),
+                }
+              : undefined,
+          },
+        });
+
+        results.push({ index, part_no: part.partNo, status: 'created', id: part.id });
+      } catch (error: any) {
+        let message = error.message || 'Internal server error';
+        if (error.code === 'P2002') {
+          const field = error.meta?.target?.[0] || 'field';
+          message = `A part with this ${field} already exists`;
+        } else if (error.code === 'P2003') {
+          message = 'Invalid reference to related record';
+        }
+        results.push({ index, part_no: partNoStr, status: 'error', error: message });
+      }
+    }
+
+    const createdCount = results.filter((r) => r.status === 'created').length;
+
+    res.json({
+      message: `Created ${createdCount} of ${parts.length} parts`,
+      created_count: createdCount,
+      error_count: parts.length - createdCount,
+      results,
+    });
+  } catch (error: any) {
+    console.error('Error bulk creating parts:', error);
+    res.status(500).json({ error: error.message });
+  }
+});
+
 // Get price update history - MUST BE BEFORE /:id routes
 router.get('/price-history', async (req: Request, res: Response) => {
   try {
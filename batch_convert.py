@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Batch conversion of several catalogue PDFs on one shared worker pool.
+
+Suppliers send several catalogues at once. Every file's pages are split
+into chunks (as iter_pdf_rows does for one file) and all chunks go onto a
+single process pool, largest file first, so the smaller files fill the
+workers as the largest one drains and the batch takes about as long as
+its largest file instead of the sum of all files. Chunks are collected in
+submission order with at most two per worker in flight, so each file's
+rows still come out in page order and memory stays bounded. With --merge
+a file's rows are spilled to a temporary file until the whole file has
+succeeded, and only then copied into the merged output.
+
+Each PDF gets its own output (named after the PDF, in the format of
+--output's extension), or with --merge all rows go into one table with a
+leading "source file" column. A file that can't be opened or fails while
+being extracted is reported and its partial output dropped; the other
+files are converted as usual.
+
+    python convert_pdf_to_excel.py --source "catalogues/*.pdf" --workers 8
+    python ctc_items.py extract catalogues/ --workers 8 --merge -o all_catalogues.xlsx
+"""
+
+import glob
+import pickle
+import tempfile
+from collections import deque
+from pathlib import Path
+
+from convert_pdf_to_excel import (
+    REQUIRED_COLUMNS, NUMERIC_COLUMNS, MEANINGFUL_COLUMNS, FRAME_BATCH_SIZE,
+    count_pages, load_template, open_cache, _extract_page_range, _page_ranges,
+)
+from pdf_page_cache import file_hash
+from instrumentation import METRICS
+from page_lifecycle import open_lifecycle
+from row_sinks import open_row_writer
+
+# Leading column of a merged output, naming the PDF each row came from
+SOURCE_COLUMN = 'source file'
+
+def is_batch_source(spec):
+    """True for a directory or a glob pattern, as opposed to a single PDF."""
+    return Path(spec).is_dir() or glob.has_magic(str(spec))
+
+def resolve_sources(spec):
+    """The PDFs in a directory or matching a glob pattern, sorted by path."""
+    if Path(spec).is_dir():
+        paths = Path(spec).iterdir()
+    else:
+        paths = map(Path, glob.glob(str(spec)))
+    return sorted(path for path in paths if path.is_file() and path.suffix.lower() == '.pdf')
+
+class BatchJob:
+    """One PDF of a batch: its page count, output and outcome."""
+
+    def __init__(self, path):
+        self.path = path
+        self.name = path.name
+        self.pages = 0
+        self.chunks_left = 0
+        self.pdf_hash = None
+        self.output = None
+        self.writer = None
+        self.spill = None  # with --merge, temporary file of the cleaned frames until the whole file succeeded
+        self.rejects = []
+        self.rows = 0
+        self.error = None
+
+def iter_batch_chunks(jobs, workers, cache=None, template=None, lifecycle=None):
+    """Extract the pages of every job on one process pool; yield (job, page_results) per chunk.
+
+    Chunks are submitted job by job in the given order and yielded in that
+    order. When a chunk fails its job gets an error, (job, None) is yielded
+    once and the job's remaining chunks are skipped.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = deque()
+    for job in jobs:
+        # Hashed once here for the cache, not by every chunk's worker
+        job.pdf_hash = file_hash(job.path) if cache else None
+        ranges = _page_ranges(job.pages, workers)
+        job.chunks_left = len(ranges)
+        chunks.extend((job, first, last) for first, last in ranges)
+    cache_spec = cache.spec() if cache else None
+
+    def fail(job, error):
+        job.error = str(error)[:200] or type(error).__name__
+        return job, None
+
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while chunks or pending:
+            while chunks and len(pending) < workers * 2:
+                job, first, last = chunks.popleft()
+                if job.error:
+                    continue
+                try:
+                    pending.append((job, executor.submit(
+                        _extract_page_range, str(job.path), first, last, cache_spec, template, lifecycle, job.pdf_hash,
+                    )))
+                except Exception as e:
+                    # e.g. a worker crashed and broke the pool
+                    yield fail(job, e)
+            if not pending:
+                continue
+
+            job, future = pending.popleft()
+            try:
+                page_results, (hits, misses), metrics = future.result()
+            except Exception as e:
+                if not job.error:
+                    yield fail(job, e)
+                continue
+            if job.error:
+                continue
+            METRICS.merge(metrics)
+            if cache:
+                cache.hits += hits
+                cache.misses += misses
+            job.chunks_left -= 1
+            yield job, page_results
+
+def _add_chunk(job, page_results, merged):
+    """Normalize a chunk's rows into the job's output (or its spill file with --merge)."""
+    from frame_normalizer import iter_normalized_frames
+
+    rows = [row for page_num, page_rows, headers in page_results for row in page_rows]
+    job.rows += len(rows)
+    frames = iter_normalized_frames(
+        rows, REQUIRED_COLUMNS, NUMERIC_COLUMNS, MEANINGFUL_COLUMNS,
+        batch_size=FRAME_BATCH_SIZE, rejects=job.rejects,
+    )
+    for frame in frames:
+        if merged is not None:
+            if job.spill is None:
+                job.spill = tempfile.TemporaryFile(prefix='batch_convert_')
+            pickle.dump(frame, job.spill, pickle.HIGHEST_PROTOCOL)
+            continue
+        if job.writer is None:
+            job.writer = open_row_writer(job.output, REQUIRED_COLUMNS, NUMERIC_COLUMNS)
+        job.writer.write_frame(frame)
+
+def _iter_spilled(job):
+    """Read back the frames _add_chunk spilled for a job, then drop its spill file."""
+    if job.spill is None:
+        return
+    job.spill.seek(0)
+    try:
+        while True:
+            try:
+                yield pickle.load(job.spill)
+            except EOFError:
+                break
+    finally:
+        _drop_spill(job)
+
+def _drop_spill(job):
+    if job.spill is not None:
+        job.spill.close()
+        job.spill = None
+
+def _finish_job(job, merged, merged_rejects):
+    """Save a completed job's output; returns the number of rows written."""
+    from frame_normalizer import save_rejects
+
+    if merged is not None:
+        written = 0
+        for frame in _iter_spilled(job):
+            merged.write_frame(frame.assign(**{SOURCE_COLUMN: job.name}))
+            written += len(frame)
+        merged_rejects.extend(frame.assign(**{SOURCE_COLUMN: job.name}) for frame in job.rejects)
+    else:
+        written = job.writer.count if job.writer else 0
+        if written:
+            job.writer.save()
+            rejects_path = job.output.with_name(f"{job.output.stem}_rejects.csv")
+            if save_rejects(job.rejects, rejects_path):
+                print(f"  ⚠️  {job.name}: some values could not be parsed as numbers, see {rejects_path}")
+    if not written:
+        job.error = "no data extracted"
+    return written
+
+def convert_batch(args, spec):
+    """Convert every PDF of a directory or glob as selected by the command-line args.
+
+    Returns True if every file was converted.
+    """
+    if args.pages or args.shard:
+        print("❌ --pages and --shard take a single PDF, not a batch")
+        return False
+    sources = resolve_sources(spec)
+    if not sources:
+        print(f"❌ No PDF files found for: {spec}")
+        return False
+
+    print("=" * 60)
+    print("Batch PDF to Excel Converter")
+    print("=" * 60)
+    print()
+
+    jobs = [BatchJob(path) for path in sources]
+    for job in jobs:
+        try:
+            job.pages = count_pages(job.path)
+            if not job.pages:
+                job.error = "no pages"
+        except Exception as e:
+            job.error = f"can't open: {str(e)[:200] or type(e).__name__}"
+        if args.merge:
+            job.output = args.output
+        else:
+            output_dir = Path(args.output_dir) if args.output_dir else job.path.parent
+            job.output = output_dir / f"{job.path.stem}{args.output.suffix}"
+
+    runnable = sorted((job for job in jobs if not job.error), key=lambda job: (-job.pages, job.name))
+    outputs = [job.output for job in runnable]
+    if not args.merge and len(set(outputs)) < len(outputs):
+        print("❌ Several PDFs share a file name; convert them with --merge or in separate batches")
+        return False
+    if not args.merge and args.output_dir:
+        Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+
+    workers = max(1, args.workers)
+    total_pages = sum(job.pages for job in runnable)
+    print(f"📚 {len(sources)} PDFs, {total_pages} pages ({workers} workers), largest first:")
+    for job in runnable:
+        print(f"   {job.name}: {job.pages} pages")
+    for job in jobs:
+        if job.error:
+            print(f"   ❌ {job.name}: {job.error}")
+
+    # One template for the whole batch, learned from the largest file if missing
+    template = None
+    if args.template and runnable:
+        template = load_template(runnable[0].path, args.template, args.template_pages)
+    cache = open_cache(args, template)
+
+    merged = None
+    merged_rejects = []
+    if args.merge:
+        merged = open_row_writer(args.output, [SOURCE_COLUMN] + REQUIRED_COLUMNS, NUMERIC_COLUMNS)
+
+    print()
+    try:
+        for job, page_results in iter_batch_chunks(runnable, workers, cache, template, open_lifecycle(args)):
+            if page_results is not None:
+                try:
+                    _add_chunk(job, page_results, merged)
+                    print(f"  {job.name}: pages {page_results[0][0]}-{page_results[-1][0]}/{job.pages}")
+                    if not job.chunks_left:
+                        written = _finish_job(job, merged, merged_rejects)
+                        if written:
+                            print(f"  ✅ {job.name}: {written} rows" + ('' if merged else f" -> {job.output}"))
+                except Exception as e:
+                    job.error = str(e)[:200] or type(e).__name__
+            if job.error:
+                print(f"  ❌ {job.name}: {job.error}")
+                if job.writer:
+                    job.writer.discard()
+                    job.writer = None
+                _drop_spill(job)
+    finally:
+        if cache:
+            print(f"   Page cache: {cache.hits} hits, {cache.misses} misses")
+            cache.close()
+
+    failed = [job for job in jobs if job.error]
+    converted = len(jobs) - len(failed)
+    if merged is not None:
+        if merged.count:
+            merged.save()
+            print(f"\n✅ Merged {merged.count} rows from {converted} PDFs into {args.output}")
+            if merged_rejects:
+                from frame_normalizer import save_rejects
+
+                rejects_path = args.output.with_name(f"{args.output.stem}_rejects.csv")
+                rejected = save_rejects(merged_rejects, rejects_path)
+                print(f"⚠️  {rejected} values could not be parsed as numbers, see {rejects_path}")
+        else:
+            merged.discard()
+
+    print()
+    print("=" * 60)
+    print(f"{'✅' if not failed else '⚠️ '} Converted {converted} of {len(jobs)} PDFs")
+    for job in failed:
+        print(f"   ❌ {job.name}: {job.error}")
+    print("=" * 60)
+    return not failed
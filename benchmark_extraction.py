@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Benchmark the PDF extraction paths on synthetic catalogues.
+
+Generates CTC-style catalogues (see synthetic_catalogue.py) at several sizes
+and layouts and runs each code path on them in a fresh process, reporting
+pages/sec, rows/sec, peak RSS and per-stage timings:
+
+    convert           convert_pdf_to_excel: table detection -> frames -> xlsx
+    convert-template  the same with a layout template instead of detection
+    import            import_items_from_pdf: extract_pdf_data -> normalize_data
+                      -> type_rows -> save_to_excel
+
+It also times the startup of the ctc_items.py CLI (`--help` of the tool and
+of each subcommand, median of several runs), which must stay free of the
+heavy imports. Results are written to a JSON file; pass an earlier file
+with --compare to flag regressions:
+
+    python benchmark_extraction.py --sizes 10,100 --output after.json --compare before.json
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from datetime import datetime, timezone
+from contextlib import redirect_stdout
+
+from synthetic_catalogue import LAYOUTS, write_catalogue
+
+PATHS = ['convert', 'convert-template', 'import']
+DEFAULT_SIZES = [10, 100, 1000]
+DEFAULT_OUTPUT = "benchmark_results.json"
+CLI_COMMANDS = ['extract', 'normalize', 'export', 'import', 'sync']
+STARTUP_RUNS = 5
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+class StageTimer:
+    """Collect wall-clock seconds per named stage."""
+
+    def __init__(self):
+        self.stages = {}
+
+    def run(self, name, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.stages[name] = round(self.stages.get(name, 0) + time.perf_counter() - start, 4)
+        return result
+
+def _run_convert(pdf_path, out_dir, timer, workers=1, template=None):
+    from convert_pdf_to_excel import REQUIRED_COLUMNS, NUMERIC_COLUMNS, MEANINGFUL_COLUMNS, iter_pdf_rows
+    from frame_normalizer import iter_normalized_frames
+    from row_sinks import open_row_writer
+
+    rows = timer.run('extract', list, iter_pdf_rows(pdf_path, workers, REQUIRED_COLUMNS, template=template))
+    frames = timer.run('normalize', list, iter_normalized_frames(
+        rows, REQUIRED_COLUMNS, NUMERIC_COLUMNS, MEANINGFUL_COLUMNS,
+    ))
+
+    def write():
+        writer = open_row_writer(Path(out_dir) / "convert.xlsx", REQUIRED_COLUMNS, NUMERIC_COLUMNS)
+        for frame in frames:
+            writer.write_frame(frame)
+        writer.save()
+        return writer.count
+
+    return timer.run('write', write)
+
+def _run_import(pdf_path, out_dir, timer):
+    from import_items_from_pdf import extract_pdf_data, normalize_data, type_rows, save_to_excel
+
+    data = timer.run('extract', extract_pdf_data, pdf_path)
+    items = timer.run('normalize', normalize_data, data)
+    items = timer.run('type', list, type_rows(items))
+    timer.run('write', save_to_excel, items, Path(out_dir) / "import.xlsx")
+    return len(items)
+
+def run_case(case):
+    """Run one benchmark case in this process; returns its result dict."""
+    timer = StageTimer()
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as out_dir, redirect_stdout(io.StringIO()):
+        if case['path'] == 'import':
+            rows = _run_import(case['pdf'], out_dir, timer)
+        else:
+            template = None
+            if case['path'] == 'convert-template':
+                from layout_template import LayoutTemplate
+                template = timer.run('load_template', LayoutTemplate.load, case['template'])
+            rows = _run_convert(case['pdf'], out_dir, timer, case.get('workers', 1), template)
+    seconds = time.perf_counter() - start
+
+    return {
+        'path': case['path'],
+        'layout': case['layout'],
+        'pages': case['pages'],
+        'workers': case.get('workers', 1),
+        'rows': rows,
+        'expected_rows': case['expected_rows'],
+        'seconds': round(seconds, 4),
+        'pages_per_sec': round(case['pages'] / seconds, 2),
+        'rows_per_sec': round(rows / seconds, 2),
+        'peak_rss_mb': peak_rss_mb(),
+        'stages': timer.stages,
+    }
+
+def run_case_subprocess(case):
+    """Run a case in a fresh interpreter so peak RSS is measured per case."""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--run-case', json.dumps(case)],
+        capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        return dict(case, error=completed.stderr.strip().splitlines()[-1:] or ['failed'])
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def learn_benchmark_template(work_dir, pages):
+    """Learn a layout template from a small ruled catalogue.
+
+    Every synthetic layout shares the same column positions, so this one
+    template file also serves the unruled pages, where learning (and table
+    detection) has no lines to work from.
+    """
+    from convert_pdf_to_excel import load_template
+
+    pdf_path = Path(work_dir) / "template_sample.pdf"
+    write_catalogue(pdf_path, min(pages, 3), 'ruled')
+    template_path = Path(work_dir) / "layout_template.json"
+    with redirect_stdout(io.StringIO()):
+        load_template(pdf_path, template_path)
+    return str(template_path)
+
+def measure_startup(runs=STARTUP_RUNS):
+    """Median wall-clock seconds of `ctc_items.py [COMMAND] --help` in a fresh interpreter."""
+    cli = str(Path(__file__).with_name('ctc_items.py'))
+    startup = {}
+    for command in [None] + CLI_COMMANDS:
+        argv = [sys.executable, cli] + ([command] if command else []) + ['--help']
+        durations = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run(argv, capture_output=True, check=True)
+            durations.append(time.perf_counter() - start)
+        startup[command or '--help'] = round(sorted(durations)[len(durations) // 2], 4)
+    return startup
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare_results(results, startup, baseline_path, threshold):
+    """Print pages/sec and startup times against a baseline file; returns the number of regressions."""
+    baseline = json.loads(Path(baseline_path).read_text(encoding='utf-8'))
+
+    def key(result):
+        return result['path'], result['layout'], result['pages'], result.get('workers', 1)
+
+    previous = {key(result): result for result in baseline.get('results', []) if 'error' not in result}
+    regressions = 0
+    print(f"\n📈 Compared with {baseline_path} (commit {baseline.get('git_commit') or 'unknown'}):")
+    for result in results:
+        old = previous.get(key(result))
+        if old is None or 'error' in result:
+            continue
+        change = result['pages_per_sec'] / old['pages_per_sec'] - 1
+        flag = ''
+        if change < -threshold:
+            flag = '  ⚠️  regression'
+            regressions += 1
+        print(f"   {result['path']:<17} {result['layout']:<8} {result['pages']:>5} pages: "
+              f"{old['pages_per_sec']:>8.2f} -> {result['pages_per_sec']:>8.2f} pages/s ({change:+.1%}){flag}")
+    for command, seconds in startup.items():
+        old = baseline.get('startup', {}).get(command)
+        if old is None:
+            continue
+        change = seconds / old - 1
+        flag = ''
+        if change > threshold:
+            flag = '  ⚠️  regression'
+            regressions += 1
+        print(f"   startup {command:<12} {old * 1000:>8.1f} -> {seconds * 1000:>8.1f} ms ({change:+.1%}){flag}")
+    return regressions
+
+def parse_list(value):
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark PDF extraction on synthetic catalogues")
+    parser.add_argument(
+        '--sizes', default=','.join(map(str, DEFAULT_SIZES)), metavar='N,N',
+        help="catalogue sizes in pages (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--layouts', default=','.join(LAYOUTS), metavar='L,L',
+        help="catalogue layouts (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--paths', default=','.join(PATHS), metavar='P,P',
+        help="code paths to run (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--workers', type=int, default=1, metavar='N',
+        help="also run the convert path with N extraction processes (default: 1, serial only)"
+    )
+    parser.add_argument(
+        '-o', '--output', default=DEFAULT_OUTPUT, metavar='PATH',
+        help="JSON results file (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--compare', metavar='PATH',
+        help="earlier results file to compare against; exits 1 on regressions"
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=0.10, metavar='F',
+        help="with --compare, flag paths slower by more than this fraction (default: 0.10)"
+    )
+    parser.add_argument(
+        '--no-startup', action='store_true',
+        help="skip timing the ctc_items.py CLI startup"
+    )
+    parser.add_argument('--run-case', help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args()
+    if args.run_case:
+        print(json.dumps(run_case(json.loads(args.run_case))))
+        return
+
+    sizes = [int(size) for size in parse_list(args.sizes)]
+    layouts = parse_list(args.layouts)
+    paths = parse_list(args.paths)
+    for name, values, known in (('layout', layouts, LAYOUTS), ('path', paths, PATHS)):
+        unknown = [value for value in values if value not in known]
+        if unknown:
+            sys.exit(f"❌ Unknown {name}: {', '.join(unknown)} (use: {', '.join(known)})")
+
+    print("=" * 60)
+    print("PDF Extraction Benchmark")
+    print("=" * 60)
+
+    startup = {}
+    if not args.no_startup:
+        startup = measure_startup()
+        timings = ', '.join(f"{command} {seconds * 1000:.0f} ms" for command, seconds in startup.items())
+        print(f"\n🚀 CLI startup (median of {STARTUP_RUNS} runs): {timings}")
+
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        template_path = learn_benchmark_template(work_dir, min(sizes))
+        for pages in sizes:
+            for layout in layouts:
+                pdf_path = Path(work_dir) / f"catalogue_{layout}_{pages}.pdf"
+                expected_rows = write_catalogue(pdf_path, pages, layout)
+                print(f"\n📄 {pages} pages, {layout} ({expected_rows} rows)")
+
+                cases = [{'path': path} for path in paths]
+                if args.workers > 1 and 'convert' in paths:
+                    cases.append({'path': 'convert', 'workers': args.workers})
+                for case in cases:
+                    case.update(pdf=str(pdf_path), layout=layout, pages=pages,
+                                expected_rows=expected_rows, template=template_path)
+                    result = run_case_subprocess(case)
+                    results.append(result)
+                    label = case['path'] + (f" x{case['workers']}" if case.get('workers') else '')
+                    if 'error' in result:
+                        print(f"   ❌ {label:<20} {result['error'][0]}")
+                        continue
+                    stages = ', '.join(f"{name} {seconds:.2f}s" for name, seconds in result['stages'].items())
+                    print(f"   {label:<20} {result['pages_per_sec']:>8.2f} pages/s {result['rows_per_sec']:>9.1f} rows/s "
+                          f"{result['rows']:>6}/{expected_rows} rows  peak {result['peak_rss_mb']} MB  ({stages})")
+
+    report = {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'startup': startup,
+        'results': results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding='utf-8')
+    print(f"\n✅ Results saved to {args.output}")
+
+    if args.compare and compare_results(results, startup, args.compare, args.threshold):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
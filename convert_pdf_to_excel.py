@@ -5,280 +5,706 @@ Extracts: part no., ss part no, origin, decc, application grade, main, sub, size
 """
 
 import sys
-import pandas as pd
+import argparse
+from collections import deque
 from pathlib import Path
 
-try:
-    import pdfplumber
-except ImportError:
-    print("Installing required packages: pdfplumber, openpyxl, pandas...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "pdfplumber", "openpyxl", "pandas"])
-    import pdfplumber
+# pdfplumber and pandas (frame_normalizer) are imported where they are
+# used, so importing this module - e.g. for the CLI's --help - stays cheap
+from header_resolver import HeaderResolver, clean_header
+from layout_template import LayoutTemplate, learn_template
+from instrumentation import METRICS, add_instrumentation_args, instrumented
+from page_lifecycle import add_memory_args, open_lifecycle
+from row_records import record_type, make_row
+from row_sinks import SINKS, open_row_writer
+from pdf_page_cache import PageCache, file_hash, page_digest, DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES
+
+# pdfplumber table-finder settings (empty = library defaults); part of the page cache key
+TABLE_SETTINGS = {}
+
+# Required columns in order
+REQUIRED_COLUMNS = [
+    'part no.',
+    'ss part no',
+    'origin',
+    'decc',
+    'application grade',
+    'main',
+    'sub',
+    'size',
+    'brand',
+    'remarks',
+    'loc',
+    'cost',
+    'mkt',
+    'price a',
+    'price b',
+    'model',
+    'qty'
+]
+
+# Low-cardinality columns whose values are interned, so rows share one
+# string object per distinct brand, origin, grade, ...
+INTERNED_COLUMNS = {'origin', 'application grade', 'main', 'sub', 'size', 'brand', 'loc', 'model'}
+
+# Columns parsed to numbers ("2,000" -> 2000.0) by the normalization stage
+NUMERIC_COLUMNS = ['cost', 'mkt', 'price a', 'price b', 'qty']
+
+# Rows need a value in at least one of these to count as data
+MEANINGFUL_COLUMNS = REQUIRED_COLUMNS[:10]
+
+# Default catalogue and output file; the output's extension selects the format
+DEFAULT_PDF = "CTC Item Lists.pdf"
+DEFAULT_OUTPUT = "CTC Item Lists.xlsx"
+
+# Rows per DataFrame batch in the normalization stage
+FRAME_BATCH_SIZE = 1000
+
+# Header spellings seen in the catalogues, per required column
+COLUMN_ALIASES = {
+    'part no.': ['part no', 'part no.', 'part number', 'part#', 'part #'],
+    'ss part no': ['ss part no', 'ss part no.', 'ss part number'],
+    'origin': ['origin'],
+    'decc': ['decc', 'desc', 'description'],
+    'application grade': ['application grade', 'app grade', 'grade'],
+    'main': ['main'],
+    'sub': ['sub', 'subcategory'],
+    'size': ['size'],
+    'brand': ['brand', 'brand name'],
+    'remarks': ['remarks', 'remark'],
+    'loc': ['loc', 'location'],
+    'cost': ['cost'],
+    'mkt': ['mkt', 'market'],
+    'price a': ['price a', 'pricea', 'price_a'],
+    'price b': ['price b', 'priceb', 'price_b'],
+    'model': ['model'],
+    'qty': ['qty', 'quantity'],
+}
+
+COLUMN_RESOLVER = HeaderResolver(COLUMN_ALIASES)
 
 def normalize_header(header):
     """Normalize header names to match required columns."""
-    if not header:
-        return None
-    
-    header_lower = str(header).lower().strip()
-    
-    # Map various header formats to standard names
-    mappings = {
-        'part no': 'part no.',
-        'part no.': 'part no.',
-        'part number': 'part no.',
-        'part#': 'part no.',
-        'part #': 'part no.',
-        'ss part no': 'ss part no',
-        'ss part no.': 'ss part no',
-        'ss part number': 'ss part no',
-        'origin': 'origin',
-        'decc': 'decc',
-        'desc': 'decc',
-        'description': 'decc',
-        'application grade': 'application grade',
-        'app grade': 'application grade',
-        'grade': 'application grade',
-        'main': 'main',
-        'sub': 'sub',
-        'subcategory': 'sub',
-        'size': 'size',
-        'brand': 'brand',
-        'brand name': 'brand',
-        'remarks': 'remarks',
-        'remark': 'remarks',
-        'loc': 'loc',
-        'location': 'loc',
-        'cost': 'cost',
-        'mkt': 'mkt',
-        'market': 'mkt',
-        'price a': 'price a',
-        'pricea': 'price a',
-        'price_a': 'price a',
-        'price b': 'price b',
-        'priceb': 'price b',
-        'price_b': 'price b',
-        'model': 'model',
-        'qty': 'qty',
-        'quantity': 'qty',
-    }
-    
-    for key, value in mappings.items():
-        if key in header_lower:
-            return value
+    return COLUMN_RESOLVER.resolve(header)
+
+def _open_pdf(pdf_path, pages=None):
+    import pdfplumber
     
+    with METRICS.timer('open'):
+        return pdfplumber.open(pdf_path, pages=pages)
+
+def iter_pages(pdf_path, first_page=1, last_page=None, lifecycle=None):
+    """Yield (page_num, page) for pages first_page..last_page (1-based, inclusive).
+
+    Each page's cached objects are released once the caller moves on to
+    the next page. With a PageLifecycle the document itself is closed and
+    reopened every K pages or above the RSS ceiling, dropping the parser's
+    document-level caches too.
+    """
+    pdf = _open_pdf(pdf_path)
+    try:
+        total_pages = len(pdf.pages)
+        last_page = total_pages if last_page is None else min(last_page, total_pages)
+        opened_at = 1  # page number of pdf.pages[0]
+        pages_since_open = 0
+        for page_num in range(first_page, last_page + 1):
+            if lifecycle and lifecycle.should_reopen(pages_since_open):
+                pdf.close()
+                lifecycle.flush()
+                # Only the remaining pages, or pdf.pages builds every Page again
+                pdf = _open_pdf(pdf_path, pages=range(page_num, last_page + 1))
+                opened_at = page_num
+                pages_since_open = 0
+            
+            page = pdf.pages[page_num - opened_at]
+            yield page_num, page
+            page.close()
+            pages_since_open += 1
+    finally:
+        pdf.close()
+
+def count_pages(pdf_path):
+    """Return the number of pages in the PDF."""
+    with _open_pdf(pdf_path) as pdf:
+        return len(pdf.pages)
+
+def is_header_row(row):
+    """Check if a table row contains header keywords."""
+    if not row:
+        return False
+    row_text = ' '.join([str(cell).lower() if cell else '' for cell in row])
+    return any(keyword in row_text for keyword in ['part no', 'origin', 'brand', 'cost', 'price'])
+
+def is_repeated_header(row, header):
+    """Check if a row repeats the header, in any spelling of its column names.
+
+    No cell may name another column than the header cell above it, and at
+    least half of the header's cells must be matched; cells that name no
+    column (e.g. header words run together) are tolerated.
+    """
+    matched = 0
+    for cell, header_cell in zip(row, header):
+        if not cell:
+            continue
+        if clean_header(cell) == clean_header(header_cell or ''):
+            matched += 1
+            continue
+        column = normalize_header(cell)
+        if column is not None:
+            if column != normalize_header(header_cell):
+                return False
+            matched += 1
+    return matched * 2 >= len([cell for cell in header if cell])
+
+def find_header_row(table):
+    """Return the index of the table's header row (by keyword), or None."""
+    # Find header row (usually first row with column names)
+    for idx, row in enumerate(table[:5]):  # Check first 5 rows
+        if is_header_row(row):
+            return idx
     return None
 
-def extract_pdf_to_excel(pdf_path, excel_path):
-    """Extract all data from PDF and save to Excel with required columns."""
-    print(f"📄 Extracting data from PDF: {pdf_path}")
-    
-    # Required columns in order
-    required_columns = [
-        'part no.',
-        'ss part no',
-        'origin',
-        'decc',
-        'application grade',
-        'main',
-        'sub',
-        'size',
-        'brand',
-        'remarks',
-        'loc',
-        'cost',
-        'mkt',
-        'price a',
-        'price b',
-        'model',
-        'qty'
-    ]
+def iter_table_rows(table, required_columns=REQUIRED_COLUMNS):
+    """Yield rows (CatalogueRow records) from one extracted table, mapped through its header row."""
+    if not table or len(table) < 2:
+        return
     
-    all_rows = []
+    with METRICS.timer('header_detection'):
+        # If no header found, use first row
+        header_row_idx = find_header_row(table) or 0
+        header_row = table[header_row_idx]
+        
+        # Resolve the header row once into a plan of
+        # (table column, record position, interned?)
+        row_type = record_type(required_columns, INTERNED_COLUMNS)
+        column_plan = [
+            (col_idx, row_type.position(col_name), col_name in INTERNED_COLUMNS)
+            for col_idx, col_name in COLUMN_RESOLVER.column_plan(header_row or [])
+            if col_name in required_columns
+        ]
     
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-            print(f"✅ PDF loaded: {total_pages} pages")
+    if header_row:
+        
+        # Process data rows
+        for row_idx in range(header_row_idx + 1, len(table)):
+            row = table[row_idx]
+            if not row or all(not cell or str(cell).strip() == '' for cell in row):
+                continue
             
-            for page_num, page in enumerate(pdf.pages, 1):
-                if page_num % 10 == 0:
-                    print(f"  Processing page {page_num}/{total_pages}...")
-                
-                # Try to extract tables first (most accurate)
-                tables = page.extract_tables()
-                
-                if tables:
-                    for table in tables:
-                        if not table or len(table) < 2:
-                            continue
-                        
-                        # Process headers
-                        header_row = None
-                        header_row_idx = 0
-                        
-                        # Find header row (usually first row with column names)
-                        for idx, row in enumerate(table[:5]):  # Check first 5 rows
-                            if not row:
-                                continue
-                            
-                            row_text = ' '.join([str(cell).lower() if cell else '' for cell in row])
-                            
-                            # Check if this row contains header keywords
-                            if any(keyword in row_text for keyword in ['part no', 'origin', 'brand', 'cost', 'price']):
-                                header_row = row
-                                header_row_idx = idx
-                                break
-                        
-                        # If no header found, use first row
-                        if header_row is None and table:
-                            header_row = table[0]
-                            header_row_idx = 0
-                        
-                        # Normalize headers
-                        if header_row:
-                            column_mapping = {}
-                            for col_idx, header_cell in enumerate(header_row):
-                                normalized = normalize_header(header_cell)
-                                if normalized:
-                                    column_mapping[col_idx] = normalized
-                            
-                            # Process data rows
-                            for row_idx in range(header_row_idx + 1, len(table)):
-                                row = table[row_idx]
-                                if not row or all(not cell or str(cell).strip() == '' for cell in row):
-                                    continue
-                                
-                                # Create row data
-                                row_data = {col: '' for col in required_columns}
-                                
-                                for col_idx, cell_value in enumerate(row):
-                                    if col_idx in column_mapping:
-                                        col_name = column_mapping[col_idx]
-                                        if col_name in required_columns:
-                                            value = str(cell_value).strip() if cell_value else ''
-                                            row_data[col_name] = value
-                                
-                                # Check if row has any meaningful data
-                                if any(row_data[col] for col in required_columns[:10]):  # At least one of first 10 columns
-                                    all_rows.append(row_data)
+            # Create row data; stripping and the meaningful-data check are
+            # done column-wise by the normalization stage
+            values = [''] * len(required_columns)
+            
+            for col_idx, position, interned in column_plan:
+                if col_idx < len(row):
+                    cell_value = row[col_idx]
+                    if cell_value:
+                        values[position] = sys.intern(str(cell_value).strip()) if interned else str(cell_value)
+            
+            yield row_type(values)
+
+def table_header_mapping(table):
+    """{header cell: required column} of the header row iter_table_rows maps a table through."""
+    if not table or len(table) < 2:
+        return {}
+    header_row = table[find_header_row(table) or 0] or []
+    return {str(header_row[col_idx]).strip(): col_name for col_idx, col_name in COLUMN_RESOLVER.column_plan(header_row)}
+
+def page_headers(tables):
+    """Header mappings of a page's tables, or None for a page read through the text fallback."""
+    return [table_header_mapping(table) for table in tables] if tables else None
+
+def iter_text_rows(text, required_columns=REQUIRED_COLUMNS):
+    """Fallback for pages without tables: parse rows from the page text."""
+    if text:
+        lines = text.split('\n')
+        # Try to parse structured text
+        # This is a fallback method
+        current_row = {col: '' for col in required_columns}
+        
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            
+            # Look for patterns like "Part No: XXX" or column:value pairs
+            parts = line.split(':')
+            if len(parts) == 2:
+                key = normalize_header(parts[0].strip())
+                value = parts[1].strip()
+                if key and key in required_columns:
+                    current_row[key] = value
+            
+            # If line looks like a data row (has multiple values separated by spaces/tabs)
+            elif '\t' in line or '  ' in line:
+                values = line.split('\t') if '\t' in line else line.split('  ')
+                values = [v.strip() for v in values if v.strip()]
                 
-                # If no tables found, try text extraction with pattern matching
-                if not tables:
-                    text = page.extract_text()
-                    if text:
-                        lines = text.split('\n')
-                        # Try to parse structured text
-                        # This is a fallback method
+                # Try to match with known column positions
+                if len(values) >= 3:
+                    # Heuristic: first value is usually part no
+                    if not current_row['part no.']:
+                        current_row['part no.'] = values[0]
+                    
+                    # Try to identify other columns based on position and content
+                    for idx, val in enumerate(values[1:], 1):
+                        # This is a simplified approach - may need adjustment
+                        if idx == 1 and not current_row['ss part no']:
+                            current_row['ss part no'] = val
+                        elif idx == 2 and not current_row['origin']:
+                            current_row['origin'] = val
+                        elif idx == 3 and not current_row['brand']:
+                            current_row['brand'] = val
+                    
+                    # If we have enough data, save row
+                    if current_row['part no.']:
+                        yield make_row(required_columns, current_row, INTERNED_COLUMNS)
                         current_row = {col: '' for col in required_columns}
-                        
-                        for line in lines:
-                            line = line.strip()
-                            if not line:
-                                continue
-                            
-                            # Look for patterns like "Part No: XXX" or column:value pairs
-                            parts = line.split(':')
-                            if len(parts) == 2:
-                                key = normalize_header(parts[0].strip())
-                                value = parts[1].strip()
-                                if key and key in required_columns:
-                                    current_row[key] = value
-                            
-                            # If line looks like a data row (has multiple values separated by spaces/tabs)
-                            elif '\t' in line or '  ' in line:
-                                values = line.split('\t') if '\t' in line else line.split('  ')
-                                values = [v.strip() for v in values if v.strip()]
-                                
-                                # Try to match with known column positions
-                                if len(values) >= 3:
-                                    # Heuristic: first value is usually part no
-                                    if not current_row['part no.']:
-                                        current_row['part no.'] = values[0]
-                                    
-                                    # Try to identify other columns based on position and content
-                                    for idx, val in enumerate(values[1:], 1):
-                                        # This is a simplified approach - may need adjustment
-                                        if idx == 1 and not current_row['ss part no']:
-                                            current_row['ss part no'] = val
-                                        elif idx == 2 and not current_row['origin']:
-                                            current_row['origin'] = val
-                                        elif idx == 3 and not current_row['brand']:
-                                            current_row['brand'] = val
-                                    
-                                    # If we have enough data, save row
-                                    if current_row['part no.']:
-                                        all_rows.append(current_row.copy())
-                                        current_row = {col: '' for col in required_columns}
+
+def extract_page_content(page, template=None):
+    """Run the expensive pdfplumber calls for one page.
+
+    Returns (tables, text); text is only extracted for pages without tables,
+    where it feeds the text fallback. With a LayoutTemplate the page's words
+    are bucketed into the template's columns instead of detecting tables.
+    """
+    if template is not None:
+        with METRICS.timer('layout_template', page.page_number):
+            # Drop header lines repeated in a different spelling than the template's
+            header, *rows = template.extract_table(page)
+            return [[header] + [row for row in rows if not is_repeated_header(row, header)]], None
     
-    except Exception as e:
-        print(f"❌ Error extracting PDF: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Try to extract tables first (most accurate)
+    with METRICS.timer('extract_tables', page.page_number):
+        tables = page.extract_tables(TABLE_SETTINGS or None)
+    text = None
+    if not tables:
+        with METRICS.timer('extract_text', page.page_number):
+            text = page.extract_text()
+    return tables, text
+
+def iter_page_contents(pdf_path, first_page=1, last_page=None, cache=None, template=None, lifecycle=None,
+                       pdf_hash=None):
+    """Yield (page_num, tables, text) for a page range, using the page cache if given.
+
+    When every page of an unchanged file is cached the PDF is not opened at
+    all. Otherwise each page is looked up by file/page number, then by its
+    content digest, and only extracted on a miss. Cached pages are yielded
+    as they are read, so memory does not grow with the page count. The
+    file's hash is computed here unless the caller already has it.
+    """
+    if cache is None:
+        for page_num, page in iter_pages(pdf_path, first_page, last_page, lifecycle):
+            with METRICS.timer('page', page_num):
+                content = extract_page_content(page, template)
+            yield (page_num, *content)
+        return
     
-    print(f"✅ Extracted {len(all_rows)} rows from PDF")
+    pdf_hash = pdf_hash or file_hash(pdf_path)
+    total_pages = cache.get_page_count(pdf_hash)
+    if total_pages is not None:
+        last = total_pages if last_page is None else min(last_page, total_pages)
+        while first_page <= last:
+            content = cache.get_page(pdf_hash, first_page)
+            if content is None:
+                break
+            yield (first_page, *content)
+            first_page += 1
+        else:
+            return
     
-    if not all_rows:
-        print("⚠️  No data extracted! Trying alternative extraction method...")
-        return False
+    # Open the PDF from the first page that isn't cached by page number
+    for page_num, page in iter_pages(pdf_path, first_page, last_page, lifecycle):
+        if total_pages is None:
+            total_pages = len(page.pdf.pages)
+            cache.set_page_count(pdf_hash, total_pages)
+        with METRICS.timer('page', page_num):
+            content = cache.get_page(pdf_hash, page_num)
+            if content is None:
+                digest = page_digest(page)
+                content = cache.get_content(digest)
+                if content is None:
+                    content = extract_page_content(page, template)
+                cache.put_page(pdf_hash, page_num, digest, *content)
+        yield (page_num, *content)
+
+def iter_content_rows(tables, text, required_columns=REQUIRED_COLUMNS):
+    """Yield rows from a page's extracted tables, or its text if it has none."""
+    for table in tables:
+        yield from iter_table_rows(table, required_columns)
     
-    # Create DataFrame with all required columns
-    df = pd.DataFrame(all_rows)
+    # If no tables found, try text extraction with pattern matching
+    if not tables:
+        METRICS.count('text_fallback_pages')
+        with METRICS.timer('text_fallback'):
+            rows = list(iter_text_rows(text, required_columns))
+        yield from rows
+
+def iter_page_rows(page, required_columns=REQUIRED_COLUMNS):
+    """Yield the rows of a single PDF page, with dict-style access by required column."""
+    yield from iter_content_rows(*extract_page_content(page), required_columns)
+
+def extract_page_rows(page, required_columns=REQUIRED_COLUMNS):
+    """Extract the rows of a single PDF page as a list."""
+    return list(iter_page_rows(page, required_columns))
+
+def _extract_page_range(pdf_path, first_page, last_page, cache_spec=None, template=None, lifecycle=None,
+                        pdf_hash=None):
+    """Worker: open the PDF and extract pages first_page..last_page (1-based, inclusive).
+
+    Returns ([(page_num, rows, header mappings), ...], cache hits/misses, metrics).
+    """
+    cache = PageCache(*cache_spec) if cache_spec else None
+    # Pool processes run several chunks; report only this chunk's metrics
+    METRICS.reset()
+    try:
+        page_results = [
+            (page_num, list(iter_content_rows(tables, text)), page_headers(tables))
+            for page_num, tables, text in iter_page_contents(
+                pdf_path, first_page, last_page, cache, template, lifecycle, pdf_hash,
+            )
+        ]
+        return page_results, (cache.hits, cache.misses) if cache else (0, 0), METRICS.snapshot()
+    finally:
+        if cache:
+            cache.close()
+
+def _page_ranges(total_pages, workers, first_page=1):
+    """Split first_page..total_pages into contiguous chunks, a few per worker to balance load."""
+    chunk_size = max(1, -(-(total_pages - first_page + 1) // (workers * 4)))
+    return [
+        (first, min(first + chunk_size - 1, total_pages))
+        for first in range(first_page, total_pages + 1, chunk_size)
+    ]
+
+def iter_pdf_pages(pdf_path, workers=1, required_columns=REQUIRED_COLUMNS, cache=None, template=None,
+                   lifecycle=None, first_page=1, last_page=None, pdf_hash=None):
+    """Yield (page_num, rows, header mappings) for pages first_page..last_page, in page order.
+
+    With workers > 1 the page range is split across a process pool; every
+    worker opens the PDF itself and the pages are yielded back in page
+    order, so the output is identical to the serial path. At most two
+    chunks per worker are in flight, so finished chunks don't pile up in
+    memory ahead of the consumer.
+
+    If a PageCache is given, cached page tables are reused and new ones are
+    stored (workers open their own connection to the same cache). A
+    LayoutTemplate replaces table detection on every page, and a
+    PageLifecycle bounds the memory held by the open document. The file is
+    hashed for the cache once, here (or by the caller, as pdf_hash), and
+    not again by every worker.
+    """
+    if cache is None:
+        total_pages = count_pages(pdf_path)
+    else:
+        pdf_hash = pdf_hash or file_hash(pdf_path)
+        total_pages = cache.get_page_count(pdf_hash) or count_pages(pdf_path)
+    last_page = total_pages if last_page is None else min(last_page, total_pages)
+    page_range = f"pages {first_page}-{last_page} of " if (first_page, last_page) != (1, total_pages) else ""
     
-    # Ensure all required columns exist
-    for col in required_columns:
-        if col not in df.columns:
-            df[col] = ''
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        print(f"✅ PDF loaded: {page_range}{total_pages} pages ({workers} workers)")
+        cache_spec = cache.spec() if cache else None
+        
+        ranges = deque(_page_ranges(last_page, workers, first_page))
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            while ranges or pending:
+                while ranges and len(pending) < workers * 2:
+                    first, last = ranges.popleft()
+                    pending.append(executor.submit(
+                        _extract_page_range, str(pdf_path), first, last, cache_spec, template, lifecycle, pdf_hash,
+                    ))
+                
+                # Collect in submission order so rows stay in page order
+                page_results, (hits, misses), metrics = pending.popleft().result()
+                METRICS.merge(metrics)
+                if cache:
+                    cache.hits += hits
+                    cache.misses += misses
+                yield from page_results
+                print(f"  Processed pages {page_results[0][0]}-{page_results[-1][0]}/{total_pages}...")
+    else:
+        print(f"✅ PDF loaded: {page_range}{total_pages} pages")
+        
+        contents = iter_page_contents(pdf_path, first_page, last_page, cache=cache, template=template,
+                                      lifecycle=lifecycle, pdf_hash=pdf_hash)
+        for page_num, tables, text in contents:
+            if page_num % 10 == 0:
+                print(f"  Processing page {page_num}/{total_pages}...")
+            
+            yield page_num, list(iter_content_rows(tables, text, required_columns)), page_headers(tables)
+
+def iter_pdf_rows(pdf_path, workers=1, required_columns=REQUIRED_COLUMNS, cache=None, template=None,
+                  lifecycle=None):
+    """Yield extracted rows for the whole PDF, in page order (see iter_pdf_pages)."""
+    for page_num, rows, headers in iter_pdf_pages(pdf_path, workers, required_columns, cache, template, lifecycle):
+        yield from rows
+
+def extract_pdf_to_excel(pdf_path, excel_path, workers=1, cache=None, template=None, lifecycle=None):
+    """Extract all data from PDF and save to Excel with required columns.
+
+    Rows stream from the page extractor through the columnar normalization
+    stage (in batches) straight into the Excel writer, so the whole
+    catalogue is never held in memory at once. Numbers that fail to parse
+    are written to <excel name>_rejects.csv.
+    """
+    from frame_normalizer import iter_normalized_frames, save_rejects
     
-    # Reorder columns to match required order
-    df = df[required_columns]
+    print(f"📄 Extracting data from PDF: {pdf_path}")
     
-    # Remove completely empty rows
-    df = df[df.astype(str).ne('').any(axis=1)]
+    required_columns = REQUIRED_COLUMNS
+    writer = open_row_writer(excel_path, required_columns, NUMERIC_COLUMNS)
+    extracted = 0
+    rejects = []
     
-    print(f"✅ Final data: {len(df)} rows, {len(df.columns)} columns")
+    def counted(rows):
+        nonlocal extracted
+        for row in rows:
+            extracted += 1
+            yield row
     
-    # Save to Excel
-    print(f"📊 Saving to Excel: {excel_path}")
+    # Anything but a successful save drops the partial output
+    saved = False
     try:
-        df.to_excel(excel_path, index=False, engine='openpyxl')
-        print(f"✅ Excel file created successfully: {excel_path}")
-        print(f"   Columns: {', '.join(df.columns.tolist())}")
-        return True
-    except Exception as e:
-        print(f"❌ Error saving to Excel: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+        try:
+            rows = counted(iter_pdf_rows(pdf_path, workers, required_columns, cache, template, lifecycle))
+            frames = iter_normalized_frames(
+                rows, required_columns, NUMERIC_COLUMNS, MEANINGFUL_COLUMNS,
+                batch_size=FRAME_BATCH_SIZE, rejects=rejects,
+            )
+            for frame in frames:
+                writer.write_frame(frame)
+        
+        except Exception as e:
+            print(f"❌ Error extracting PDF: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+        
+        print(f"✅ Extracted {extracted} rows from PDF")
+        
+        rejects_path = Path(excel_path).with_name(f"{Path(excel_path).stem}_rejects.csv")
+        rejected = save_rejects(rejects, rejects_path)
+        if rejected:
+            print(f"⚠️  {rejected} values could not be parsed as numbers, see {rejects_path}")
+        
+        if not writer.count:
+            print("⚠️  No data extracted! Trying alternative extraction method...")
+            return False
+        
+        print(f"✅ Final data: {writer.count} rows, {len(required_columns)} columns")
+        
+        # Save to Excel (or the format chosen by the output extension)
+        print(f"📊 Saving to: {excel_path}")
+        try:
+            writer.save()
+            saved = True
+            print(f"✅ Output file created successfully: {excel_path}")
+            print(f"   Columns: {', '.join(required_columns)}")
+            return True
+        except Exception as e:
+            print(f"❌ Error saving output file: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    finally:
+        if not saved:
+            writer.discard()
 
-def main():
-    pdf_path = Path("CTC Item Lists.pdf")
-    excel_path = Path("CTC Item Lists.xlsx")
+def add_cache_args(parser):
+    """Add the page cache options shared by the conversion scripts."""
+    parser.add_argument(
+        '--cache-dir', default=DEFAULT_CACHE_DIR, metavar='DIR',
+        help=f"directory of the per-page extraction cache (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        '--cache-size', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024), metavar='MB',
+        help="evict least recently used pages beyond this size (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help="always re-extract every page"
+    )
+
+def output_path(value):
+    """argparse type for --output: a path with a supported extension."""
+    path = Path(value)
+    if path.suffix.lower() not in SINKS:
+        raise argparse.ArgumentTypeError(f"unsupported output format '{path.suffix}' (use one of: {', '.join(SINKS)})")
+    return path
+
+def add_output_arg(parser, default=DEFAULT_OUTPUT):
+    """Add the --output option; its extension picks the format (see row_sinks)."""
+    parser.add_argument(
+        '-o', '--output', type=output_path, default=Path(default), metavar='PATH',
+        help=f"output file: .xlsx, .csv, .parquet or .feather (default: {default})"
+    )
+
+def open_cache(args, template=None):
+    """Return the PageCache selected by the command-line options, or None."""
+    if args.no_cache:
+        return None
+    settings = template.settings() if template else TABLE_SETTINGS
+    return PageCache(args.cache_dir, args.cache_size * 1024 * 1024, settings)
+
+def load_template(pdf_path, template_path, sample_pages=3):
+    """Load the layout template file, or learn it from the first pages and save it.
+
+    Returns None (use table detection) if no table with a header is found.
+    """
+    template_path = Path(template_path)
+    if template_path.exists():
+        template = LayoutTemplate.load(template_path)
+        print(f"📐 Using layout template: {template_path} ({len(template.header)} columns)")
+        return template
+    
+    pages = (page for page_num, page in iter_pages(pdf_path, 1, sample_pages))
+    template = learn_template(pages, find_header_row, TABLE_SETTINGS)
+    if template is None:
+        print(f"⚠️  No table header found in the first {sample_pages} pages, using table detection")
+        return None
+    template.save(template_path)
+    print(f"📐 Learned layout template from the first {sample_pages} pages: {template_path}")
+    return template
+
+def add_extract_args(parser):
+    """Add the page extraction options (parallelism, layout template)."""
+    parser.add_argument(
+        '--workers', type=int, default=1, metavar='N',
+        help="extract pages in N parallel processes (default: 1, serial)"
+    )
+    parser.add_argument(
+        '--template', metavar='PATH',
+        help="read pages through a fixed column layout saved at PATH, learning it first if missing"
+    )
+    parser.add_argument(
+        '--template-pages', type=int, default=3, metavar='N',
+        help="with --template, learn the layout from the first N pages (default: 3)"
+    )
+
+def page_range(value):
+    """argparse type for --pages: "A-B", "A-" (to the end) or "A"; returns (first, last or None)."""
+    first, sep, last = value.partition('-')
+    try:
+        first = int(first)
+        last = (int(last) if last else None) if sep else first
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid page range '{value}' (use A-B, A- or A)")
+    if first < 1 or (last is not None and last < first):
+        raise argparse.ArgumentTypeError(f"invalid page range '{value}'")
+    return first, last
+
+def shard_spec(value):
+    """argparse type for --shard: "i/N" with 1 <= i <= N; returns (i, N)."""
+    index, _, count = value.partition('/')
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}' (use i/N, e.g. 2/8)")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}': i must be between 1 and N")
+    return index, count
+
+def add_shard_args(parser):
+    """Add the partial-run options; such runs write a partial file for `ctc_items.py merge` (see partial_results.py)."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        '--pages', type=page_range, metavar='A-B',
+        help="extract only pages A to B into a partial file instead of the output"
+    )
+    group.add_argument(
+        '--shard', type=shard_spec, metavar='i/N',
+        help="extract only the i-th of N equal page ranges into a partial file instead of the output"
+    )
+
+def add_batch_args(parser):
+    """Add the options of batch conversion, for a directory or glob of PDFs (see batch_convert.py)."""
+    parser.add_argument(
+        '--merge', action='store_true',
+        help="for a batch, write the rows of all PDFs into --output with a 'source file' column"
+    )
+    parser.add_argument(
+        '--output-dir', metavar='DIR',
+        help="for a batch, write one output per PDF into DIR, named after the PDF (default: next to each PDF)"
+    )
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Convert CTC Item Lists.pdf to Excel")
+    parser.add_argument(
+        '--source', default=DEFAULT_PDF, metavar='PATH',
+        help="PDF to convert, or a directory or glob of PDFs to convert as a batch (default: %(default)s)"
+    )
+    add_extract_args(parser)
+    add_shard_args(parser)
+    add_batch_args(parser)
+    add_output_arg(parser)
+    add_cache_args(parser)
+    add_memory_args(parser)
+    add_instrumentation_args(parser)
+    return parser.parse_args(argv)
+
+def convert_catalogue(args, pdf_path):
+    """Convert one PDF to args.output as selected by the command-line args; returns success."""
+    excel_path = args.output
     
     if not pdf_path.exists():
         print(f"❌ PDF file not found: {pdf_path}")
-        return
+        return False
     
     print("=" * 60)
     print("PDF to Excel Converter")
     print("=" * 60)
     print()
     
-    success = extract_pdf_to_excel(pdf_path, excel_path)
+    template = load_template(pdf_path, args.template, args.template_pages) if args.template else None
+    cache = open_cache(args, template)
+    if args.pages or args.shard:
+        # A partial run writes a partial file for `ctc_items.py merge` instead
+        from partial_results import extract_partial
+        
+        excel_path = extract_partial(
+            pdf_path, excel_path, args.pages, args.shard, workers=args.workers, cache=cache,
+            template=template, lifecycle=open_lifecycle(args),
+        )
+        success = excel_path is not None
+    else:
+        success = extract_pdf_to_excel(
+            pdf_path, excel_path, workers=args.workers, cache=cache, template=template,
+            lifecycle=open_lifecycle(args),
+        )
+    if cache:
+        print(f"   Page cache: {cache.hits} hits, {cache.misses} misses")
+        cache.close()
     
     if success:
         print()
         print("=" * 60)
         print("✅ Conversion complete!")
-        print(f"   Excel file: {excel_path}")
+        print(f"   Output file: {excel_path}")
         print("=" * 60)
     else:
         print()
         print("=" * 60)
         print("❌ Conversion failed!")
         print("=" * 60)
+    return success
+
+def run(args):
+    """Convert the catalogue, or a batch of them, as selected by the command-line args."""
+    from batch_convert import is_batch_source, convert_batch
+    
+    if is_batch_source(args.source):
+        convert_batch(args, args.source)
+    else:
+        convert_catalogue(args, Path(args.source))
+
+def main():
+    args = parse_args()
+    with instrumented(args):
+        run(args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Single command-line entry point for the CTC catalogue tools.
+
+    python ctc_items.py extract   [PDF] -o sheet.xlsx        PDF(s) -> catalogue sheet (17 columns)
+    python ctc_items.py normalize [SOURCE] -o items.parquet  PDF/JSON -> normalized item fields
+    python ctc_items.py export    INPUT -o OUTPUT            re-encode a sheet as .xlsx/.csv/.parquet/.feather
+    python ctc_items.py import    [SOURCE] --api-url URL     normalize and send the items to the app
+    python ctc_items.py sync      [SOURCE] --api-url URL     send only the diff against the live parts
+    python ctc_items.py merge     PARTIAL... -o sheet.xlsx   combine extract --pages/--shard runs
+
+SOURCE is the catalogue PDF or a JSON export of it such as
+CTC_Item_Lists_with_size.json, which is read without pdfplumber. extract
+also takes a directory or glob of PDFs and converts them as one batch
+(see batch_convert.py).
+
+Heavy dependencies (pdfplumber, pandas, openpyxl, requests, aiohttp, pyarrow)
+are imported only by the subcommand that needs them, so --help and light
+subcommands start quickly, and missing ones are reported instead of being
+installed automatically.
+"""
+
+import sys
+import argparse
+import importlib.util
+from pathlib import Path
+
+from convert_pdf_to_excel import (
+    DEFAULT_PDF, add_extract_args, add_shard_args, add_batch_args, add_output_arg, add_cache_args, output_path,
+)
+from import_items_from_pdf import add_import_args, add_journal_args, add_sync_args
+from page_lifecycle import add_memory_args
+from instrumentation import add_instrumentation_args, instrumented
+
+# Third-party modules imported by the subcommands, with their pip package names
+PACKAGES = {
+    'pdfplumber': 'pdfplumber',
+    'pdfminer': 'pdfminer.six',
+    'pandas': 'pandas',
+    'openpyxl': 'openpyxl',
+    'requests': 'requests',
+    'aiohttp': 'aiohttp',
+    'pyarrow': 'pyarrow',
+}
+
+def missing_packages(modules):
+    """Pip names of the modules that are not installed (checked without importing them)."""
+    return [PACKAGES[module] for module in modules if importlib.util.find_spec(module) is None]
+
+def cmd_extract(args):
+    from batch_convert import is_batch_source, convert_batch
+    from convert_pdf_to_excel import convert_catalogue
+
+    if is_batch_source(args.pdf):
+        return convert_batch(args, args.pdf)
+    return convert_catalogue(args, args.pdf)
+
+def cmd_normalize(args):
+    from import_items_from_pdf import process_catalogue
+    return process_catalogue(args, args.source, do_import=False)
+
+def cmd_import(args):
+    from import_items_from_pdf import process_catalogue
+    return process_catalogue(args, args.source, do_import=True)
+
+def cmd_export(args):
+    from row_sinks import export_table
+    from convert_pdf_to_excel import NUMERIC_COLUMNS
+    from import_items_from_pdf import NUMERIC_FIELDS
+
+    if not args.input.exists():
+        print(f"❌ Input file not found: {args.input}")
+        return False
+    count = export_table(args.input, args.output, NUMERIC_COLUMNS + NUMERIC_FIELDS)
+    print(f"✅ Exported {count} rows to {args.output}")
+    return True
+
+def cmd_merge(args):
+    from partial_results import merge_partials
+    return merge_partials(args.partials, args.output)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="CTC catalogue tools: extract, normalize, export, import and sync items")
+    subparsers = parser.add_subparsers(dest='command', required=True, metavar='COMMAND')
+
+    def add_pdf_arg(subparser):
+        subparser.add_argument(
+            'pdf', nargs='?', type=Path, default=Path(DEFAULT_PDF),
+            help=f"catalogue PDF, or a directory or glob of PDFs to convert as a batch (default: {DEFAULT_PDF})"
+        )
+
+    def add_source_arg(subparser):
+        subparser.add_argument(
+            'source', nargs='?', type=Path, default=Path(DEFAULT_PDF),
+            help=f"catalogue PDF or JSON export (default: {DEFAULT_PDF})"
+        )
+
+    extract = subparsers.add_parser('extract', help="convert the PDF to a catalogue sheet with all 17 columns")
+    add_pdf_arg(extract)
+    add_extract_args(extract)
+    add_shard_args(extract)
+    add_batch_args(extract)
+    add_output_arg(extract)
+    add_cache_args(extract)
+    add_memory_args(extract)
+    add_instrumentation_args(extract)
+    extract.set_defaults(handler=cmd_extract, requires=('pdfplumber', 'pandas'))
+
+    normalize = subparsers.add_parser('normalize', help="extract and save the normalized item fields, without importing")
+    add_source_arg(normalize)
+    add_output_arg(normalize)
+    add_cache_args(normalize)
+    add_memory_args(normalize)
+    add_instrumentation_args(normalize)
+    normalize.set_defaults(handler=cmd_normalize, requires=('pandas',), sync=False)
+
+    export = subparsers.add_parser('export', help="re-encode a saved sheet in another format")
+    export.add_argument('input', type=Path, help="sheet written by extract or normalize")
+    export.add_argument(
+        '-o', '--output', type=output_path, required=True, metavar='PATH',
+        help="output file: .xlsx, .csv, .parquet or .feather"
+    )
+    add_instrumentation_args(export)
+    export.set_defaults(handler=cmd_export, requires=('pandas',))
+
+    merge = subparsers.add_parser('merge', help="combine the partial files of extract --pages/--shard runs into one sheet")
+    merge.add_argument('partials', nargs='+', type=Path, metavar='PARTIAL', help="partial files, or directories of them")
+    add_output_arg(merge)
+    add_instrumentation_args(merge)
+    merge.set_defaults(handler=cmd_merge, requires=('pandas',))
+
+    for name, sync, help_text in (
+        ('import', False, "normalize the items and import them into the app"),
+        ('sync', True, "send only creates and changed fields against the live parts"),
+    ):
+        command = subparsers.add_parser(name, help=help_text)
+        add_source_arg(command)
+        add_import_args(command)
+        if sync:
+            add_sync_args(command)
+        else:
+            add_journal_args(command)
+        add_output_arg(command)
+        add_cache_args(command)
+        add_memory_args(command)
+        add_instrumentation_args(command)
+        command.set_defaults(handler=cmd_import, requires=('pandas', 'requests'), sync=sync)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    requires = list(args.requires)
+    if getattr(args, 'source', None) and args.source.suffix.lower() != '.json':
+        requires.append('pdfplumber')
+    missing = missing_packages(requires)
+    if missing:
+        print(f"❌ Missing dependencies for '{args.command}': pip install {' '.join(missing)}")
+        return 1
+    try:
+        with instrumented(args):
+            ok = args.handler(args)
+    except ModuleNotFoundError as e:
+        package = PACKAGES.get((e.name or '').split('.')[0])
+        if package is None:
+            raise
+        print(f"❌ Missing dependency for '{args.command}': pip install {package}")
+        return 1
+    except ImportError as e:
+        # The sinks re-raise a missing optional writer with an install hint
+        print(f"❌ {e}")
+        return 1
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+In-run duplicate detection and master-part grouping for normalized items.
+
+The catalogue lists some parts more than once (repeated rows, the
+description standing in for a blank part number), and repeats a master
+part number across brands. DedupIndex hashes every item on
+(part_no, brand) as it streams past, before anything is written or sent:
+
+- exact duplicates are dropped,
+- rows that only add or lack values, or differ in fields that don't
+  identify the item (status, uom), are merged into the first one, filling
+  its blanks,
+- rows that disagree with the first one on a real value are conflicts:
+  they stay in the output, right after the first row as its variants,
+  but iter_importable holds them back from the import,
+
+and the items are grouped by master part number. To merge and group,
+each first item is held for `window` rows before it is passed on; a
+repeat further down can no longer change it, so its extra values are
+only reported. The app's part numbers are unique regardless of brand, so
+iter_importable also holds back a second brand's item with an already
+used part number instead of letting its POST fail. Everything dropped,
+merged or held back is listed, with the differing values, in a JSON
+report.
+"""
+
+import json
+from collections import Counter
+
+from reference_cache import name_key
+
+# Fields whose differences don't make two rows different items
+IGNORED_FIELDS = ('status', 'uom')
+
+ACTIONS = ('duplicate', 'merged', 'conflict', 'part_no_taken')
+
+# Rows an item is held for, so later repeats can still be merged into it
+DEFAULT_WINDOW = 1000
+
+def _blank(value):
+    return value is None or value == ''
+
+class DedupIndex:
+    """Hash index of the items seen in one run, by (part_no, brand) and master part."""
+
+    def __init__(self, fields, ignored_fields=IGNORED_FIELDS, window=DEFAULT_WINDOW):
+        self.fields = list(fields)
+        self.compared = [idx for idx, field in enumerate(self.fields) if field not in ignored_fields]
+        self.window = window
+        self.items = {}     # (part_no, brand key) -> (row, tuple of values) of the first item
+        self.pending = {}   # (part_no, brand key) -> (first item, [conflicting variants]) not yet passed on
+        self.checked = set()  # keys iter_importable has passed or held back
+        self.part_nos = {}  # part_no -> (brand key, brand name) of the item that will be imported
+        self.masters = {}   # master part no -> [(part_no, brand name), ...]
+        self.entries = []
+        self.counts = dict.fromkeys(ACTIONS, 0)
+        self.seen = 0
+
+    @staticmethod
+    def key(item):
+        return str(item.get('part_no') or '').strip(), name_key(item.get('brand_name') or '')
+
+    def _entry(self, action, row, item, **details):
+        self.counts[action] += 1
+        entry = {
+            'action': action,
+            'row': row,
+            'part_no': item.get('part_no'),
+            'brand_name': item.get('brand_name'),
+            'master_part_no': item.get('master_part_no'),
+        }
+        if item.get('part_no') == item.get('description'):
+            entry['part_no_from_description'] = True
+        entry.update(details)
+        self.entries.append(entry)
+
+    def _release(self, last_row=None):
+        """Yield the held items first seen up to `last_row` (all if None), each followed by its variants."""
+        while self.pending:
+            key = next(iter(self.pending))
+            if last_row is not None and self.items[key][0] > last_row:
+                break
+            item, variants = self.pending.pop(key)
+            yield item
+            yield from variants
+
+    def iter_unique(self, items):
+        """Yield the first item of every (part_no, brand), merged, then its conflicts; record the rest."""
+        for row, item in enumerate(items, 1):
+            yield from self._release(row - self.window)
+            self.seen += 1
+            key = self.key(item)
+            values = tuple(item.get(field) for field in self.fields)
+            first = self.items.get(key)
+            if first is None:
+                self.items[key] = (row, values)
+                master = item.get('master_part_no') or key[0]
+                self.masters.setdefault(master, []).append((key[0], item.get('brand_name')))
+                self.pending[key] = (item, [])
+                continue
+
+            first_row, kept = first
+            if values == kept:
+                self._entry('duplicate', row, item, first_row=first_row)
+                continue
+            conflicts = {}
+            added = {}
+            for idx in self.compared:
+                old, new = kept[idx], values[idx]
+                if old == new or _blank(new):
+                    continue
+                if _blank(old):
+                    added[self.fields[idx]] = new
+                else:
+                    conflicts[self.fields[idx]] = [old, new]
+            held = self.pending.get(key)
+            if conflicts:
+                self._entry('conflict', row, item, first_row=first_row, differences=conflicts)
+                if held:
+                    held[1].append(item)
+                else:
+                    yield item
+            elif added and held:
+                held[0].update(added)
+                self.items[key] = (first_row, tuple(held[0].get(field) for field in self.fields))
+                self._entry('merged', row, item, first_row=first_row, values_added=added)
+            else:
+                self._entry('merged', row, item, first_row=first_row, **({'values_not_kept': added} if added else {}))
+        yield from self._release()
+
+    def iter_importable(self, items):
+        """Drop conflicting variants and items whose part number another brand already uses in this run."""
+        for item in items:
+            key = self.key(item)
+            if key in self.checked:
+                continue  # a conflict, recorded by iter_unique
+            self.checked.add(key)
+            part_no, brand = key
+            owner = self.part_nos.setdefault(part_no, (brand, item.get('brand_name')))
+            if owner[0] != brand:
+                row = self.items[key][0] if key in self.items else None
+                self._entry('part_no_taken', row, item, taken_by=owner[1])
+                continue
+            yield item
+
+    def summary(self):
+        variants = sum(1 for group in self.masters.values() if len(group) > 1)
+        return dict(
+            items=self.seen, unique=len(self.items), **self.counts,
+            master_parts=len(self.masters), master_parts_with_variants=variants,
+        )
+
+    def save_report(self, path):
+        """Write the summary, every held-back row and the multi-variant master parts as JSON."""
+        report = {
+            'summary': self.summary(),
+            'entries': self.entries,
+            'master_parts': {
+                master: [{'part_no': part_no, 'brand_name': brand} for part_no, brand in group]
+                for master, group in self.masters.items() if len(group) > 1
+            },
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+
+    def print_summary(self):
+        summary = self.summary()
+        print(f"🧮 Dedup: {summary['unique']} unique of {summary['items']} items - "
+              f"{summary['duplicate']} duplicates, {summary['merged']} merged, {summary['conflict']} conflicts; "
+              f"{summary['master_parts_with_variants']} master parts with variants")
+        if summary['conflict']:
+            fields = Counter(field for entry in self.entries if entry['action'] == 'conflict' for field in entry['differences'])
+            differing = ', '.join(f"{field} ({count})" for field, count in fields.most_common())
+            print(f"   {summary['conflict']} conflicts not imported, listed after their first row: same part number "
+                  f"and brand as an earlier row, but other {differing}")
+        if summary['part_no_taken']:
+            print(f"   {summary['part_no_taken']} items not sent: part number already used by another brand")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Columnar normalization stage for extracted rows.
+
+Rows are grouped into batches and cleaned as DataFrames with vectorized
+operations instead of per-cell Python: whitespace stripping, dropping rows
+without meaningful data, and parsing thousands-separated numbers such as
+"2,000" or "984.000" into float columns. Values that don't parse are
+collected into a reject frame (one row per bad cell) instead of being
+silently dropped.
+"""
+
+import sys
+import itertools
+import pandas as pd
+
+from instrumentation import METRICS
+
+def iter_batches(rows, batch_size):
+    """Group an iterable of rows into lists of up to batch_size rows."""
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def parse_numbers(values):
+    """Parse a string Series like "2,000" / "984.000" into floats.
+
+    Returns (parsed, invalid) where invalid marks non-empty values that
+    could not be parsed; empty values become NaN without being invalid.
+    """
+    # float64 in every batch, so appended Parquet/Feather batches share one schema
+    parsed = pd.to_numeric(values.str.replace(',', '', regex=False), errors='coerce').astype('float64')
+    invalid = values.ne('') & parsed.isna()
+    return parsed, invalid
+
+def normalize_frame(frame, numeric_columns=(), required_any=None):
+    """Clean one batch of rows; returns (clean frame, rejects frame).
+
+    required_any lists the columns of which at least one must be non-empty
+    for a row to be kept (default: any column). Numeric columns are parsed
+    to float; the rejects frame holds the stripped source row plus
+    rejected_column / rejected_value for every cell that failed to parse.
+    """
+    frame = frame.fillna('').astype(str).apply(lambda column: column.str.strip())
+
+    check_columns = list(required_any) if required_any else list(frame.columns)
+    frame = frame[frame[check_columns].ne('').any(axis=1)]
+
+    rejects = []
+    parsed_columns = {}
+    for column in numeric_columns:
+        if column not in frame.columns:
+            continue
+        parsed, invalid = parse_numbers(frame[column])
+        if invalid.any():
+            bad = frame.loc[invalid].copy()
+            bad['rejected_column'] = column
+            bad['rejected_value'] = frame.loc[invalid, column]
+            rejects.append(bad)
+        parsed_columns[column] = parsed
+
+    if parsed_columns:
+        frame = frame.assign(**parsed_columns)
+    rejects = pd.concat(rejects) if rejects else pd.DataFrame()
+    return frame, rejects
+
+def iter_normalized_frames(rows, columns, numeric_columns=(), required_any=None,
+                           batch_size=1000, rejects=None):
+    """Yield cleaned DataFrames built from batches of row dicts.
+
+    Reject frames are appended to the optional `rejects` list.
+    """
+    for batch in iter_batches(rows, batch_size):
+        with METRICS.timer('dataframe_build'):
+            frame = pd.DataFrame.from_records(batch, columns=columns)
+        with METRICS.timer('normalize'):
+            clean, batch_rejects = normalize_frame(frame, numeric_columns, required_any)
+        if rejects is not None and not batch_rejects.empty:
+            rejects.append(batch_rejects)
+        if not clean.empty:
+            yield clean
+
+def iter_frame_records(frames, interned=()):
+    """Turn cleaned frames back into dicts, omitting empty and NaN values.
+
+    Values of the columns in `interned` are interned again; the frame
+    holds copies of the strings it was built from.
+    """
+    for frame in frames:
+        for record in frame.to_dict('records'):
+            yield {
+                key: sys.intern(value) if key in interned and isinstance(value, str) else value
+                for key, value in record.items() if value == value and value != ''
+            }
+
+def save_rejects(rejects, path):
+    """Write collected reject frames to CSV; returns the number of rejected cells."""
+    if not rejects:
+        return 0
+    frame = pd.concat(rejects)
+    frame.to_csv(path, index=False)
+    return len(frame)
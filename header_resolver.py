@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Precompiled header-alias resolver shared by the conversion scripts.
+
+An alias table ({field: [alias, ...]}, aliases in priority order) is compiled
+once into an exact-match dict plus a single alternation regex. A table's
+header row is then resolved once into a plan that every data row reuses,
+instead of re-scanning the alias table for each cell of each row.
+"""
+
+import re
+
+def clean_header(header):
+    """Lowercase a header cell and collapse its whitespace (PDF headers often wrap)."""
+    return ' '.join(str(header).lower().split())
+
+class HeaderResolver:
+    """Map header cells to canonical field names through a compiled alias table.
+
+    With substring=True, a header that isn't an exact alias resolves to the
+    longest alias found inside it (leftmost match), so e.g. "SS Part No"
+    maps to the "ss part no" field rather than to "part no".
+    """
+
+    _MAX_PLANS = 1024
+
+    def __init__(self, aliases, substring=True):
+        self.fields = list(aliases)
+        self._exact = {}
+        for field, names in aliases.items():
+            for rank, name in enumerate(names):
+                self._exact.setdefault(clean_header(name), (field, rank))
+
+        self._pattern = None
+        if substring:
+            alternatives = sorted(self._exact, key=len, reverse=True)
+            self._pattern = re.compile('|'.join(re.escape(alias) for alias in alternatives))
+        self._key_plans = {}
+
+    def _lookup(self, header):
+        if not header:
+            return None
+        key = clean_header(header)
+        hit = self._exact.get(key)
+        if hit is None and self._pattern is not None:
+            match = self._pattern.search(key)
+            if match:
+                hit = self._exact[match.group(0)]
+        return hit
+
+    def resolve(self, header):
+        """Return the field for one header cell, or None."""
+        hit = self._lookup(header)
+        return hit[0] if hit else None
+
+    def column_plan(self, header_row):
+        """Resolve a header row into [(column index, field), ...]."""
+        plan = []
+        for col_idx, header_cell in enumerate(header_row):
+            field = self.resolve(header_cell)
+            if field:
+                plan.append((col_idx, field))
+        return plan
+
+    def key_plan(self, keys):
+        """Resolve dict keys into [(field, [keys by alias priority]), ...].
+
+        Plans are memoized per key tuple, since every row of a table (or a
+        JSON source) shares the same keys.
+        """
+        keys = tuple(keys)
+        plan = self._key_plans.get(keys)
+        if plan is None:
+            candidates = {}
+            for key in keys:
+                hit = self._lookup(key)
+                if hit:
+                    field, rank = hit
+                    candidates.setdefault(field, []).append((rank, key))
+            plan = [
+                (field, [key for rank, key in sorted(candidates[field], key=lambda c: c[0])])
+                for field in self.fields if field in candidates
+            ]
+            if len(self._key_plans) >= self._MAX_PLANS:
+                self._key_plans.clear()
+            self._key_plans[keys] = plan
+        return plan
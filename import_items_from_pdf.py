@@ -5,121 +5,216 @@ Script to extract items from PDF, convert to Excel, and import into the app.
 
 import sys
 import json
-import requests
-import pandas as pd
+import argparse
+import itertools
 from pathlib import Path
 
-try:
-    import pdfplumber
-except ImportError:
-    print("Installing required package: pdfplumber")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "pdfplumber", "openpyxl", "pandas", "requests"])
-    import pdfplumber
+# requests, pdfplumber and pandas (frame_normalizer) are imported where they
+# are used, so importing this module - e.g. for the CLI's --help - stays cheap
+from convert_pdf_to_excel import iter_page_contents, add_cache_args, add_output_arg, open_cache
+from row_sinks import open_row_writer
+from header_resolver import HeaderResolver
+from json_source import iter_json_rows, parse_models
+from dedup_index import DedupIndex
+from import_journal import ImportJournal, DEFAULT_JOURNAL_PATH
+from instrumentation import METRICS, add_instrumentation_args, instrumented
+from page_lifecycle import add_memory_args, open_lifecycle
 
 # API Configuration
 API_BASE_URL = "http://localhost:3001/api"
 PARTS_ENDPOINT = f"{API_BASE_URL}/parts"
 
-def extract_pdf_data(pdf_path):
-    """Extract table data from PDF file."""
+def iter_table_records(table):
+    """Yield {header: value} dicts for one table, using its first row as headers."""
+    # Skip empty tables
+    if not table or len(table) < 2:
+        return
+    
+    # First row is usually headers
+    headers = [str(cell).strip() if cell else "" for cell in table[0]]
+    
+    # Process data rows
+    for row in table[1:]:
+        if not row or all(not cell or str(cell).strip() == "" for cell in row):
+            continue
+        
+        # Create dictionary from row
+        row_data = {}
+        for i, cell in enumerate(row):
+            if i < len(headers) and headers[i]:
+                row_data[headers[i]] = str(cell).strip() if cell else ""
+        
+        if row_data:
+            yield row_data
+
+def iter_pdf_data(pdf_path, cache=None, lifecycle=None):
+    """Yield table rows from the PDF file as each page is extracted.
+
+    Pages found in the optional PageCache are not parsed again; an optional
+    PageLifecycle bounds the memory held by the open document.
+    """
     print(f"📄 Extracting data from PDF: {pdf_path}")
-    all_data = []
+    count = 0
     
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
+        for page_num, tables, text in iter_page_contents(pdf_path, cache=cache, lifecycle=lifecycle):
+            if page_num % 10 == 0:
                 print(f"  Processing page {page_num}...")
-                
-                # Try to extract tables
-                tables = page.extract_tables()
-                
-                if tables:
-                    for table in tables:
-                        # Skip empty tables
-                        if not table or len(table) < 2:
-                            continue
-                        
-                        # First row is usually headers
-                        headers = [str(cell).strip() if cell else "" for cell in table[0]]
-                        
-                        # Process data rows
-                        for row in table[1:]:
-                            if not row or all(not cell or str(cell).strip() == "" for cell in row):
-                                continue
-                            
-                            # Create dictionary from row
-                            row_data = {}
-                            for i, cell in enumerate(row):
-                                if i < len(headers) and headers[i]:
-                                    row_data[headers[i]] = str(cell).strip() if cell else ""
-                            
-                            if row_data:
-                                all_data.append(row_data)
-                
-                # If no tables found, try extracting text and parsing
-                if not tables:
-                    text = page.extract_text()
-                    if text:
-                        lines = text.split('\n')
-                        # Try to parse as structured data
-                        # This is a fallback - adjust based on your PDF structure
-                        print(f"  No tables found on page {page_num}, trying text extraction...")
+            
+            for table in tables:
+                for row_data in iter_table_records(table):
+                    count += 1
+                    yield row_data
+            
+            # If no tables found, try extracting text and parsing
+            if not tables:
+                if text:
+                    # This is a fallback - adjust based on your PDF structure
+                    print(f"  No tables found on page {page_num}, trying text extraction...")
     
     except Exception as e:
         print(f"❌ Error extracting PDF: {e}")
-        return []
+        return
     
-    print(f"✅ Extracted {len(all_data)} rows from PDF")
-    return all_data
+    print(f"✅ Extracted {count} rows from PDF")
 
-def normalize_data(data):
-    """Normalize extracted data to match API format."""
-    normalized = []
-    
-    # Common column name mappings
-    column_mappings = {
-        'part_no': ['part_no', 'part no', 'part number', 'partnumber', 'part#', 'part #'],
-        'part_no': ['part_no', 'part no', 'part number', 'partnumber', 'part#', 'part #'],
-        'brand_name': ['brand', 'brand_name', 'brand name', 'manufacturer'],
-        'description': ['description', 'desc', 'item description', 'name', 'item name'],
-        'category': ['category', 'category_id', 'category name'],
-        'subcategory': ['subcategory', 'subcategory_id', 'subcategory name'],
-        'application': ['application', 'application_id', 'application name'],
-        'uom': ['uom', 'unit', 'unit of measure', 'unit_of_measure'],
-        'cost': ['cost', 'purchase price', 'purchase_price', 'buying price'],
-        'price_a': ['price', 'price_a', 'price a', 'sale price', 'sale_price', 'selling price'],
-        'master_part_no': ['master_part_no', 'master part no', 'master part number'],
-    }
+def extract_pdf_data(pdf_path, cache=None, lifecycle=None):
+    """Extract table data from PDF file."""
+    return list(iter_pdf_data(pdf_path, cache, lifecycle))
+
+def iter_json_data(json_path):
+    """Yield the items of a JSON export (e.g. CTC_Item_Lists_with_size.json) as flat rows.
     
-    for row in data:
+    The array is parsed incrementally, so the document is never held in memory.
+    """
+    print(f"📄 Reading items from JSON: {json_path}")
+    count = 0
+    
+    try:
+        for row_data in iter_json_rows(json_path):
+            count += 1
+            if count % 1000 == 0:
+                print(f"  Read {count} items...")
+            yield row_data
+    except ValueError as e:
+        print(f"❌ Error reading JSON: {e}")
+        return
+    
+    METRICS.count('json_items', count)
+    print(f"✅ Read {count} items from JSON")
+
+def is_json_source(path):
+    return Path(path).suffix.lower() == '.json'
+
+# Fields produced by normalize_rows, in output column order
+NORMALIZED_FIELDS = [
+    'part_no',
+    'ss_part_no',
+    'brand_name',
+    'description',
+    'category',
+    'subcategory',
+    'application',
+    'uom',
+    'cost',
+    'price_a',
+    'master_part_no',
+    'status',
+    'price_b',
+    'size',
+    'models',
+]
+
+# Common column name mappings, aliases in priority order
+FIELD_ALIASES = {
+    'part_no': ['part_no', 'part no', 'part number', 'partnumber', 'part#', 'part #'],
+    # The PDF's second part number column; the app's JSON export writes the
+    # part number under this name, so there it stands in for part_no
+    'ss_part_no': ['ss part no', 'ss part no.', 'ss_part_no', 'ss part number'],
+    'brand_name': ['brand', 'brand_name', 'brand name', 'manufacturer'],
+    'description': ['description', 'desc', 'item description', 'name', 'item name', 'discription'],
+    'category': ['category', 'category_id', 'category name', 'catigory'],
+    'subcategory': ['subcategory', 'subcategory_id', 'subcategory name', 'sub category', 'sub catigory'],
+    'application': ['application', 'application_id', 'application name'],
+    'uom': ['uom', 'unit', 'unit of measure', 'unit_of_measure'],
+    'cost': ['cost', 'purchase price', 'purchase_price', 'buying price'],
+    'price_a': ['price', 'price_a', 'price a', 'sale price', 'sale_price', 'selling price'],
+    'master_part_no': ['master_part_no', 'master part no', 'master part number'],
+    'price_b': ['price_b', 'price b'],
+    'size': ['size'],
+    # JSON text of [{"model": ..., "qty": ...}], see json_source.format_models
+    'models': ['models'],
+}
+
+# Low-cardinality fields whose values are interned, so items share one
+# string object per distinct brand, category, unit, ...
+INTERNED_FIELDS = {'brand_name', 'category', 'subcategory', 'application', 'uom', 'status'}
+
+# Exact matches only: a "Master Part No" column must not feed part_no
+FIELD_RESOLVER = HeaderResolver(FIELD_ALIASES, substring=False)
+
+# Normalized fields parsed to numbers ("2,000" -> 2000.0) by type_rows
+NUMERIC_FIELDS = ['cost', 'price_a', 'price_b']
+
+# Items per DataFrame batch in type_rows; small enough that a streaming
+# import isn't held up waiting for a batch to fill
+TYPE_BATCH_SIZE = 500
+
+# Streamed items whose reference names are resolved (and missing brands and
+# categories created) together, before any of them is sent
+REFERENCE_BATCH_SIZE = 500
+
+def normalize_rows(rows):
+    """Normalize extracted rows to match API format, one row at a time."""
+    count = 0
+    
+    for row in rows:
         normalized_row = {}
         
-        # Find matching columns
-        row_lower = {k.lower().strip(): v for k, v in row.items()}
+        # Find matching columns; the plan is resolved once per header layout
+        plan = FIELD_RESOLVER.key_plan(row)
+        for target_field, keys in plan:
+            for key in keys:
+                value = row[key]
+                if value and value.strip():
+                    value = value.strip()
+                    normalized_row[target_field] = sys.intern(value) if target_field in INTERNED_FIELDS else value
+                    break
         
-        for target_field, possible_names in column_mappings.items():
-            for name in possible_names:
-                name_lower = name.lower().strip()
-                if name_lower in row_lower:
-                    value = row_lower[name_lower]
-                    if value and value.strip():
-                        normalized_row[target_field] = value.strip()
-                        break
+        # Without a part number column the SS part number is the part number
+        if normalized_row.get('ss_part_no') and not any(field == 'part_no' for field, keys in plan):
+            normalized_row['part_no'] = normalized_row['ss_part_no']
         
         # If we have at least a part_no, add the row
         if normalized_row.get('part_no') or normalized_row.get('description'):
             # Ensure part_no exists - use description if not available
             if not normalized_row.get('part_no'):
-                normalized_row['part_no'] = normalized_row.get('description', f"ITEM_{len(normalized)}")
+                normalized_row['part_no'] = normalized_row.get('description', f"ITEM_{count}")
             
             # Set defaults
             normalized_row.setdefault('status', 'active')
             normalized_row.setdefault('uom', 'pcs')
             
-            normalized.append(normalized_row)
+            count += 1
+            yield normalized_row
+
+def type_rows(rows, rejects=None):
+    """Parse numeric fields of normalized rows column-wise, in batches.
+    
+    Values that don't parse are left out of the item and reported in the
+    optional `rejects` list (see frame_normalizer.save_rejects).
+    """
+    from frame_normalizer import iter_normalized_frames, iter_frame_records
     
-    return normalized
+    frames = iter_normalized_frames(
+        rows, NORMALIZED_FIELDS, NUMERIC_FIELDS,
+        batch_size=TYPE_BATCH_SIZE, rejects=rejects,
+    )
+    return iter_frame_records(frames, INTERNED_FIELDS)
+
+def normalize_data(data):
+    """Normalize extracted data to match API format."""
+    return list(normalize_rows(data))
 
 def save_to_excel(data, excel_path):
     """Save data to Excel file."""
@@ -129,143 +224,752 @@ def save_to_excel(data, excel_path):
         print("⚠️  No data to save!")
         return False
     
-    # Create DataFrame
-    df = pd.DataFrame(data)
-    
-    # Save to Excel
-    df.to_excel(excel_path, index=False, engine='openpyxl')
-    print(f"✅ Saved {len(data)} rows to Excel")
+    writer = open_row_writer(excel_path, NORMALIZED_FIELDS, NUMERIC_FIELDS)
+    for row in data:
+        writer.write(row)
+    writer.save()
+    print(f"✅ Saved {writer.count} rows to {excel_path}")
     return True
 
-def import_items_to_app(items):
-    """Import items to the app via API."""
-    print(f"\n📤 Importing {len(items)} items to the app...")
+def build_part_payload(item, idx):
+    """Build the POST /parts payload for one normalized item."""
+    payload = {
+        'part_no': item.get('part_no', f"ITEM_{idx}"),
+        'brand_name': item.get('brand_name', ''),
+        'description': item.get('description', item.get('part_no', '')),
+        'category_id': item.get('category', ''),
+        'subcategory_id': item.get('subcategory', ''),
+        'application_id': item.get('application', ''),
+        'uom': item.get('uom', 'pcs'),
+        'status': item.get('status', 'active'),
+        'size': item.get('size', ''),
+    }
+    
+    # Add optional fields; type_rows has already parsed these to floats
+    for field in NUMERIC_FIELDS:
+        value = item.get(field)
+        if isinstance(value, float):
+            payload[field] = value
+        elif value:
+            try:
+                payload[field] = float(str(value).replace(',', ''))
+            except (TypeError, ValueError):
+                pass
+    
+    if item.get('master_part_no'):
+        payload['master_part_no'] = item['master_part_no']
+    
+    models = parse_models(item.get('models'))
+    if models:
+        payload['models'] = models
+    
+    # Remove empty strings
+    return {k: v for k, v in payload.items() if v != ''}
+
+def iter_payloads(items, references=None):
+    """Yield (idx, item, payload, body) for the items to send.
+    
+    payload is what build_part_payload made (and what the journal records);
+    body is the request body, with reference names turned into ids by the
+    optional ReferenceCache. Bodies are resolved a batch at a time before
+    any of the batch is yielded - all of a list, REFERENCE_BATCH_SIZE items
+    of a stream - so missing brands and categories are created between
+    batches of requests rather than in the middle of them.
+    """
+    entries = ((idx, item, build_part_payload(item, idx)) for idx, item in enumerate(items, 1))
+    if not references:
+        for idx, item, payload in entries:
+            yield idx, item, payload, payload
+        return
+    
+    batch_size = len(items) if isinstance(items, (list, tuple)) else REFERENCE_BATCH_SIZE
+    while True:
+        batch = list(itertools.islice(entries, max(batch_size, 1)))
+        if not batch:
+            return
+        bodies = [references.apply(payload) for idx, item, payload in batch]
+        for (idx, item, payload), body in zip(batch, bodies):
+            yield idx, item, payload, body
+
+def _start_import(items, total):
+    """Print the import banner and return (total, progress suffix)."""
+    if total is None and hasattr(items, '__len__'):
+        total = len(items)
+    
+    if total is not None:
+        print(f"\n📤 Importing {total} items to the app...")
+    else:
+        print("\n📤 Importing items to the app as they are extracted...")
+    return total, (f"/{total}" if total is not None else "")
+
+def print_import_summary(success_count, error_count, errors):
+    print(f"\n✅ Import Summary:")
+    print(f"   Success: {success_count}")
+    print(f"   Errors: {error_count}")
+    
+    if errors:
+        print(f"\n⚠️  First 10 errors:")
+        for err in errors[:10]:
+            print(f"   {err}")
+
+def part_id_from_response(text):
+    """Return the part id from a create/update response body, if any."""
+    try:
+        return json.loads(text).get('id')
+    except (ValueError, AttributeError):
+        return None
+
+def import_items_to_app(items, total=None, api_base_url=API_BASE_URL, journal=None, references=None):
+    """Import items to the app via API, one POST per item.
+
+    items may be a list or any iterable, e.g. a stream of rows still being
+    extracted; pass total to show progress against a known count. Outcomes
+    are recorded in the optional ImportJournal; an optional ReferenceCache
+    sends brands and categories as resolved ids.
+    """
+    import requests
+    
+    total, progress_total = _start_import(items, total)
+    parts_endpoint = f"{api_base_url}/parts"
     
     success_count = 0
     error_count = 0
     errors = []
     
-    for idx, item in enumerate(items, 1):
+    for idx, item, payload, body in iter_payloads(items, references):
         try:
-            # Prepare API payload
-            payload = {
-                'part_no': item.get('part_no', f"ITEM_{idx}"),
-                'brand_name': item.get('brand_name', ''),
-                'description': item.get('description', item.get('part_no', '')),
-                'category_id': item.get('category', ''),
-                'subcategory_id': item.get('subcategory', ''),
-                'application_id': item.get('application', ''),
-                'uom': item.get('uom', 'pcs'),
-                'status': item.get('status', 'active'),
-            }
-            
-            # Add optional fields
-            if item.get('cost'):
-                try:
-                    payload['cost'] = float(str(item['cost']).replace(',', ''))
-                except:
-                    pass
-            
-            if item.get('price_a'):
-                try:
-                    payload['price_a'] = float(str(item['price_a']).replace(',', ''))
-                except:
-                    pass
-            
-            if item.get('master_part_no'):
-                payload['master_part_no'] = item['master_part_no']
-            
-            # Remove empty strings
-            payload = {k: v for k, v in payload.items() if v != ''}
-            
             # Make API call
-            response = requests.post(PARTS_ENDPOINT, json=payload, timeout=30)
+            with METRICS.timer('http POST /parts', idx):
+                response = requests.post(parts_endpoint, json=body, timeout=30)
             
             if response.status_code in [200, 201]:
                 success_count += 1
+                if journal:
+                    journal.record(payload, True, part_id_from_response(response.text))
                 if idx % 10 == 0:
-                    print(f"  ✅ Imported {idx}/{len(items)} items...")
+                    print(f"  ✅ Imported {idx}{progress_total} items...")
             else:
                 error_count += 1
                 error_msg = f"Item {idx} ({item.get('part_no', 'N/A')}): {response.status_code} - {response.text[:100]}"
                 errors.append(error_msg)
+                if journal:
+                    journal.record(payload, False, error=error_msg)
                 print(f"  ❌ Error importing item {idx}: {response.status_code}")
         
         except Exception as e:
             error_count += 1
             error_msg = f"Item {idx} ({item.get('part_no', 'N/A')}): {str(e)[:100]}"
             errors.append(error_msg)
+            if journal:
+                journal.record(payload, False, error=error_msg)
             print(f"  ❌ Exception importing item {idx}: {str(e)[:100]}")
     
-    print(f"\n✅ Import Summary:")
-    print(f"   Success: {success_count}")
-    print(f"   Errors: {error_count}")
+    print_import_summary(success_count, error_count, errors)
+    return success_count, error_count
+
+def import_items_bulk(items, batch_size=100, total=None, api_base_url=API_BASE_URL, journal=None, references=None):
+    """Import items in batches through POST /parts/bulk-create.
+
+    Each request carries up to batch_size parts over one keep-alive session;
+    the endpoint returns a result per row, which is folded into the same
+    success/error summary as import_items_to_app.
+    """
+    import requests
     
-    if errors:
-        print(f"\n⚠️  First 10 errors:")
-        for err in errors[:10]:
-            print(f"   {err}")
+    total, progress_total = _start_import(items, total)
+    bulk_endpoint = f"{api_base_url}/parts/bulk-create"
+    
+    success_count = 0
+    error_count = 0
+    errors = []
+    
+    entries = iter_payloads(items, references)
+    with requests.Session() as session:
+        while True:
+            entries_batch = list(itertools.islice(entries, batch_size))
+            if not entries_batch:
+                break
+            first_idx, idx = entries_batch[0][0], entries_batch[-1][0]
+            _, batch, payloads, bodies = zip(*entries_batch)
+            
+            try:
+                with METRICS.timer('http POST /parts/bulk-create', first_idx):
+                    response = session.post(bulk_endpoint, json={'parts': list(bodies)}, timeout=max(30, batch_size))
+                if response.status_code != 200:
+                    raise RuntimeError(f"{response.status_code} - {response.text[:100]}")
+                results = response.json().get('results', [])
+            except Exception as e:
+                # The whole batch failed - report every item in it
+                error_count += len(batch)
+                for offset, item in enumerate(batch):
+                    error_msg = f"Item {first_idx + offset} ({item.get('part_no', 'N/A')}): {str(e)[:100]}"
+                    errors.append(error_msg)
+                    if journal:
+                        journal.record(payloads[offset], False, error=error_msg)
+                print(f"  ❌ Error importing items {first_idx}-{idx}: {str(e)[:100]}")
+                continue
+            
+            results_by_index = {result.get('index'): result for result in results}
+            for offset, item in enumerate(batch):
+                result = results_by_index.get(offset)
+                if result and result.get('status') == 'created':
+                    success_count += 1
+                    if journal:
+                        journal.record(payloads[offset], True, result.get('id'))
+                else:
+                    error_count += 1
+                    message = result.get('error', 'unknown error') if result else 'no result returned'
+                    error_msg = f"Item {first_idx + offset} ({item.get('part_no', 'N/A')}): {str(message)[:100]}"
+                    errors.append(error_msg)
+                    if journal:
+                        journal.record(payloads[offset], False, error=error_msg)
+            
+            print(f"  ✅ Imported {idx}{progress_total} items...")
     
+    print_import_summary(success_count, error_count, errors)
     return success_count, error_count
 
-def main():
-    pdf_path = Path("CTC Item Lists.pdf")
-    excel_path = Path("CTC Item Lists.xlsx")
+def skip_journaled_items(items, journal, modified):
+    """Drop items the journal shows as already imported unchanged.
+
+    Items that exist in the app but changed since (or whose update failed)
+    are appended to `modified` as (item, part_id) to be sent as updates;
+    new and previously failed items pass through to the importer.
+    """
+    for idx, item in enumerate(items, 1):
+        state, part_id = journal.lookup(build_part_payload(item, idx))
+        if state == 'unchanged':
+            journal.skipped += 1
+        elif part_id and state in ('modified', 'failed'):
+            modified.append((item, part_id))
+        else:
+            yield item
+
+def update_modified_items(modified, journal=None, api_base_url=API_BASE_URL):
+    """Send items that changed since their last import as PUT /parts/:id.
     
-    if not pdf_path.exists():
-        print(f"❌ PDF file not found: {pdf_path}")
-        return
+    The route replaces the whole record, so each part is fetched first and
+    the item's values are merged onto it; fields the catalogue doesn't
+    carry keep their value in the app.
+    """
+    import requests
     
-    # Step 1: Extract from PDF
-    raw_data = extract_pdf_data(pdf_path)
+    if not modified:
+        return 0, 0
     
-    if not raw_data:
+    print(f"\n🔁 Updating {len(modified)} items that changed since the last import...")
+    success_count = 0
+    error_count = 0
+    errors = []
+    
+    with requests.Session() as session:
+        for idx, (item, part_id) in enumerate(modified, 1):
+            payload = build_part_payload(item, idx)
+            try:
+                with METRICS.timer('http GET /parts/:id', idx):
+                    response = session.get(f"{api_base_url}/parts/{part_id}", timeout=30)
+                if response.status_code == 200:
+                    # The payload's description falls back to the part number; don't let that replace one
+                    changes = {field: value for field, value in payload.items() if field != 'description' or item.get('description')}
+                    with METRICS.timer('http PUT /parts/:id', idx):
+                        response = session.put(f"{api_base_url}/parts/{part_id}", json=update_body(response.json(), changes), timeout=30)
+                ok = response.status_code == 200
+                error_msg = None if ok else f"Item {idx} ({item.get('part_no', 'N/A')}): {response.status_code} - {response.text[:100]}"
+            except Exception as e:
+                ok = False
+                error_msg = f"Item {idx} ({item.get('part_no', 'N/A')}): {str(e)[:100]}"
+            
+            if ok:
+                success_count += 1
+            else:
+                error_count += 1
+                errors.append(error_msg)
+            if journal:
+                journal.record(payload, ok, part_id, error_msg)
+    
+    print_import_summary(success_count, error_count, errors)
+    return success_count, error_count
+
+# Payload field -> field of a part returned by GET /parts, for diffing
+LIVE_FIELDS = {
+    'master_part_no': 'master_part_no',
+    'brand_name': 'brand_name',
+    'description': 'description',
+    'category_id': 'category_name',
+    'subcategory_id': 'subcategory_name',
+    'application_id': 'application_name',
+    'uom': 'uom',
+    'status': 'status',
+    'size': 'size',
+    'cost': 'cost',
+    'price_a': 'price_a',
+    'price_b': 'price_b',
+}
+
+# Price fields that can go through PUT /parts/:id/prices, with its body names
+PRICE_FIELDS = {'cost': 'cost', 'price_a': 'priceA', 'price_b': 'priceB'}
+
+# Body field of PUT /parts/:id -> field of a part returned by GET /parts.
+# The route replaces the whole record, resetting any field left out (hs_code,
+# weight, the master part link, ...), so an update sends all of them.
+UPDATE_FIELDS = {
+    'master_part_no': 'master_part_no',
+    'part_no': 'part_no',
+    'brand_name': 'brand_name',
+    'description': 'description',
+    'category_id': 'category_name',
+    'subcategory_id': 'subcategory_name',
+    'application_id': 'application_id',
+    'hs_code': 'hs_code',
+    'weight': 'weight',
+    'reorder_level': 'reorder_level',
+    'uom': 'uom',
+    'cost': 'cost',
+    'price_a': 'price_a',
+    'price_b': 'price_b',
+    'price_m': 'price_m',
+    'smc': 'smc',
+    'size': 'size',
+    'status': 'status',
+}
+
+def update_body(live_part, changes):
+    """PUT /parts/:id body: the live part's values with `changes` ({field: value}) over them."""
+    body = {field: live_part.get(live_field) for field, live_field in UPDATE_FIELDS.items()}
+    body.update(changes)
+    return body
+
+def part_key(part):
+    """Identity of a part for sync: (part_no, brand_name)."""
+    return str(part.get('part_no') or '').strip(), str(part.get('brand_name') or '').strip()
+
+def fetch_live_parts(api_base_url=API_BASE_URL, page_size=500):
+    """Page through GET /parts once and index the result by part_key."""
+    import requests
+    
+    print(f"\n🔎 Fetching live parts from {api_base_url}/parts...")
+    live = {}
+    page = 1
+    with requests.Session() as session:
+        while True:
+            with METRICS.timer('http GET /parts', page):
+                response = session.get(f"{api_base_url}/parts", params={'page': page, 'limit': page_size}, timeout=60)
+            response.raise_for_status()
+            body = response.json()
+            for part in body.get('data', []):
+                live[part_key(part)] = part
+            if page >= body.get('pagination', {}).get('totalPages', 0):
+                break
+            page += 1
+    print(f"✅ Indexed {len(live)} live parts")
+    return live
+
+def _same_value(new, old):
+    if isinstance(new, float):
+        try:
+            return old is not None and abs(float(old) - new) < 0.005
+        except (TypeError, ValueError):
+            return False
+    return str(new).strip() == str(old if old is not None else '').strip()
+
+def diff_part(payload, live_part):
+    """Return {field: (live value, catalogue value)} for fields that differ.
+
+    Only fields present in the payload are compared, so a blank catalogue
+    cell never clears a value in the app.
+    """
+    return {
+        field: (live_part.get(live_field), payload[field])
+        for field, live_field in LIVE_FIELDS.items()
+        if field in payload and not _same_value(payload[field], live_part.get(live_field))
+    }
+
+class SyncPlan:
+    """Diff of the catalogue against the live parts, planned before anything is sent."""
+    
+    def __init__(self, live):
+        self.live = live
+        self.live_by_part_no = {key[0]: part for key, part in live.items()}
+        self.listed = set()  # every catalogue row's key, also of rows held back from the import
+        self.seen = set()
+        self.creates = []
+        self.created = 0
+        self.unchanged = 0
+        self.moves = 0
+        self.price_updates = []
+        self.field_updates = []
+    
+    def missing(self):
+        """Live parts that no longer appear in the catalogue."""
+        return [part for key, part in self.live.items() if key not in self.seen and key not in self.listed]
+    
+    def iter_listed(self, items):
+        """Note the key of every catalogue row passing through, before any is held back."""
+        for item in items:
+            self.listed.add(part_key(item))
+            yield item
+    
+    def add_items(self, items):
+        """Diff every item against the live index, keeping the ones to create in self.creates."""
+        new_items = []
+        for idx, item in enumerate(items, 1):
+            payload = build_part_payload(item, idx)
+            key = part_key(payload)
+            if key in self.seen:
+                continue
+            self.seen.add(key)
+            
+            live_part = self.live.get(key)
+            if live_part is None:
+                new_items.append((item, payload, key))
+                continue
+            
+            changes = diff_part(payload, live_part)
+            if not changes:
+                self.unchanged += 1
+            elif set(changes) <= set(PRICE_FIELDS):
+                self.price_updates.append((live_part['id'], payload, changes))
+            else:
+                self.field_updates.append((live_part, payload, changes))
+        
+        # Part numbers are unique in the app regardless of brand, so a live
+        # part whose number the catalogue now lists under another brand only
+        # is updated to that brand; creating the item would be refused
+        for item, payload, key in new_items:
+            live_part = self.live_by_part_no.get(key[0])
+            live_key = part_key(live_part) if live_part is not None else None
+            if live_part is not None and live_key not in self.seen and live_key not in self.listed:
+                self.seen.add(live_key)
+                self.moves += 1
+                self.field_updates.append((live_part, payload, diff_part(payload, live_part)))
+            else:
+                self.creates.append(item)
+    
+    def print_summary(self, deleted=None):
+        missing = len(self.missing())
+        print("\n📋 Sync Summary:")
+        print(f"   Live parts: {len(self.live)}")
+        print(f"   Catalogue items: {len(self.seen)}")
+        print(f"   New items: {len(self.creates)} ({self.created} created)")
+        print(f"   Price updates: {len(self.price_updates)}")
+        print(f"   Field updates: {len(self.field_updates)} ({self.moves} moved to another brand)")
+        print(f"   Unchanged: {self.unchanged}")
+        if deleted is None:
+            print(f"   Missing from catalogue: {missing} (kept)")
+        else:
+            print(f"   Missing from catalogue: {missing} ({deleted} deleted)")
+
+def apply_sync_updates(plan, api_base_url=API_BASE_URL, delete_missing=False):
+    """Send the plan's deletions (if asked) and updates; returns deleted count.
+    
+    Run before the creates, so a part number freed by a deletion or a move
+    to another brand can be created again in the same run.
+    """
+    import requests
+    
+    # Price-only changes go through the prices route; other changes are
+    # merged onto the live part, so blank catalogue cells never clear a value
+    updates = [
+        (f"{part_id}/prices", payload, dict({PRICE_FIELDS[field]: new for field, (old, new) in changes.items()}, reason='Catalogue sync'))
+        for part_id, payload, changes in plan.price_updates
+    ] + [
+        (live_part['id'], payload, update_body(live_part, {field: new for field, (old, new) in changes.items()}))
+        for live_part, payload, changes in plan.field_updates
+    ]
+    missing = plan.missing() if delete_missing else []
+    if not updates and not missing:
+        return 0
+    
+    print(f"\n🔁 Applying {len(missing)} deletions and {len(updates)} updates...")
+    success_count = 0
+    error_count = 0
+    errors = []
+    deleted = 0
+    
+    with requests.Session() as session:
+        for part in missing:
+            try:
+                with METRICS.timer('http DELETE /parts/:id', part.get('part_no')):
+                    response = session.delete(f"{api_base_url}/parts/{part['id']}", timeout=30)
+                if response.status_code == 200:
+                    deleted += 1
+                    continue
+                error_msg = f"{part.get('part_no')} (delete): {response.status_code} - {response.text[:100]}"
+            except Exception as e:
+                error_msg = f"{part.get('part_no')} (delete): {str(e)[:100]}"
+            error_count += 1
+            errors.append(error_msg)
+        
+        for path, payload, body in updates:
+            try:
+                route = 'http PUT /parts/:id/prices' if path.endswith('/prices') else 'http PUT /parts/:id'
+                with METRICS.timer(route, payload['part_no']):
+                    response = session.put(f"{api_base_url}/parts/{path}", json=body, timeout=30)
+                if response.status_code == 200:
+                    success_count += 1
+                    continue
+                error_msg = f"{payload['part_no']}: {response.status_code} - {response.text[:100]}"
+            except Exception as e:
+                error_msg = f"{payload['part_no']}: {str(e)[:100]}"
+            error_count += 1
+            errors.append(error_msg)
+    
+    print_import_summary(success_count + deleted, error_count, errors)
+    return deleted
+
+def check_backend(api_base_url=API_BASE_URL):
+    """Return True if the backend API answers the parts list endpoint."""
+    import requests
+    
+    try:
+        test_response = requests.get(f"{api_base_url}/parts?limit=1", timeout=5)
+        if test_response.status_code == 200:
+            return True
+        print(f"❌ Backend not responding correctly. Status: {test_response.status_code}")
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Cannot connect to backend at {api_base_url}")
+        print(f"   Error: {e}")
+        print(f"   Please make sure the backend server is running.")
+    return False
+
+def add_import_args(parser):
+    """Add the options that control how items are sent to the API."""
+    parser.add_argument(
+        '--api-url', default=API_BASE_URL, metavar='URL',
+        help=f"base URL of the backend API (default: {API_BASE_URL})"
+    )
+    parser.add_argument(
+        '--batch-size', type=int, default=0, metavar='N',
+        help="send N parts per request to /parts/bulk-create (default: 0, one POST per item)"
+    )
+    parser.add_argument(
+        '--concurrency', type=int, default=0, metavar='N',
+        help="POST items with N concurrent requests over a pooled session (default: 0, sequential)"
+    )
+    parser.add_argument(
+        '--rate', type=float, default=0, metavar='R',
+        help="with --concurrency, send at most R requests per second (default: 0, unlimited)"
+    )
+    parser.add_argument(
+        '--retries', type=int, default=3, metavar='N',
+        help="with --concurrency, retry 5xx responses and timeouts up to N times (default: 3)"
+    )
+    parser.add_argument(
+        '--no-reference-cache', action='store_true',
+        help="send brand/category/application names as they are instead of resolving them to ids from the dropdown API"
+    )
+
+def add_journal_args(parser):
+    """Add the checkpoint journal options of a plain import (sync diffs against the live parts instead)."""
+    parser.add_argument(
+        '--journal', default=DEFAULT_JOURNAL_PATH, metavar='PATH',
+        help=f"checkpoint journal of imported items, used to resume and skip unchanged items (default: {DEFAULT_JOURNAL_PATH})"
+    )
+    parser.add_argument(
+        '--no-journal', action='store_true',
+        help="send every item, without reading or writing the journal"
+    )
+    parser.add_argument(
+        '--reset-journal', action='store_true',
+        help="forget previously imported items, e.g. after the parts table was wiped"
+    )
+
+def add_sync_args(parser, prefix=''):
+    """Add the options of the catalogue sync mode (help prefixed e.g. "with --sync, ")."""
+    parser.add_argument(
+        '--delete-missing', action='store_true',
+        help=f"{prefix}delete live parts that are no longer in the catalogue"
+    )
+    parser.add_argument(
+        '--dry-run', action='store_true',
+        help=f"{prefix}only print the diff summary"
+    )
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Extract items from CTC Item Lists.pdf and import them into the app")
+    add_import_args(parser)
+    add_journal_args(parser)
+    parser.add_argument(
+        '--sync', action='store_true',
+        help="diff the catalogue against the live parts and send only creates and changed fields"
+    )
+    add_sync_args(parser, "with --sync, ")
+    parser.add_argument(
+        '--source', type=Path, default=Path("CTC Item Lists.pdf"), metavar='PATH',
+        help="catalogue to read: the PDF, or a JSON export such as CTC_Item_Lists_with_size.json (default: %(default)s)"
+    )
+    add_output_arg(parser)
+    add_cache_args(parser)
+    add_memory_args(parser)
+    add_instrumentation_args(parser)
+    args = parser.parse_args(argv)
+    if args.sync and (args.no_journal or args.reset_journal or args.journal != DEFAULT_JOURNAL_PATH):
+        parser.error("--journal, --no-journal and --reset-journal don't apply to --sync")
+    return args
+
+def save_raw_text(pdf_path, text_path="pdf_extracted_text.txt"):
+    """Save the PDF's raw text for manual review when no table rows were found."""
+    import pdfplumber
+    
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            all_text = []
+            for page in pdf.pages:
+                text = page.extract_text()
+                if text:
+                    all_text.append(text)
+            
+            # Save raw text for manual review
+            with open(text_path, "w", encoding="utf-8") as f:
+                f.write("\n\n".join(all_text))
+            print(f"   Saved raw text to {text_path} for review")
+    except Exception as e:
+        print(f"   Error: {e}")
+
+def process_catalogue(args, source_path, do_import=None):
+    """Extract, normalize and save the catalogue, then import or sync it.
+    
+    source_path is the catalogue PDF or a JSON export of it. do_import=None
+    asks on the terminal; the CLI subcommands pass True or False. Sync mode
+    is selected by args.sync.
+    """
+    from frame_normalizer import save_rejects
+    
+    excel_path = args.output
+    
+    if not source_path.exists():
+        print(f"❌ Catalogue file not found: {source_path}")
+        return False
+    
+    # Step 1: Extract from the JSON export or the PDF (rows are streamed
+    # item by item / page by page)
+    if is_json_source(source_path):
+        raw_rows = iter_json_data(source_path)
+    else:
+        raw_rows = iter_pdf_data(source_path, open_cache(args), open_lifecycle(args))
+    first_row = next(raw_rows, None)
+    
+    if first_row is None and is_json_source(source_path):
+        print("❌ No items found in JSON!")
+        return False
+    if first_row is None:
         print("❌ No data extracted from PDF!")
         print("   Trying alternative extraction method...")
         # Try text-based extraction
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                all_text = []
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        all_text.append(text)
-                
-                # Save raw text for manual review
-                with open("pdf_extracted_text.txt", "w", encoding="utf-8") as f:
-                    f.write("\n\n".join(all_text))
-                print("   Saved raw text to pdf_extracted_text.txt for review")
-        except Exception as e:
-            print(f"   Error: {e}")
-        return
+        save_raw_text(source_path)
+        return False
     
-    # Step 2: Normalize data
+    # Step 2: Decide on the import up front, so it can run while the
+    # remaining pages are still being extracted
+    if do_import is None:
+        print("\n" + "="*60)
+        response = input("Do you want to import items to the app now? (y/n): ")
+        do_import = response.lower() == 'y'
+    do_import = do_import and check_backend(args.api_url)
+    
+    # Step 3: Normalize -> Excel -> app, one row at a time
     print("\n🔄 Normalizing data...")
-    normalized_data = normalize_data(raw_data)
-    print(f"✅ Normalized {len(normalized_data)} items")
-    
-    # Step 3: Save to Excel
-    if save_to_excel(normalized_data, excel_path):
-        print(f"✅ Excel file created: {excel_path}")
-    
-    # Step 4: Import to app
-    print("\n" + "="*60)
-    response = input("Do you want to import items to the app now? (y/n): ")
-    if response.lower() == 'y':
-        # Check if backend is running
-        try:
-            test_response = requests.get(f"{API_BASE_URL}/parts?limit=1", timeout=5)
-            if test_response.status_code == 200:
-                import_items_to_app(normalized_data)
-            else:
-                print(f"❌ Backend not responding correctly. Status: {test_response.status_code}")
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Cannot connect to backend at {API_BASE_URL}")
-            print(f"   Error: {e}")
-            print(f"   Please make sure the backend server is running.")
+    rejects = []
+    normalized_rows = type_rows(normalize_rows(itertools.chain([first_row], raw_rows)), rejects)
+    
+    # The live parts are the reference in sync mode, so the journal is not
+    # used. Every catalogue row is listed in the plan before dedup holds any
+    # back, so --delete-missing keeps the live parts of held-back rows.
+    plan = None
+    if do_import and args.sync:
+        plan = SyncPlan(fetch_live_parts(args.api_url))
+        normalized_rows = plan.iter_listed(normalized_rows)
+    
+    # Duplicates are dropped before the output file; conflicting variants
+    # and part numbers another brand already uses are held back before any
+    # request
+    dedup = DedupIndex(NORMALIZED_FIELDS)
+    writer = open_row_writer(excel_path, NORMALIZED_FIELDS, NUMERIC_FIELDS)
+    items = writer.tee(dedup.iter_unique(normalized_rows))
+    if do_import:
+        items = dedup.iter_importable(items)
+    
+    journal = None
+    modified = []
+    deleted = 0
+    if plan:
+        # The whole diff is planned first and deletions and updates are sent
+        # before the creates, which may reuse the part numbers they free
+        plan.add_items(items)
+        items = plan.creates
+        if args.dry_run:
+            do_import = False
+        else:
+            deleted = apply_sync_updates(plan, args.api_url, args.delete_missing)
+    elif do_import and not args.no_journal:
+        journal = ImportJournal(args.journal)
+        if args.reset_journal:
+            journal.reset()
+        items = skip_journaled_items(items, journal, modified)
+    
+    # Brands and categories are resolved to ids once, client-side
+    references = None
+    if do_import and not args.no_reference_cache:
+        from reference_cache import ReferenceCache
+        references = ReferenceCache(args.api_url)
+        if not references.load():
+            references = None
+    
+    success_count = 0
+    if do_import and args.batch_size > 0:
+        success_count, _ = import_items_bulk(items, args.batch_size, api_base_url=args.api_url, journal=journal, references=references)
+    elif do_import and args.concurrency > 0:
+        from async_importer import import_items_async
+        success_count, _ = import_items_async(
+            items, api_base_url=args.api_url, concurrency=args.concurrency,
+            rate=args.rate, max_retries=args.retries, journal=journal, references=references,
+        )
+    elif do_import:
+        success_count, _ = import_items_to_app(items, api_base_url=args.api_url, journal=journal, references=references)
     else:
-        print("⏭️  Skipping import. You can import manually later using the Excel file.")
+        for _ in items:
+            pass
+    print(f"✅ Normalized {writer.count} items")
+    
+    if references:
+        references.print_summary()
+        references.close()
+    
+    if plan:
+        plan.created = success_count
+        plan.print_summary(deleted if args.delete_missing else None)
+    
+    if journal:
+        update_modified_items(modified, journal, api_base_url=args.api_url)
+        print(f"⏭️  Skipped {journal.skipped} items already imported unchanged")
+        journal.close()
+    
+    # Step 4: Save Excel (or the format chosen by --output)
+    writer.save()
+    print(f"✅ Output file created: {excel_path}")
+    
+    dedup.print_summary()
+    dedup_path = excel_path.with_name(f"{excel_path.stem}_dedup.json")
+    dedup.save_report(dedup_path)
+    print(f"   Dedup report: {dedup_path}")
+    
+    rejects_path = excel_path.with_name(f"{excel_path.stem}_rejects.csv")
+    rejected = save_rejects(rejects, rejects_path)
+    if rejected:
+        print(f"⚠️  {rejected} prices could not be parsed as numbers, see {rejects_path}")
+    
+    if not do_import:
+        print("⏭️  Skipping import. You can import manually later using the output file.")
+    return True
+
+def run(args):
+    """Extract, save and optionally import the catalogue as selected by args."""
+    process_catalogue(args, args.source)
+
+def main():
+    args = parse_args()
+    with instrumented(args):
+        run(args)
 
 if __name__ == "__main__":
     main()
-
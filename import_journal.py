@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Checkpoint journal for resumable, idempotent imports.
+
+Every item sent to the API is recorded in a local SQLite file with a hash of
+its payload and the outcome (and the part id on success). On the next run
+items already imported with the same content are skipped, items that were
+imported but have since changed are sent as updates, and failed or new items
+are sent again - so an interrupted import resumes as a delta instead of a
+wipe and full re-import.
+"""
+
+import json
+import sqlite3
+import hashlib
+import time
+import threading
+
+DEFAULT_JOURNAL_PATH = ".import_journal.sqlite3"
+
+class ImportJournal:
+    """Per-item import outcomes keyed by (part_no, brand_name)."""
+
+    def __init__(self, path=DEFAULT_JOURNAL_PATH):
+        self.path = path
+        self.skipped = 0
+        # Lookups may run on a worker thread (the async importer pulls items
+        # off the event loop), so share one connection behind a lock
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            " part_no TEXT NOT NULL,"
+            " brand_name TEXT NOT NULL,"
+            " content_hash TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " part_id TEXT,"
+            " error TEXT,"
+            " updated_at REAL NOT NULL,"
+            " PRIMARY KEY (part_no, brand_name))"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(payload):
+        return str(payload.get('part_no', '')), str(payload.get('brand_name', ''))
+
+    @staticmethod
+    def content_hash(payload):
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def lookup(self, payload):
+        """Classify a payload against the journal.
+
+        Returns (state, part_id) where state is 'new', 'unchanged',
+        'modified' (imported before with different content) or 'failed'.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash, status, part_id FROM items WHERE part_no = ? AND brand_name = ?",
+                self._key(payload),
+            ).fetchone()
+        if row is None:
+            return 'new', None
+        content_hash, status, part_id = row
+        if status != 'imported':
+            return 'failed', part_id
+        if content_hash == self.content_hash(payload):
+            return 'unchanged', part_id
+        return 'modified', part_id
+
+    def record(self, payload, ok, part_id=None, error=None):
+        """Store the outcome of sending payload to the API."""
+        part_no, brand_name = self._key(payload)
+        with self._lock:
+            if not ok:
+                # Keep the id of an earlier successful import so a failed
+                # update can still be retried as an update
+                previous = self._conn.execute(
+                    "SELECT part_id FROM items WHERE part_no = ? AND brand_name = ?", (part_no, brand_name)
+                ).fetchone()
+                part_id = part_id or (previous[0] if previous else None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO items"
+                " (part_no, brand_name, content_hash, status, part_id, error, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    part_no, brand_name, self.content_hash(payload),
+                    'imported' if ok else 'failed', part_id,
+                    None if ok else str(error)[:500], time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def counts(self):
+        """Return {status: count} over the whole journal."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM items GROUP BY status").fetchall())
+
+    def reset(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM items")
+            self._conn.commit()
+
+    def close(self):
+        self._conn.close()
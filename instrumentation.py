@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Stage timers, counters and profiling for the conversion scripts.
+
+Code paths wrap their stages in METRICS.timer("stage", key) - opening the
+PDF, per-page table extraction, the text fallback, header detection,
+normalization, DataFrame builds, output writes and every HTTP call - and
+bump METRICS.count("name") for events. With --metrics the scripts print
+totals, percentiles and the slowest keys (pages, items) per stage; with
+--profile they also dump cProfile stats and a tracemalloc snapshot.
+"""
+
+import json
+import math
+import time
+from contextlib import contextmanager
+
+# Slowest keys (e.g. page numbers) kept per stage
+SLOWEST = 5
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[idx]
+
+class Metrics:
+    """Durations per stage (optionally tagged with a key) and event counters."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.timings = {}
+        self.counters = {}
+
+    @contextmanager
+    def timer(self, stage, key=None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start, key)
+
+    def add(self, stage, seconds, key=None):
+        self.timings.setdefault(stage, []).append((seconds, key))
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self):
+        """Picklable copy of the collected data, e.g. to return from a worker process."""
+        return {'timings': {stage: list(values) for stage, values in self.timings.items()},
+                'counters': dict(self.counters)}
+
+    def merge(self, snapshot):
+        """Add the data of a snapshot taken in another process."""
+        for stage, values in snapshot['timings'].items():
+            self.timings.setdefault(stage, []).extend(tuple(value) for value in values)
+        for name, n in snapshot['counters'].items():
+            self.count(name, n)
+
+    def summary(self):
+        """Return {stage: totals, percentiles, slowest keys} plus the counters."""
+        stages = {}
+        for stage, values in self.timings.items():
+            durations = sorted(seconds for seconds, key in values)
+            slowest = sorted((value for value in values if value[1] is not None), key=lambda v: -v[0])
+            stages[stage] = {
+                'count': len(durations),
+                'total': round(sum(durations), 4),
+                'mean': round(sum(durations) / len(durations), 6),
+                'p50': round(percentile(durations, 0.50), 6),
+                'p95': round(percentile(durations, 0.95), 6),
+                'p99': round(percentile(durations, 0.99), 6),
+                'max': round(durations[-1], 6),
+                'slowest': [[key, round(seconds, 6)] for seconds, key in slowest[:SLOWEST]],
+            }
+        return {'stages': stages, 'counters': dict(self.counters)}
+
+    def print_report(self):
+        summary = self.summary()
+        print("\n⏱️  Stage timings (seconds):")
+        print(f"   {'stage':<24} {'count':>7} {'total':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+        for stage, stats in sorted(summary['stages'].items(), key=lambda item: -item[1]['total']):
+            print(f"   {stage:<24} {stats['count']:>7} {stats['total']:>9.3f} {stats['p50']:>9.4f} "
+                  f"{stats['p95']:>9.4f} {stats['p99']:>9.4f} {stats['max']:>9.4f}")
+        for stage, stats in summary['stages'].items():
+            if stats['slowest']:
+                slowest = ', '.join(f"{key} ({seconds:.3f}s)" for key, seconds in stats['slowest'])
+                print(f"   🐢 Slowest {stage}: {slowest}")
+        if summary['counters']:
+            print("🔢 Counters: " + ', '.join(f"{name}={n}" for name, n in sorted(summary['counters'].items())))
+
+# Process-wide metrics used by the scripts
+METRICS = Metrics()
+
+class Profiler:
+    """cProfile plus tracemalloc around a run, dumped to <prefix>.prof / _memory.txt / _metrics.json."""
+
+    def __init__(self, prefix):
+        import cProfile
+
+        self.prefix = prefix
+        self._profile = cProfile.Profile()
+
+    def start(self):
+        import tracemalloc
+
+        tracemalloc.start()
+        self._profile.enable()
+
+    def stop(self, metrics=METRICS):
+        import pstats
+        import tracemalloc
+
+        self._profile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self._profile.dump_stats(f"{self.prefix}.prof")
+        with open(f"{self.prefix}_memory.txt", 'w', encoding='utf-8') as f:
+            f.write(f"Traced memory: current {current / 1024 / 1024:.1f} MB, peak {peak / 1024 / 1024:.1f} MB\n\n")
+            for stat in snapshot.statistics('lineno')[:50]:
+                f.write(f"{stat}\n")
+        with open(f"{self.prefix}_metrics.json", 'w', encoding='utf-8') as f:
+            json.dump(metrics.summary(), f, indent=2)
+
+        print(f"\n🔬 Profile: {self.prefix}.prof, {self.prefix}_memory.txt, {self.prefix}_metrics.json "
+              f"(peak traced memory {peak / 1024 / 1024:.1f} MB)")
+        pstats.Stats(self._profile).sort_stats('cumulative').print_stats(15)
+
+def add_instrumentation_args(parser):
+    """Add the --metrics / --profile options shared by the scripts."""
+    parser.add_argument(
+        '--metrics', action='store_true',
+        help="print per-stage timings, percentiles and the slowest pages at the end"
+    )
+    parser.add_argument(
+        '--profile', nargs='?', const='profile', metavar='PREFIX',
+        help="also dump cProfile stats and a tracemalloc snapshot to PREFIX.prof / PREFIX_memory.txt (default: profile)"
+    )
+
+@contextmanager
+def instrumented(args):
+    """Run the body with the profiler/report selected by the command-line options."""
+    profiler = Profiler(args.profile) if args.profile else None
+    if profiler:
+        profiler.start()
+    try:
+        yield METRICS
+    finally:
+        if profiler:
+            profiler.stop()
+        if args.metrics or profiler:
+            METRICS.print_report()
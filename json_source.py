@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Streaming source for JSON catalogue exports such as CTC_Item_Lists_with_size.json.
+
+The export is one top-level array of flat item objects (with the app's
+spelling of the keys: "Discription", "Catigory", "sub catigory", ...) plus
+a nested "models" list per item. Items are decoded one at a time from a
+sliding text buffer with json.JSONDecoder.raw_decode, so memory stays at
+one chunk plus one item however large the file grows, and each item is
+turned into a flat {key: text} row for the normalization layer. Nested
+lists are kept as a compact JSON string - the same "models" format the
+app's CSV/Excel export writes - and parse_models turns it back into the
+models payload of POST /parts.
+"""
+
+import re
+import json
+
+# Characters read from the file per refill of the decode buffer
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'\s*')
+
+def iter_json_array(path, chunk_size=CHUNK_SIZE):
+    """Yield the elements of the top-level JSON array in `path` one by one."""
+    decoder = json.JSONDecoder()
+    with open(path, encoding='utf-8-sig') as f:
+        buffer = ''
+        pos = 0
+        eof = False
+        state = 'open'  # '[' expected, then 'first' element or ']', then 'next' (',' or ']') / 'value'
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                if eof:
+                    raise ValueError(f"{path}: unexpected end of the JSON array")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+
+            char = buffer[pos]
+            if state == 'open':
+                if char != '[':
+                    raise ValueError(f"{path}: expected a JSON array, found {char!r}")
+                pos += 1
+                state = 'first'
+            elif state == 'next' or (state == 'first' and char == ']'):
+                if char == ']':
+                    return
+                if char != ',':
+                    raise ValueError(f"{path}: expected ',' or ']' between array elements, found {char!r}")
+                pos += 1
+                state = 'value'
+            else:
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if eof:
+                        raise ValueError(f"{path}: invalid array element: {e.msg}") from None
+                    end = None
+                # Only accept an element once the ',' or ']' after it is in the
+                # buffer: a number at the buffer edge ("2." of "2.5") may be cut short
+                if end is not None and not eof:
+                    after = _WHITESPACE.match(buffer, end).end()
+                    if after == len(buffer) or buffer[after] not in ',]':
+                        end = None
+                if end is None:
+                    chunk = f.read(chunk_size)
+                    eof = not chunk
+                    buffer, pos = buffer[pos:] + chunk, 0
+                    continue
+                yield item
+                pos = end
+                state = 'next'
+
+def format_models(models):
+    """Compact JSON text of a nested list, as the app's export writes it."""
+    return json.dumps(models, separators=(',', ':'), ensure_ascii=False) if models else ''
+
+def iter_json_rows(path, chunk_size=CHUNK_SIZE):
+    """Yield each item of a JSON export as a flat {key: text} row."""
+    for item in iter_json_array(path, chunk_size):
+        if not isinstance(item, dict):
+            continue
+        yield {
+            key: format_models(value) if isinstance(value, list)
+            else '' if value is None else str(value)
+            for key, value in item.items()
+        }
+
+def parse_models(text):
+    """Turn a "models" cell into the [{name, qty_used}, ...] list of POST /parts."""
+    if not text:
+        return []
+    try:
+        models = json.loads(text)
+    except (TypeError, ValueError):
+        return []
+
+    parsed = []
+    for model in models if isinstance(models, list) else []:
+        if not isinstance(model, dict):
+            continue
+        name = str(model.get('model') or model.get('name') or '').strip()
+        if not name:
+            continue
+        try:
+            qty = int(float(str(model.get('qty') or model.get('qty_used') or 1).replace(',', '')))
+        except (TypeError, ValueError):
+            qty = 1
+        parsed.append({'name': name, 'qty_used': qty if qty > 0 else 1})
+    return parsed
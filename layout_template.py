@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Layout templates for catalogues whose pages all share one column layout.
+
+Instead of running pdfplumber's table detection (line/edge finding) on every
+page, the column x-boundaries and header row are learned once - from the
+first few pages, or from a saved template file - and every page is then
+read from page.extract_words() by bucketing words into those fixed columns.
+Pages that table detection would miss (no ruling lines, or rows that spill
+onto the next page) come out with the same columns as every other page.
+"""
+
+import json
+from bisect import bisect_right
+from pathlib import Path
+
+from header_resolver import clean_header
+
+# Words whose tops are within this many points belong to the same line
+LINE_TOLERANCE = 3
+
+# Bumped when extract_table reads pages differently, so cached pages are read again
+READER_VERSION = 2
+
+class LayoutTemplate:
+    """Fixed column boundaries plus the header row of a catalogue table.
+
+    edges holds the x positions of the column boundaries (one more than the
+    number of columns); top is where the table starts on the page and bottom
+    where the sampled tables ended - a longer table is read past it.
+    """
+
+    def __init__(self, edges, header, top=0, bottom=None):
+        self.edges = [float(x) for x in edges]
+        self.header = list(header)
+        self.top = float(top)
+        self.bottom = float(bottom) if bottom is not None else None
+        self._header_key = [clean_header(cell or '') for cell in self.header]
+
+    def as_dict(self):
+        return {'edges': self.edges, 'header': self.header, 'top': self.top, 'bottom': self.bottom}
+
+    def settings(self):
+        """Identify this template in the page cache key, like table settings do."""
+        return {'layout_template': self.as_dict(), 'reader_version': READER_VERSION}
+
+    def save(self, path):
+        Path(path).write_text(json.dumps(self.as_dict(), indent=2), encoding='utf-8')
+
+    @classmethod
+    def load(cls, path):
+        return cls(**json.loads(Path(path).read_text(encoding='utf-8')))
+
+    def _column(self, word):
+        """Index of the column holding the word's horizontal centre, or None."""
+        center = (word['x0'] + word['x1']) / 2
+        idx = bisect_right(self.edges, center) - 1
+        return idx if 0 <= idx < len(self.edges) - 1 else None
+
+    def _table_lines(self, words):
+        """Group the words below the table top into lines and keep the table's lines.
+
+        Lines above bottom are always kept. Below it the table goes on while
+        each line follows the previous one within the row spacing seen above
+        bottom, so a page with more rows than the sampled ones is read to its
+        end but text further down the page is not.
+        """
+        lines = []
+        line_top = None
+        for word in sorted(words, key=lambda word: (word['top'], word['x0'])):
+            if word['top'] < self.top - LINE_TOLERANCE:
+                continue
+            if line_top is None or word['top'] - line_top > LINE_TOLERANCE:
+                lines.append([])
+                line_top = word['top']
+            lines[-1].append(word)
+        if self.bottom is None:
+            return lines
+
+        row_gap = 0
+        for idx, line in enumerate(lines):
+            if max(word['bottom'] for word in line) <= self.bottom + LINE_TOLERANCE:
+                if idx:
+                    row_gap = max(row_gap, line[0]['top'] - lines[idx - 1][0]['top'])
+            elif not idx or line[0]['top'] - lines[idx - 1][0]['top'] > row_gap + LINE_TOLERANCE:
+                return lines[:idx]
+        return lines
+
+    def extract_table(self, page):
+        """Read one page into a table (header row first) by bucketing its words.
+
+        A line with nothing in the first column continues the previous row
+        (e.g. a wrapped description); repeated header lines are skipped.
+        """
+        lines = self._table_lines(page.extract_words())
+        column_count = len(self.edges) - 1
+        rows = []
+        for line in lines:
+            cells = [[] for _ in range(column_count)]
+            for word in line:
+                idx = self._column(word)
+                if idx is not None:
+                    cells[idx].append(word['text'])
+            row = [' '.join(cell) for cell in cells]
+            if not any(row) or [clean_header(cell) for cell in row] == self._header_key:
+                continue
+            if row[0] or not rows:
+                rows.append(row)
+            else:
+                rows[-1] = [' '.join(filter(None, pair)) for pair in zip(rows[-1], row)]
+
+        return [list(self.header)] + rows
+
+def learn_template(pages, find_header_row, table_settings=None):
+    """Learn a LayoutTemplate from the tables found on the given pages.
+
+    find_header_row(rows) returns the index of a table's header row or None.
+    The first table with a header and fully split header cells sets the
+    columns; the table region spans every sampled table with the same
+    columns, its bottom only as far as the longest of them. Returns None
+    if no such table is found.
+    """
+    template = None
+    for page in pages:
+        for table in page.find_tables(table_settings or {}):
+            rows = table.extract()
+            header_idx = find_header_row(rows)
+            if template is None:
+                if header_idx is None:
+                    continue
+                cells = table.rows[header_idx].cells
+                if any(cell is None for cell in cells):
+                    continue
+                edges = [cell[0] for cell in cells] + [cells[-1][2]]
+                template = LayoutTemplate(edges, rows[header_idx], cells[0][1], table.bbox[3])
+            elif _same_columns(table, template):
+                template.top = min(template.top, table.bbox[1])
+                template.bottom = max(template.bottom, table.bbox[3])
+    return template
+
+def _same_columns(table, template, tolerance=1.0):
+    x0, x1 = table.bbox[0], table.bbox[2]
+    return abs(x0 - template.edges[0]) <= tolerance and abs(x1 - template.edges[-1]) <= tolerance
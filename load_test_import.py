@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Load-test the importers against the local mock parts API.
+
+Each case starts a fresh mock_parts_api.py in its own process - with the
+latency, error rate and throttling given here - and sends the same items
+through one importer in this process:
+
+    sequential   import_items_to_app: one POST /parts at a time
+    bulk         import_items_bulk: POST /parts/bulk-create, per --batch-sizes
+    async        import_items_async: concurrent POSTs, per --concurrency
+
+and reports items/sec, request latency p50/p95/p99 (as the importer saw
+it), retries and the responses the mock sent per status. The items are
+synthetic (see synthetic_catalogue.py) unless --source names a catalogue
+PDF or JSON export. Results are written to a JSON file; pass an earlier
+file with --compare to flag throughput regressions:
+
+    python load_test_import.py --items 2000 --latency 30 --jitter 20 --error-rate 0.01 --throttle 300
+    python load_test_import.py --modes async --concurrency 8,32,64 --output after.json --compare before.json
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import subprocess
+import urllib.request
+from pathlib import Path
+from datetime import datetime, timezone
+from contextlib import contextmanager, redirect_stdout
+
+from synthetic_catalogue import synthetic_row
+from json_source import format_models
+from instrumentation import METRICS
+from mock_parts_api import add_fault_args
+from benchmark_extraction import git_commit, parse_list
+
+MODES = ['sequential', 'bulk', 'async']
+DEFAULT_OUTPUT = "load_test_results.json"
+STAGES = {'bulk': 'http POST /parts/bulk-create'}
+
+def synthetic_items(count, seed=1):
+    """`count` normalized items with unique part numbers, shaped like type_rows output."""
+    rng = random.Random(seed)
+    items = []
+    for n in range(1, count + 1):
+        cells = synthetic_row(n, rng)
+        item = {
+            'part_no': cells[0],
+            'brand_name': cells[8],
+            'description': cells[3],
+            'category': cells[5],
+            'subcategory': cells[6],
+            'uom': 'pcs',
+            'status': 'active',
+            'size': cells[7],
+            'cost': float(cells[11].replace(',', '')),
+            'price_a': float(cells[13]),
+            'models': format_models([{'model': cells[15], 'qty': cells[16]}]),
+        }
+        if cells[14]:
+            item['price_b'] = float(cells[14])
+        items.append(item)
+    return items
+
+def catalogue_items(source_path):
+    """The items an import of the catalogue would send (normalized, deduplicated)."""
+    from dedup_index import DedupIndex
+    from import_items_from_pdf import (
+        NORMALIZED_FIELDS, is_json_source, iter_json_data, iter_pdf_data, normalize_rows, type_rows,
+    )
+
+    with redirect_stdout(io.StringIO()):
+        rows = iter_json_data(source_path) if is_json_source(source_path) else iter_pdf_data(source_path)
+        dedup = DedupIndex(NORMALIZED_FIELDS)
+        return list(dedup.iter_importable(dedup.iter_unique(type_rows(normalize_rows(rows)))))
+
+def fault_argv(args):
+    """mock_parts_api.py options reproducing the fault options given here."""
+    argv = []
+    for option in ('latency', 'jitter', 'row_latency', 'error_rate', 'throttle', 'burst', 'seed'):
+        value = getattr(args, option)
+        if value:
+            argv += ['--' + option.replace('_', '-'), str(value)]
+    if args.error_rate and args.error_status != 500:
+        argv += ['--error-status', str(args.error_status)]
+    return argv
+
+@contextmanager
+def mock_server(argv):
+    """Run mock_parts_api.py on a free port in a child process; yields its API base URL."""
+    script = str(Path(__file__).with_name('mock_parts_api.py'))
+    process = subprocess.Popen(
+        [sys.executable, script, '--port', '0'] + argv,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+    )
+    try:
+        line = process.stdout.readline()
+        if 'http://' not in line:
+            raise RuntimeError(f"mock server did not start: {process.stderr.read().strip()[-200:]}")
+        yield line.split()[-1]
+    finally:
+        process.terminate()
+        process.wait()
+
+def mock_stats(api_base_url):
+    stats_url = api_base_url[:-len('/api')] + '/__mock__/stats'
+    with urllib.request.urlopen(stats_url, timeout=10) as response:
+        return json.load(response)
+
+def _run_importer(case, items, api_base_url, args):
+    from import_items_from_pdf import import_items_to_app, import_items_bulk
+
+    references = None
+    if not args.no_reference_cache:
+        from reference_cache import ReferenceCache
+        references = ReferenceCache(api_base_url)
+        if not references.load():
+            references = None
+
+    try:
+        if case['mode'] == 'bulk':
+            return import_items_bulk(items, case['batch_size'], api_base_url=api_base_url, references=references)
+        if case['mode'] == 'async':
+            from async_importer import import_items_async
+            return import_items_async(
+                items, api_base_url=api_base_url, concurrency=case['concurrency'],
+                rate=args.rate, max_retries=args.retries, references=references,
+            )
+        return import_items_to_app(items, api_base_url=api_base_url, references=references)
+    finally:
+        if references:
+            references.close()
+
+def run_case(case, items, args):
+    """Import `items` into a fresh mock with one importer; returns its result dict."""
+    METRICS.reset()
+    with mock_server(fault_argv(args)) as api_base_url:
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            success, errors = _run_importer(case, items, api_base_url, args)
+        seconds = time.perf_counter() - start
+        server = mock_stats(api_base_url)
+
+    latency = METRICS.summary()['stages'].get(STAGES.get(case['mode'], 'http POST /parts'), {})
+    route = 'POST /api/parts/bulk-create' if case['mode'] == 'bulk' else 'POST /api/parts'
+    responses = server['responses'].get(route, {})
+    return dict(
+        case,
+        items=len(items),
+        created=success,
+        errors=errors,
+        seconds=round(seconds, 4),
+        items_per_sec=round(success / seconds, 2),
+        requests=latency.get('count', 0),
+        latency_ms={name: round(latency.get(name, 0) * 1000, 2) for name in ('p50', 'p95', 'p99', 'max')},
+        retries=METRICS.counters.get('http_retries', 0),
+        responses=responses,
+        error_responses={status: n for status, n in responses.items() if int(status) >= 400},
+        parts_stored=server['parts'],
+        injected=server['faults'],
+    )
+
+def case_label(case):
+    if case['mode'] == 'bulk':
+        return f"bulk x{case['batch_size']}"
+    if case['mode'] == 'async':
+        return f"async c{case['concurrency']}"
+    return case['mode']
+
+def compare_results(results, conditions, baseline_path, threshold):
+    """Print items/sec against a baseline file; returns the number of regressions."""
+    baseline = json.loads(Path(baseline_path).read_text(encoding='utf-8'))
+    previous = {case_label(result): result for result in baseline.get('results', []) if 'error' not in result}
+    regressions = 0
+    print(f"\n📈 Compared with {baseline_path} (commit {baseline.get('git_commit') or 'unknown'}):")
+    if baseline.get('conditions') != conditions:
+        print(f"   ⚠️  baseline was run with different mock conditions: {' '.join(baseline.get('conditions') or []) or 'none'}")
+    for result in results:
+        old = previous.get(case_label(result))
+        if old is None or 'error' in result or not old['items_per_sec']:
+            continue
+        change = result['items_per_sec'] / old['items_per_sec'] - 1
+        flag = ''
+        if change < -threshold:
+            flag = '  ⚠️  regression'
+            regressions += 1
+        print(f"   {case_label(result):<14} {old['items_per_sec']:>9.1f} -> {result['items_per_sec']:>9.1f} items/s "
+              f"({change:+.1%}){flag}")
+    return regressions
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the importers against the local mock parts API")
+    parser.add_argument(
+        '--items', type=int, default=1000, metavar='N',
+        help="number of synthetic items to import (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--source', type=Path, metavar='PATH',
+        help="import the items of this catalogue PDF or JSON export instead of synthetic ones"
+    )
+    parser.add_argument(
+        '--modes', default=','.join(MODES), metavar='M,M',
+        help="importers to run (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--batch-sizes', default='100', metavar='N,N',
+        help="bulk mode batch sizes (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--concurrency', default='8,32', metavar='N,N',
+        help="async mode concurrent requests (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--rate', type=float, default=0, metavar='R',
+        help="async mode client-side limit in requests per second (default: 0, unlimited)"
+    )
+    parser.add_argument(
+        '--retries', type=int, default=3, metavar='N',
+        help="async mode retries of 5xx/429 responses (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--no-reference-cache', action='store_true',
+        help="send reference names as they are, as import --no-reference-cache does"
+    )
+    add_fault_args(parser)
+    parser.add_argument(
+        '-o', '--output', default=DEFAULT_OUTPUT, metavar='PATH',
+        help="JSON results file (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--compare', metavar='PATH',
+        help="earlier results file to compare against; exits 1 on regressions"
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=0.10, metavar='F',
+        help="with --compare, flag cases slower by more than this fraction (default: 0.10)"
+    )
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args()
+    modes = parse_list(args.modes)
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        sys.exit(f"❌ Unknown mode: {', '.join(unknown)} (use: {', '.join(MODES)})")
+
+    cases = []
+    for mode in modes:
+        if mode == 'bulk':
+            cases += [{'mode': mode, 'batch_size': int(size)} for size in parse_list(args.batch_sizes)]
+        elif mode == 'async':
+            cases += [{'mode': mode, 'concurrency': int(n)} for n in parse_list(args.concurrency)]
+        else:
+            cases.append({'mode': mode})
+
+    print("=" * 60)
+    print("Import Load Test")
+    print("=" * 60)
+
+    if args.source:
+        if not args.source.exists():
+            sys.exit(f"❌ Catalogue file not found: {args.source}")
+        items = catalogue_items(args.source)
+        print(f"\n📄 {len(items)} items from {args.source}")
+    else:
+        items = synthetic_items(args.items, args.seed if args.seed is not None else 1)
+        print(f"\n📄 {len(items)} synthetic items")
+    conditions = ' '.join(fault_argv(args)) or 'none'
+    print(f"🧪 Mock conditions: {conditions}\n")
+
+    results = []
+    for case in cases:
+        label = case_label(case)
+        try:
+            result = run_case(case, items, args)
+        except Exception as e:
+            result = dict(case, error=str(e)[:200] or type(e).__name__)
+            print(f"   ❌ {label:<14} {result['error']}")
+            results.append(result)
+            continue
+        results.append(result)
+        latency = result['latency_ms']
+        errors = ', '.join(f"{status}: {n}" for status, n in sorted(result['error_responses'].items())) or 'none'
+        print(f"   {label:<14} {result['items_per_sec']:>9.1f} items/s  {result['created']:>6}/{result['items']} created  "
+              f"p50 {latency['p50']:.1f} p95 {latency['p95']:.1f} p99 {latency['p99']:.1f} ms  "
+              f"retries {result['retries']}  error responses: {errors}")
+
+    report = {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'items': len(items),
+        'source': str(args.source) if args.source else 'synthetic',
+        'conditions': fault_argv(args),
+        'results': results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding='utf-8')
+    print(f"\n✅ Results saved to {args.output}")
+
+    if args.compare and compare_results(results, report['conditions'], args.compare, args.threshold):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
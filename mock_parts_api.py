@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the backend's /api/parts and /api/dropdowns endpoints used by import_items_from_pdf.py.
+
+Keeps parts and reference data in memory and mirrors the backend's
+response shapes, its unique part number constraint, the way POST /parts
+resolves brand/category/subcategory/application ids or names (creating
+missing ones) and the way PUT /parts/:id replaces the whole record, so
+imports can be run and checked without the real server or database:
+
+    python mock_parts_api.py --port 3999
+    python import_items_from_pdf.py --api-url http://localhost:3999/api --batch-size 100
+
+The /api/parts routes can be made to behave like a loaded production
+server - response latency (per request and per bulk row), a share of
+injected 5xx failures, and throttling with 429 + Retry-After beyond a
+request rate - to measure importer settings offline (see
+load_test_import.py). GET /__mock__/stats returns the responses sent per
+route and status.
+
+    python mock_parts_api.py --latency 40 --jitter 20 --error-rate 0.02 --throttle 200
+"""
+
+import json
+import math
+import time
+import uuid
+import random
+import argparse
+import threading
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+PART_FIELDS = [
+    'master_part_no', 'part_no', 'brand_name', 'description', 'category_id',
+    'subcategory_id', 'application_id', 'hs_code', 'weight', 'reorder_level',
+    'uom', 'cost', 'price_a', 'price_b', 'price_m', 'smc', 'size', 'status',
+]
+
+# PUT /parts/:id replaces the whole record: a field left out of the body (or
+# blank) is reset to this, or to None, as backend/src/routes/parts.ts does.
+PUT_DEFAULTS = {'reorder_level': 0, 'uom': 'pcs', 'status': 'active'}
+
+class ReferenceStore:
+    """Brands, categories, subcategories and applications, resolved like the backend does.
+
+    id_lookups / name_lookups count the queries the backend would run for
+    POST /parts (primary key vs. name scans) and creates the records it
+    inserted, so the reference work an import causes can be compared.
+    """
+
+    def __init__(self):
+        self.brands = {}
+        self.categories = {}
+        self.subcategories = {}
+        self.applications = {}
+        self.id_lookups = 0
+        self.name_lookups = 0
+        self.creates = 0
+
+    @staticmethod
+    def _record(table, **fields):
+        record = dict(fields, id=str(uuid.uuid4()), status='active',
+                      createdAt=datetime.now(timezone.utc).isoformat())
+        table[record['id']] = record
+        return record
+
+    def _find(self, table, value, **where):
+        """Find by id, else by exact name (and the given fields)."""
+        if value in table:
+            self.id_lookups += 1
+            return table[value]
+        self.name_lookups += 1
+        for record in table.values():
+            if record['name'] == value and all(record.get(k) == v for k, v in where.items()):
+                return record
+        return None
+
+    def create_brand(self, name):
+        if any(brand['name'] == name for brand in self.brands.values()):
+            return 400, {'error': 'Brand with this name already exists'}
+        return 201, self._record(self.brands, name=name)
+
+    def create_category(self, name):
+        if any(category['name'] == name for category in self.categories.values()):
+            return 400, {'error': 'Category with this name already exists'}
+        return 201, self._record(self.categories, name=name)
+
+    def create_subcategory(self, name, category_id):
+        if category_id not in self.categories:
+            return 400, {'error': 'Category is required'}
+        if self._find(self.subcategories, name, categoryId=category_id):
+            return 400, {'error': 'Subcategory with this name already exists in this category'}
+        record = self._record(self.subcategories, name=name, categoryId=category_id)
+        return 201, dict(record, categoryName=self.categories[category_id]['name'])
+
+    def resolve(self, payload):
+        """Return (brand, category, subcategory, application) records for a part payload."""
+        brand = category = subcategory = application = None
+        if payload.get('brand_name'):
+            name = str(payload['brand_name']).strip()
+            brand = self._find(self.brands, name)
+            if brand is None:
+                self.creates += 1
+                brand = self._record(self.brands, name=name)
+        if payload.get('category_id'):
+            value = str(payload['category_id']).strip()
+            category = self._find(self.categories, value)
+            if category is None:
+                self.creates += 1
+                category = self._record(self.categories, name=value)
+        if payload.get('subcategory_id'):
+            value = str(payload['subcategory_id']).strip()
+            where = {'categoryId': category['id']} if category else {}
+            subcategory = self._find(self.subcategories, value, **where)
+            if subcategory is None and category:
+                self.creates += 1
+                subcategory = self._record(self.subcategories, name=value, categoryId=category['id'])
+        if payload.get('application_id'):
+            value = str(payload['application_id']).strip()
+            where = {'subcategoryId': subcategory['id']} if subcategory else {}
+            application = self._find(self.applications, value, **where)
+            if application is None and subcategory:
+                self.creates += 1
+                application = self._record(self.applications, name=value, subcategoryId=subcategory['id'])
+        return brand, category, subcategory, application
+
+    def _active(self, table):
+        return sorted((r for r in table.values() if r['status'] == 'active'), key=lambda r: r['name'])
+
+    def listing(self, path):
+        """Body of GET /api/dropdowns/<path>, or None for an unknown path."""
+        if path == 'brands/all':
+            return [{'id': b['id'], 'name': b['name'], 'status': 'Active', 'createdAt': b['createdAt']}
+                    for b in self._active(self.brands)]
+        if path == 'categories/all':
+            return [{'id': c['id'], 'name': c['name'], 'status': 'Active', 'createdAt': c['createdAt']}
+                    for c in self._active(self.categories)]
+        if path == 'subcategories/all':
+            return [{'id': s['id'], 'name': s['name'], 'categoryId': s['categoryId'],
+                     'categoryName': self.categories[s['categoryId']]['name'], 'status': 'Active'}
+                    for s in self._active(self.subcategories)]
+        if path == 'applications':
+            return [{'id': a['id'], 'name': a['name'], 'subcategoryId': a['subcategoryId']}
+                    for a in self._active(self.applications)]
+        return None
+
+class FaultProfile:
+    """Latency, injected failures and throttling for the /api/parts routes.
+
+    latency_ms (+ up to jitter_ms at random) is added to every request and
+    row_latency_ms per part of a bulk-create; error_rate is the share of
+    requests answered with error_status (after the latency, without
+    touching the store); throttle caps requests per second with a token
+    bucket of `burst` requests, answering the rest at once with 429 and a
+    Retry-After header. The defaults change nothing.
+    """
+
+    def __init__(self, latency_ms=0, jitter_ms=0, row_latency_ms=0, error_rate=0.0, error_status=500,
+                 throttle=0.0, burst=None, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.row_latency_ms = row_latency_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.throttle = throttle
+        self.burst = burst or max(1, math.ceil(throttle))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.injected = 0
+        self.throttled = 0
+
+    def admit(self):
+        """Take a token; returns the seconds to wait for one if the rate is exceeded."""
+        if not self.throttle:
+            return None
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.throttle)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return None
+            self.throttled += 1
+            return (1 - self.tokens) / self.throttle
+
+    def delay(self, rows=1):
+        """Sleep for the response latency of a request carrying `rows` parts."""
+        with self.lock:
+            jitter = self.random.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        seconds = (self.latency_ms + jitter + self.row_latency_ms * rows) / 1000
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def fail(self):
+        """True if this request should be answered with an injected error."""
+        if not self.error_rate:
+            return False
+        with self.lock:
+            if self.random.random() >= self.error_rate:
+                return False
+            self.injected += 1
+            return True
+
+    def stats(self):
+        return {'injected_errors': self.injected, 'throttled': self.throttled}
+
+def route_of(path):
+    """Route pattern of a request path, e.g. /api/parts/:id/prices."""
+    parts = path.strip('/').split('/')
+    if parts[:2] == ['api', 'parts'] and len(parts) > 2 and parts[2] != 'bulk-create':
+        parts[2] = ':id'
+    return '/' + '/'.join(parts)
+
+class PartsStore:
+    """In-memory parts table with the backend's unique part_no rule."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.parts = {}
+        self.ids_by_part_no = {}
+        self.references = ReferenceStore()
+        self.responses = {}  # "METHOD route" -> {status: count}
+        self.responses_lock = threading.Lock()  # responses may be sent while holding lock
+
+    def record_response(self, method, path, status):
+        with self.responses_lock:
+            counts = self.responses.setdefault(f"{method} {route_of(path)}", {})
+            counts[str(status)] = counts.get(str(status), 0) + 1
+
+    def _set_references(self, part, payload):
+        """Resolve the payload's reference ids/names into the part, as the backend reports them."""
+        brand, category, subcategory, application = self.references.resolve(payload)
+        part['brand_name'] = brand['name'] if brand else None
+        for field, record in (('category', category), ('subcategory', subcategory), ('application', application)):
+            part[f'{field}_id'] = record['id'] if record else None
+            part[f'{field}_name'] = record['name'] if record else None
+
+    def create(self, payload):
+        """Create a part; returns (status_code, body) like POST /api/parts."""
+        part_no = str(payload.get('part_no') or '').strip()
+        if not part_no:
+            return 400, {'error': 'Part number is required'}
+
+        with self.lock:
+            if part_no in self.ids_by_part_no:
+                return 400, {'error': 'A part with this partNo already exists'}
+
+            now = datetime.now(timezone.utc).isoformat()
+            part = {field: payload.get(field) for field in PART_FIELDS}
+            part.update({
+                'id': str(uuid.uuid4()),
+                'part_no': part_no,
+                'uom': payload.get('uom') or 'pcs',
+                'status': payload.get('status') or 'active',
+                'models': payload.get('models') or [],
+                'created_at': now,
+                'updated_at': now,
+            })
+            self._set_references(part, payload)
+            self.parts[part['id']] = part
+            self.ids_by_part_no[part_no] = part['id']
+            return 201, part
+
+    def update(self, part_id, payload):
+        """Replace a part's fields; returns (status_code, body) like PUT /api/parts/:id."""
+        with self.lock:
+            part = self.parts.get(part_id)
+            if part is None:
+                return 404, {'error': 'Part not found'}
+
+            part_no = str(payload.get('part_no') or part['part_no']).strip()
+            if part_no != part['part_no']:
+                if part_no in self.ids_by_part_no:
+                    return 400, {'error': 'A part with this partNo already exists'}
+                del self.ids_by_part_no[part['part_no']]
+                self.ids_by_part_no[part_no] = part_id
+
+            part.update({field: payload.get(field) or PUT_DEFAULTS.get(field) for field in PART_FIELDS})
+            if isinstance(payload.get('models'), list):
+                part['models'] = payload['models']
+            self._set_references(part, payload)
+            part['part_no'] = part_no
+            part['updated_at'] = datetime.now(timezone.utc).isoformat()
+            return 200, part
+
+    def get(self, part_id):
+        """Return (status_code, body) like GET /api/parts/:id."""
+        with self.lock:
+            part = self.parts.get(part_id)
+            return (200, dict(part)) if part is not None else (404, {'error': 'Part not found'})
+
+    def update_prices(self, part_id, payload):
+        """Update prices like PUT /api/parts/:id/prices ({cost, priceA, priceB})."""
+        with self.lock:
+            part = self.parts.get(part_id)
+            if part is None:
+                return 404, {'error': 'Part not found'}
+
+            updates = {}
+            for body_field, part_field in (('cost', 'cost'), ('priceA', 'price_a'), ('priceB', 'price_b')):
+                if payload.get(body_field) is not None:
+                    try:
+                        updates[part_field] = float(payload[body_field])
+                    except (TypeError, ValueError):
+                        pass
+            if not updates:
+                return 400, {'error': 'No valid price fields to update'}
+            part.update(updates)
+            part['updated_at'] = datetime.now(timezone.utc).isoformat()
+            return 200, {'message': 'Prices updated successfully', 'part': part}
+
+    def delete(self, part_id):
+        with self.lock:
+            part = self.parts.pop(part_id, None)
+            if part is None:
+                return 404, {'error': 'Part not found'}
+            del self.ids_by_part_no[part['part_no']]
+            return 200, {'message': 'Part deleted successfully'}
+
+    def list(self, page, limit):
+        with self.lock:
+            parts = list(self.parts.values())
+        start = (page - 1) * limit
+        return {
+            'data': parts[start:start + limit],
+            'pagination': {
+                'page': page,
+                'limit': limit,
+                'total': len(parts),
+                'totalPages': -(-len(parts) // limit) if limit else 0,
+            },
+        }
+
+class PartsAPIHandler(BaseHTTPRequestHandler):
+    store = None
+    faults = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+        self.store.record_response(self.command, urlparse(self.path).path, status)
+
+    def _faulted(self, rows=1):
+        """Apply the FaultProfile to a /api/parts request; True if it was answered with a fault."""
+        if self.faults is None or not urlparse(self.path).path.startswith('/api/parts'):
+            return False
+        wait = self.faults.admit()
+        if wait is not None:
+            # Retry-After is whole seconds, as the backend's rate limiter sends it
+            self._send(429, {'error': 'Too many requests, please try again later.'},
+                       {'Retry-After': str(max(1, math.ceil(wait)))})
+            return True
+        self.faults.delay(rows)
+        if self.faults.fail():
+            self._send(self.faults.error_status, {'error': 'Injected failure'})
+            return True
+        return False
+
+    def mock_stats(self):
+        with self.store.responses_lock:
+            responses = {route: dict(counts) for route, counts in self.store.responses.items()}
+        references = self.store.references
+        return {
+            'parts': len(self.store.parts),
+            'responses': responses,
+            'faults': self.faults.stats() if self.faults else {},
+            'references': {'id_lookups': references.id_lookups, 'name_lookups': references.name_lookups,
+                           'creates': references.creates},
+        }
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'{}')
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        path = url.path.rstrip('/')
+        if path == '/__mock__/stats':
+            return self._send(200, self.mock_stats())
+        if self._faulted():
+            return
+        if path.startswith('/api/dropdowns/'):
+            with self.store.lock:
+                body = self.store.references.listing(path[len('/api/dropdowns/'):])
+            return self._send(200, body) if body is not None else self._send(404, {'error': 'Not found'})
+        parts = path.strip('/').split('/')
+        if len(parts) == 3 and parts[:2] == ['api', 'parts']:
+            return self._send(*self.store.get(parts[2]))
+        if path != '/api/parts':
+            return self._send(404, {'error': 'Not found'})
+        query = parse_qs(url.query)
+        page = int(query.get('page', ['1'])[0])
+        limit = int(query.get('limit', ['50'])[0])
+        self._send(200, self.store.list(page, limit))
+
+    def do_POST(self):
+        path = urlparse(self.path).path.rstrip('/')
+        if path == '/api/parts':
+            payload = self._read_json()
+            if self._faulted():
+                return
+            return self._send(*self.store.create(payload))
+
+        if path == '/api/parts/bulk-create':
+            parts = self._read_json().get('parts')
+            if self._faulted(len(parts) if isinstance(parts, list) else 1):
+                return
+            if not isinstance(parts, list) or not parts:
+                return self._send(400, {'error': 'parts array is required'})
+
+            results = []
+            for index, payload in enumerate(parts):
+                status, body = self.store.create(payload or {})
+                if status == 201:
+                    results.append({'index': index, 'part_no': body['part_no'], 'status': 'created', 'id': body['id']})
+                else:
+                    results.append({'index': index, 'part_no': (payload or {}).get('part_no'), 'status': 'error', 'error': body['error']})
+            created_count = sum(1 for r in results if r['status'] == 'created')
+            return self._send(200, {
+                'message': f"Created {created_count} of {len(parts)} parts",
+                'created_count': created_count,
+                'error_count': len(parts) - created_count,
+                'results': results,
+            })
+
+        if path in ('/api/dropdowns/brands', '/api/dropdowns/categories', '/api/dropdowns/subcategories'):
+            body = self._read_json()
+            name = str(body.get('name') or '').strip()
+            if not name:
+                return self._send(400, {'error': 'Name is required'})
+            references = self.store.references
+            with self.store.lock:
+                if path.endswith('/brands'):
+                    return self._send(*references.create_brand(name))
+                if path.endswith('/categories'):
+                    return self._send(*references.create_category(name))
+                return self._send(*references.create_subcategory(name, body.get('category_id')))
+
+        self._send(404, {'error': 'Not found'})
+
+    def do_PUT(self):
+        payload = self._read_json()
+        if self._faulted():
+            return
+        parts = urlparse(self.path).path.strip('/').split('/')
+        if len(parts) == 3 and parts[:2] == ['api', 'parts']:
+            return self._send(*self.store.update(parts[2], payload))
+        if len(parts) == 4 and parts[:2] == ['api', 'parts'] and parts[3] == 'prices':
+            return self._send(*self.store.update_prices(parts[2], payload))
+        self._send(404, {'error': 'Not found'})
+
+    def do_DELETE(self):
+        if self._faulted():
+            return
+        parts = urlparse(self.path).path.strip('/').split('/')
+        if len(parts) == 3 and parts[:2] == ['api', 'parts']:
+            return self._send(*self.store.delete(parts[2]))
+        self._send(404, {'error': 'Not found'})
+
+def make_server(host='127.0.0.1', port=3999, store=None, faults=None):
+    """Build a server over a fresh (or the given) PartsStore, with an optional FaultProfile."""
+    handler = type('BoundPartsAPIHandler', (PartsAPIHandler,), {'store': store or PartsStore(), 'faults': faults})
+    return ThreadingHTTPServer((host, port), handler)
+
+def start_in_thread(host='127.0.0.1', port=0, store=None, faults=None):
+    """Start a server on a background thread; returns (server, api_base_url)."""
+    server = make_server(host, port, store, faults)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}/api"
+
+def add_fault_args(parser):
+    """Add the options that build a FaultProfile (see faults_from_args)."""
+    parser.add_argument(
+        '--latency', type=float, default=0, metavar='MS',
+        help="added to every /api/parts response, in milliseconds (default: 0)"
+    )
+    parser.add_argument(
+        '--jitter', type=float, default=0, metavar='MS',
+        help="random extra latency of up to MS milliseconds (default: 0)"
+    )
+    parser.add_argument(
+        '--row-latency', type=float, default=0, metavar='MS',
+        help="extra latency per part of a bulk-create request, in milliseconds (default: 0)"
+    )
+    parser.add_argument(
+        '--error-rate', type=float, default=0, metavar='F',
+        help="share of /api/parts requests answered with --error-status (default: 0)"
+    )
+    parser.add_argument(
+        '--error-status', type=int, default=500, metavar='CODE',
+        help="status of the injected failures (default: 500)"
+    )
+    parser.add_argument(
+        '--throttle', type=float, default=0, metavar='R',
+        help="answer requests beyond R per second with 429 and Retry-After (default: 0, unlimited)"
+    )
+    parser.add_argument(
+        '--burst', type=int, default=0, metavar='N',
+        help="with --throttle, requests allowed in a burst (default: one second's worth)"
+    )
+    parser.add_argument(
+        '--seed', type=int, default=None, metavar='N',
+        help="random seed for the jitter and injected failures"
+    )
+
+def faults_from_args(args):
+    """FaultProfile for the parsed add_fault_args options, or None if they change nothing."""
+    if not (args.latency or args.jitter or args.row_latency or args.error_rate or args.throttle):
+        return None
+    return FaultProfile(
+        latency_ms=args.latency, jitter_ms=args.jitter, row_latency_ms=args.row_latency,
+        error_rate=args.error_rate, error_status=args.error_status,
+        throttle=args.throttle, burst=args.burst or None, seed=args.seed,
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the /api/parts endpoints")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3999, help="port to listen on; 0 picks a free one (default: 3999)")
+    add_fault_args(parser)
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, faults=faults_from_args(args))
+    # flushed, so a parent process can read the port chosen for --port 0
+    print(f"🧪 Mock parts API listening on http://{args.host}:{server.server_address[1]}/api", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
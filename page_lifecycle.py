@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Bounded-memory page lifecycle for very large PDFs.
+
+pdfplumber keeps each page's parsed objects (chars, rects, lines) cached on
+the Page, and pdfminer keeps parsed PDF objects cached on the document, so
+a single long-lived pdfplumber.open() grows with the page count. The page
+iterator in convert_pdf_to_excel.py therefore closes every page once its
+rows have been emitted, and with a PageLifecycle it also reopens the
+document every K pages, or as soon as the process RSS passes a ceiling.
+"""
+
+import gc
+import os
+import sys
+
+from instrumentation import METRICS
+
+def current_rss_mb():
+    """Current resident set size of this process in MB, or None if unknown."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+class PageLifecycle:
+    """When to drop the open document: every reopen_every pages and/or above max_rss_mb.
+
+    0 disables either limit.
+    """
+
+    def __init__(self, reopen_every=0, max_rss_mb=0):
+        self.reopen_every = reopen_every
+        self.max_rss_mb = max_rss_mb
+        self._warned = False
+
+    def should_reopen(self, pages_since_open):
+        """Check before each page whether the document should be closed and reopened."""
+        if not pages_since_open:
+            return False
+        if self.reopen_every and pages_since_open >= self.reopen_every:
+            METRICS.count('pdf_reopens')
+            return True
+        if self.max_rss_mb:
+            rss = current_rss_mb()
+            if rss is None:
+                if not self._warned:
+                    print("⚠️  Can't read the process RSS here (install psutil), --max-rss is ignored", file=sys.stderr)
+                    self._warned = True
+            elif rss > self.max_rss_mb:
+                METRICS.count('rss_flushes')
+                return True
+        return False
+
+    @staticmethod
+    def flush():
+        """Collect the closed document's objects before the reopen."""
+        gc.collect()
+
+def add_memory_args(parser):
+    """Add the bounded-memory options shared by the scripts."""
+    parser.add_argument(
+        '--reopen-every', type=int, default=0, metavar='K',
+        help="close and reopen the PDF every K pages to drop parser caches (default: 0, never)"
+    )
+    parser.add_argument(
+        '--max-rss', type=int, default=0, metavar='MB',
+        help="reopen the PDF whenever the process RSS exceeds MB (default: 0, no limit)"
+    )
+
+def open_lifecycle(args):
+    """Return the PageLifecycle selected by the command-line options, or None."""
+    if not args.reopen_every and not args.max_rss:
+        return None
+    return PageLifecycle(args.reopen_every, args.max_rss)
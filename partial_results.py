@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Partial extraction results of page-range and shard runs, and their merge.
+
+To spread a very large catalogue over several machines, each one extracts
+part of it with --pages A-B or --shard i/N (the i-th of N near-equal page
+ranges) and writes a partial file instead of the output sheet. The file is
+JSON Lines and describes itself:
+
+    {"format": "ctc-partial-rows", "version": 1, "source": ..., "source_sha256": ...,
+     "total_pages": ..., "pages": [A, B], "shard": [i, N] or null, "columns": [...], ...}
+    {"page": A, "headers": [{"Part No": "part no.", ...}], "rows": [[...], ...]}
+    ...one line per page...
+    {"end": true, "pages": ..., "rows": ...}
+
+so every row keeps the page it came from, and every page records how its
+tables' headers were mapped to the required columns (null for a page
+read through the text fallback). The end line marks a finished file.
+
+merge_partials checks before writing anything that the partials come from
+the same PDF, are all complete and together cover every page - reporting
+missing shards or page ranges otherwise - then writes the rows in page
+order through the usual normalization stage. Where page ranges overlap,
+the pages shared by two partials are taken once, so the merged sheet is
+the same as that of one unsharded run.
+
+    node1$ python ctc_items.py extract catalogue.pdf --shard 1/2 -o catalogue.xlsx
+    node2$ python ctc_items.py extract catalogue.pdf --shard 2/2 -o catalogue.xlsx
+    $ python ctc_items.py merge catalogue.shard-*.partial.jsonl -o catalogue.xlsx
+"""
+
+import json
+import hashlib
+from pathlib import Path
+from datetime import datetime, timezone
+
+from convert_pdf_to_excel import (
+    REQUIRED_COLUMNS, NUMERIC_COLUMNS, MEANINGFUL_COLUMNS, FRAME_BATCH_SIZE, TABLE_SETTINGS,
+    count_pages, iter_pdf_pages,
+)
+from pdf_page_cache import file_hash
+from row_records import record_type
+from row_sinks import open_row_writer
+
+PARTIAL_FORMAT = 'ctc-partial-rows'
+PARTIAL_VERSION = 1
+PARTIAL_SUFFIX = '.partial.jsonl'
+
+def shard_pages(shard, total_pages):
+    """Page range (first, last) of shard (i, N); empty (first > last) when N exceeds the pages."""
+    index, count = shard
+    return (index - 1) * total_pages // count + 1, index * total_pages // count
+
+def partial_path(output, first, last, shard=None):
+    """Partial file for a run, next to the output it will be merged into."""
+    output = Path(output)
+    if shard:
+        index, count = shard
+        return output.with_name(f"{output.stem}.shard-{index:0{len(str(count))}d}-of-{count}{PARTIAL_SUFFIX}")
+    return output.with_name(f"{output.stem}.pages-{first}-{last}{PARTIAL_SUFFIX}")
+
+def extract_partial(pdf_path, output, pages=None, shard=None, workers=1, cache=None, template=None,
+                    lifecycle=None):
+    """Extract a page range (pages=(A, B or None)) or shard=(i, N) of the PDF into a partial file.
+
+    Returns the partial file's path, or None on failure.
+    """
+    pdf_hash = file_hash(pdf_path)
+    total_pages = (cache and cache.get_page_count(pdf_hash)) or count_pages(pdf_path)
+    if shard:
+        first, last = shard_pages(shard, total_pages)
+    else:
+        first, last = pages
+        last = total_pages if last is None else min(last, total_pages)
+        if first > total_pages:
+            print(f"❌ The PDF has only {total_pages} pages")
+            return None
+
+    path = partial_path(output, first, last, shard)
+    print(f"📄 Extracting pages {first}-{last} of {total_pages} from PDF: {pdf_path}"
+          + (f" (shard {shard[0]}/{shard[1]})" if shard else ""))
+    meta = {
+        'format': PARTIAL_FORMAT,
+        'version': PARTIAL_VERSION,
+        'source': Path(pdf_path).name,
+        'source_sha256': pdf_hash,
+        'total_pages': total_pages,
+        'pages': [first, last],
+        'shard': list(shard) if shard else None,
+        'columns': REQUIRED_COLUMNS,
+        'template': template.header if template else None,
+        'table_settings': TABLE_SETTINGS,
+        'created': datetime.now(timezone.utc).isoformat(),
+    }
+
+    page_count = 0
+    row_count = 0
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(meta, ensure_ascii=False) + '\n')
+            if first <= last:
+                for page_num, rows, headers in iter_pdf_pages(
+                    pdf_path, workers, REQUIRED_COLUMNS, cache, template, lifecycle, first, last, pdf_hash,
+                ):
+                    f.write(json.dumps({'page': page_num, 'headers': headers, 'rows': rows}, ensure_ascii=False) + '\n')
+                    page_count += 1
+                    row_count += len(rows)
+            f.write(json.dumps({'end': True, 'pages': page_count, 'rows': row_count}) + '\n')
+    except Exception as e:
+        print(f"❌ Error extracting PDF: {e}")
+        path.unlink(missing_ok=True)
+        return None
+
+    print(f"✅ Extracted {row_count} rows from {page_count} pages into {path}")
+    return path
+
+class Partial:
+    """A partial file's metadata and end record (None if the run didn't finish)."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, encoding='utf-8') as f:
+            first_line = f.readline()
+            last_line = first_line
+            for line in f:
+                if line.strip():
+                    last_line = line
+        try:
+            self.meta = json.loads(first_line)
+            end = json.loads(last_line)
+        except ValueError:
+            raise ValueError(f"{self.path}: not a partial result file")
+        if not isinstance(self.meta, dict) or self.meta.get('format') != PARTIAL_FORMAT:
+            raise ValueError(f"{self.path}: not a partial result file")
+        if self.meta.get('version') != PARTIAL_VERSION:
+            raise ValueError(f"{self.path}: unsupported partial file version {self.meta.get('version')}")
+        self.end = end if isinstance(end, dict) and end.get('end') else None
+        self.first, self.last = self.meta['pages']
+
+    def iter_pages(self):
+        """Yield the page records of the file, in page order."""
+        with open(self.path, encoding='utf-8') as f:
+            f.readline()
+            for line in f:
+                record = json.loads(line)
+                if 'page' in record:
+                    yield record
+
+def _page_ranges_text(pages):
+    """Compact text of a sorted page list, e.g. "3-7, 12"."""
+    ranges = []
+    for page in pages:
+        if ranges and ranges[-1][1] == page - 1:
+            ranges[-1][1] = page
+        else:
+            ranges.append([page, page])
+    return ', '.join(f"{first}-{last}" if first != last else str(first) for first, last in ranges)
+
+def check_partials(partials):
+    """Return the problems that stop a merge: unfinished files, mixed sources, missing pages or shards."""
+    problems = [f"{partial.path}: incomplete, the run did not finish" for partial in partials if partial.end is None]
+
+    sources = {(p.meta['source'], p.meta['source_sha256'], p.meta['total_pages']) for p in partials}
+    if len(sources) > 1:
+        names = ', '.join(sorted({f"{source} ({sha[:12]})" for source, sha, total in sources}))
+        return problems + [f"partials come from different PDFs: {names}"]
+    if any(partial.meta['columns'] != REQUIRED_COLUMNS for partial in partials):
+        problems.append("partials were written with different columns than this version extracts")
+
+    total_pages = partials[0].meta['total_pages']
+    covered = set()
+    for partial in partials:
+        covered.update(range(partial.first, partial.last + 1))
+    missing = [page for page in range(1, total_pages + 1) if page not in covered]
+    if missing:
+        shard_counts = {partial.meta['shard'][1] for partial in partials if partial.meta['shard']}
+        if len(shard_counts) == 1:
+            count = shard_counts.pop()
+            present = {partial.meta['shard'][0] for partial in partials if partial.meta['shard']}
+            absent = [
+                f"{index}/{count}" for index in range(1, count + 1)
+                if index not in present and shard_pages((index, count), total_pages)[0] in missing
+            ]
+            if absent:
+                problems.append(f"missing shards: {', '.join(absent)}")
+        problems.append(f"missing pages: {_page_ranges_text(missing)} of {total_pages}")
+    return problems
+
+def iter_merged_pages(partials, stats):
+    """Yield every page record once, in page order; a page in several partials is taken from the first.
+
+    stats['overlaps'] counts the pages dropped that way, and stats['differing']
+    lists those whose dropped copy had other rows than the one kept.
+    """
+    last_page = 0
+    digests = {}
+    for partial in sorted(partials, key=lambda partial: (partial.first, -partial.last)):
+        for record in partial.iter_pages():
+            page = record['page']
+            digest = hashlib.sha256(json.dumps(record['rows']).encode()).digest()
+            if page <= last_page:
+                stats['overlaps'] += 1
+                if digests.get(page) != digest:
+                    stats['differing'].append(page)
+                continue
+            digests[page] = digest
+            last_page = page
+            yield record
+
+def merge_partials(paths, output):
+    """Check and merge partial files into the output sheet; returns success."""
+    from frame_normalizer import iter_normalized_frames, save_rejects
+
+    files = []
+    for path in map(Path, paths):
+        files.extend(sorted(path.glob(f"*{PARTIAL_SUFFIX}")) if path.is_dir() else [path])
+
+    partials = []
+    problems = []
+    for path in files:
+        try:
+            partials.append(Partial(path))
+        except (OSError, ValueError) as e:
+            problems.append(str(e))
+    if not partials and not problems:
+        problems.append("no partial files given")
+    if partials:
+        problems += check_partials(partials)
+    if problems:
+        print("❌ Can't merge, nothing was written:")
+        for problem in problems:
+            print(f"   {problem}")
+        return False
+
+    meta = partials[0].meta
+    print(f"🧩 Merging {len(partials)} partial files of {meta['source']} ({meta['total_pages']} pages)")
+    if len({json.dumps(partial.meta['template']) for partial in partials}) > 1:
+        print("⚠️  The partials were extracted with different layout templates")
+
+    row_type = record_type(REQUIRED_COLUMNS)
+    stats = {'overlaps': 0, 'differing': []}
+    layouts = set()
+    text_pages = 0
+
+    def merged_rows():
+        nonlocal text_pages
+        for record in iter_merged_pages(partials, stats):
+            if record['headers'] is None:
+                text_pages += 1
+            else:
+                layouts.update(json.dumps(mapping, sort_keys=True) for mapping in record['headers'])
+            for values in record['rows']:
+                yield row_type(values)
+
+    rejects = []
+    writer = open_row_writer(output, REQUIRED_COLUMNS, NUMERIC_COLUMNS)
+    frames = iter_normalized_frames(
+        merged_rows(), REQUIRED_COLUMNS, NUMERIC_COLUMNS, MEANINGFUL_COLUMNS,
+        batch_size=FRAME_BATCH_SIZE, rejects=rejects,
+    )
+    for frame in frames:
+        writer.write_frame(frame)
+
+    print(f"📐 {len(layouts)} header layouts, {text_pages} pages read through the text fallback")
+    if stats['overlaps']:
+        print(f"   {stats['overlaps']} pages present in more than one partial were taken once")
+    if stats['differing']:
+        print(f"⚠️  Overlapping copies differ on pages {_page_ranges_text(stats['differing'])}; "
+              f"the first partial's rows were kept")
+
+    rejects_path = Path(output).with_name(f"{Path(output).stem}_rejects.csv")
+    rejected = save_rejects(rejects, rejects_path)
+    if rejected:
+        print(f"⚠️  {rejected} values could not be parsed as numbers, see {rejects_path}")
+
+    if not writer.count:
+        writer.discard()
+        print("⚠️  The partials hold no rows, nothing was written")
+        return False
+    writer.save()
+    print(f"✅ Merged {writer.count} rows into {output}")
+    return True
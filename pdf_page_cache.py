@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of per-page PDF extraction results.
+
+Each page's extract_tables() output (plus the fallback text for pages without
+tables) is stored in a small SQLite database. Pages are looked up two ways:
+
+  * by (file hash, page number, table settings) - an unchanged PDF is served
+    entirely from the cache without being opened;
+  * by (page content digest, table settings) - after the PDF is edited only
+    pages whose content streams or resources changed are parsed again.
+
+The database is bounded to max_bytes; least recently used entries are evicted.
+"""
+
+import json
+import sqlite3
+import hashlib
+import time
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = ".pdf_page_cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+def file_hash(path, chunk_size=1024 * 1024):
+    """Return the SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _digest_object(digest, obj, path=()):
+    """Feed a PDF object into the digest: dicts, arrays and stream data, following references."""
+    from pdfminer.pdftypes import PDFObjRef, PDFStream
+    from pdfminer.psparser import PSLiteral
+
+    if isinstance(obj, PDFObjRef):
+        if obj.objid in path:
+            # A form XObject reaching itself through its resources
+            digest.update(b'<cycle>')
+            return
+        path += (obj.objid,)
+        obj = obj.resolve()
+    if isinstance(obj, PDFStream):
+        _digest_object(digest, obj.attrs, path)
+        digest.update(b'stream')
+        digest.update(obj.get_data())
+    elif isinstance(obj, dict):
+        digest.update(b'<<')
+        for key in sorted(obj):
+            digest.update(f"/{key}".encode())
+            _digest_object(digest, obj[key], path)
+        digest.update(b'>>')
+    elif isinstance(obj, (list, tuple)):
+        digest.update(b'[')
+        for value in obj:
+            _digest_object(digest, value, path)
+        digest.update(b']')
+    elif isinstance(obj, PSLiteral):
+        digest.update(f"/{obj.name}".encode())
+    else:
+        digest.update(repr(obj).encode())
+
+def page_digest(page):
+    """Return a digest of a pdfplumber page's content streams, resources and page box.
+
+    The resources (fonts, form XObjects and their own resources) are part of
+    what the page shows, so two pages with the same content stream but e.g.
+    different forms drawn through it get different digests.
+    """
+    from pdfminer.pdftypes import resolve1
+
+    digest = hashlib.sha256(repr(page.bbox).encode())
+    for stream in page.page_obj.contents:
+        stream = resolve1(stream)
+        if hasattr(stream, 'get_data'):
+            digest.update(stream.get_data())
+    digest.update(b'/Resources')
+    _digest_object(digest, page.page_obj.resources)
+    return digest.hexdigest()
+
+class PageCache:
+    """Size-bounded SQLite store of page extraction results."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, table_settings=None):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.table_settings = table_settings or {}
+        self.settings_key = hashlib.sha256(
+            json.dumps(self.table_settings, sort_keys=True).encode()
+        ).hexdigest()[:16]
+        self.hits = 0
+        self.misses = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Several extraction workers may share the cache, so wait on locks
+        self._conn = sqlite3.connect(self.cache_dir / "pages.sqlite3", timeout=60)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries(last_used)")
+        self._conn.commit()
+
+    def spec(self):
+        """Arguments to rebuild an equivalent cache, e.g. in a worker process."""
+        return (str(self.cache_dir), self.max_bytes, self.table_settings)
+
+    def close(self):
+        self._conn.close()
+
+    # --- raw key/value access ---
+
+    def _get(self, key):
+        row = self._conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self._conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        self._conn.commit()
+        return json.loads(row[0])
+
+    def _put(self, key, value):
+        data = json.dumps(value)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+            (key, data, len(data), time.time()),
+        )
+        self._conn.commit()
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # Trim to 90% so we don't evict again on the very next put
+        target = self.max_bytes * 0.9
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY last_used"
+        ).fetchall():
+            if total <= target:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+        self._conn.commit()
+
+    # --- page-level API ---
+
+    def _page_key(self, pdf_hash, page_num):
+        return f"page:{pdf_hash}:{page_num}:{self.settings_key}"
+
+    def _content_key(self, digest):
+        return f"content:{digest}:{self.settings_key}"
+
+    def get_page_count(self, pdf_hash):
+        return self._get(f"pages:{pdf_hash}")
+
+    def set_page_count(self, pdf_hash, total_pages):
+        self._put(f"pages:{pdf_hash}", total_pages)
+
+    def _load_content(self, digest):
+        content = self._get(self._content_key(digest))
+        if content is None:
+            return None
+        return content['tables'], content['text']
+
+    def get_page(self, pdf_hash, page_num):
+        """Return cached (tables, text) for a page of a known file, or None."""
+        digest = self._get(self._page_key(pdf_hash, page_num))
+        content = self._load_content(digest) if digest is not None else None
+        if content is not None:
+            self.hits += 1
+        return content
+
+    def get_content(self, digest):
+        """Return cached (tables, text) for a page content digest, or None."""
+        content = self._load_content(digest)
+        if content is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return content
+
+    def put_page(self, pdf_hash, page_num, digest, tables, text):
+        self._put(self._content_key(digest), {'tables': tables, 'text': text})
+        self._put(self._page_key(pdf_hash, page_num), digest)
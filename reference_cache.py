@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Client-side cache of the app's reference data for the importers.
+
+POST /parts takes brand_name, category_id, subcategory_id and
+application_id as ids or names; every name makes the backend look the
+record up (and create it if missing) again, for each of thousands of items
+that share a few dozen brands and categories. ReferenceCache loads the
+lists once from the /dropdowns API, matches catalogue names against them
+by a normalized key (case and whitespace insensitive), and rewrites each
+payload to the ids just before it is sent. Brands, categories and
+subcategories that don't exist yet are created once through the dropdown
+API, before the first item of the batch they appear in is sent (see
+iter_payloads: the whole of a list, or REFERENCE_BATCH_SIZE items of a
+stream). There is no endpoint for creating applications, so unknown
+applications are still sent by name.
+"""
+
+from instrumentation import METRICS
+
+def name_key(name):
+    """Matching key for a reference name: casefolded, whitespace collapsed."""
+    return ' '.join(str(name).split()).casefold()
+
+class ReferenceCache:
+    """Names -> ids of brands, categories, subcategories and applications."""
+
+    def __init__(self, api_base_url):
+        self.dropdowns_url = f"{api_base_url}/dropdowns"
+        self.brands = {}                 # key -> brand name as stored (POST /parts takes names only)
+        self.categories = {}             # key -> id
+        self.subcategories = {}          # (category id, key) -> id
+        self.subcategories_by_name = {}  # key -> id of the first match, for items without a category
+        self.subcategory_category = {}   # subcategory id -> category id
+        self.applications = {}           # (subcategory id, key) -> id
+        self.created = {'brands': 0, 'categories': 0, 'subcategories': 0}
+        self._failed = set()
+        self._session = None
+
+    def _request(self, method, path, **kwargs):
+        import requests
+
+        if self._session is None:
+            self._session = requests.Session()
+        with METRICS.timer(f'http {method} /dropdowns/{path}'):
+            return self._session.request(method, f"{self.dropdowns_url}/{path}", timeout=30, **kwargs)
+
+    def load(self):
+        """Fetch the reference lists once; returns False if the API doesn't provide them."""
+        lists = {}
+        try:
+            for path in ('brands/all', 'categories/all', 'subcategories/all', 'applications'):
+                response = self._request('GET', path)
+                response.raise_for_status()
+                lists[path] = response.json()
+        except Exception as e:
+            print(f"⚠️  Reference data not available ({str(e)[:100]}), sending names as they are")
+            return False
+
+        for brand in lists['brands/all']:
+            self.brands.setdefault(name_key(brand['name']), brand['name'])
+        for category in lists['categories/all']:
+            self.categories.setdefault(name_key(category['name']), category['id'])
+        for subcategory in lists['subcategories/all']:
+            self._add_subcategory(subcategory['id'], subcategory['categoryId'], subcategory['name'])
+        for application in lists['applications']:
+            self.applications.setdefault((application['subcategoryId'], name_key(application['name'])), application['id'])
+
+        print(f"📚 Loaded {len(self.brands)} brands, {len(self.categories)} categories, "
+              f"{len(self.subcategory_category)} subcategories, {len(self.applications)} applications")
+        return True
+
+    def _add_subcategory(self, subcategory_id, category_id, name):
+        key = name_key(name)
+        self.subcategories.setdefault((category_id, key), subcategory_id)
+        self.subcategories_by_name.setdefault(key, subcategory_id)
+        self.subcategory_category[subcategory_id] = category_id
+
+    def _create(self, kind, body):
+        """POST a new dropdown entry once; returns the created record or None."""
+        failure_key = (kind, tuple(sorted(body.items())))
+        if failure_key in self._failed:
+            return None
+        try:
+            response = self._request('POST', kind, json=body)
+            if response.status_code == 201:
+                self.created[kind] += 1
+                METRICS.count('reference_creates')
+                return response.json()
+            print(f"  ⚠️  Could not create {kind[:-1]} '{body['name']}': {response.status_code} - {response.text[:100]}")
+        except Exception as e:
+            print(f"  ⚠️  Could not create {kind[:-1]} '{body['name']}': {str(e)[:100]}")
+        self._failed.add(failure_key)
+        return None
+
+    def brand(self, name):
+        """Stored spelling of a brand, creating the brand if it is new."""
+        key = name_key(name)
+        stored = self.brands.get(key)
+        if stored is None:
+            created = self._create('brands', {'name': str(name).strip()})
+            stored = created['name'] if created else name
+            self.brands[key] = stored
+        return stored
+
+    def category(self, name):
+        """Id of a category, creating it if it is new; None if that fails."""
+        key = name_key(name)
+        category_id = self.categories.get(key)
+        if category_id is None:
+            created = self._create('categories', {'name': str(name).strip()})
+            if created:
+                category_id = self.categories[key] = created['id']
+        return category_id
+
+    def subcategory(self, name, category_id):
+        """Id of a subcategory within category_id (or by name alone without one)."""
+        key = name_key(name)
+        if not category_id:
+            return self.subcategories_by_name.get(key)
+        subcategory_id = self.subcategories.get((category_id, key))
+        if subcategory_id is None:
+            created = self._create('subcategories', {'name': str(name).strip(), 'category_id': category_id})
+            if created:
+                subcategory_id = created['id']
+                self._add_subcategory(subcategory_id, category_id, created['name'])
+        return subcategory_id
+
+    def apply(self, payload):
+        """Return a copy of a POST /parts payload with reference names replaced by ids.
+
+        Names that can't be resolved are left for the backend to handle.
+        """
+        body = dict(payload)
+        if body.get('brand_name'):
+            body['brand_name'] = self.brand(body['brand_name'])
+
+        category_id = self.category(body['category_id']) if body.get('category_id') else None
+        if category_id:
+            body['category_id'] = category_id
+
+        subcategory_id = self.subcategory(body['subcategory_id'], category_id) if body.get('subcategory_id') else None
+        if subcategory_id:
+            body['subcategory_id'] = subcategory_id
+            if not category_id:
+                body['category_id'] = self.subcategory_category[subcategory_id]
+
+        if subcategory_id and body.get('application_id'):
+            application_id = self.applications.get((subcategory_id, name_key(body['application_id'])))
+            if application_id:
+                body['application_id'] = application_id
+        METRICS.count('reference_resolved')
+        return body
+
+    def print_summary(self):
+        if any(self.created.values()):
+            print(f"📚 Created {self.created['brands']} brands, {self.created['categories']} categories, "
+                  f"{self.created['subcategories']} subcategories")
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
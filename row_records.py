@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Compact records for extracted catalogue rows.
+
+A row is a tuple subclass without a per-instance __dict__, so it costs one
+pointer per column instead of a 17-key dict, while still offering the
+read-only dict access the writers use (row['brand'], row.get('cost')).
+Values of low-cardinality columns (brand, origin, grade, ...) are interned,
+so the thousands of rows sharing a brand share one string object. A
+record type knows its interned columns, so rows pickled back from worker
+processes are interned again as they are unpickled.
+"""
+
+import sys
+
+_RECORD_TYPES = {}
+
+class RowRecord(tuple):
+    """Tuple-backed row with dict-style access by column name."""
+
+    __slots__ = ()
+    columns = ()
+    interned = frozenset()
+    _index = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return tuple.__getitem__(self, self._index[key])
+        return tuple.__getitem__(self, key)
+
+    @classmethod
+    def position(cls, column):
+        """Index of a column in the record."""
+        return cls._index[column]
+
+    def get(self, key, default=None):
+        idx = self._index.get(key)
+        return default if idx is None else tuple.__getitem__(self, idx)
+
+    def keys(self):
+        return self.columns
+
+    def items(self):
+        return zip(self.columns, self)
+
+    def as_dict(self):
+        return dict(zip(self.columns, self))
+
+    def __reduce__(self):
+        return _rebuild, (self.columns, tuple(self), self.interned)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+def record_type(columns, interned=()):
+    """Return the RowRecord subclass for a column list and its interned columns (one class per pair)."""
+    columns = tuple(columns)
+    interned = frozenset(interned).intersection(columns)
+    cls = _RECORD_TYPES.get((columns, interned))
+    if cls is None:
+        cls = type('CatalogueRow', (RowRecord,), {
+            '__slots__': (),
+            'columns': columns,
+            'interned': interned,
+            '_index': {col: idx for idx, col in enumerate(columns)},
+        })
+        _RECORD_TYPES[columns, interned] = cls
+    return cls
+
+def _rebuild(columns, values, interned=frozenset()):
+    # Unpickled strings are new objects, one per row
+    return record_type(columns, interned)(
+        sys.intern(value) if col in interned and isinstance(value, str) else value
+        for col, value in zip(columns, values)
+    )
+
+def make_row(columns, values, interned=()):
+    """Build a record from a {column: value} dict; missing columns are ''.
+
+    Values of the columns in `interned` are stripped and interned.
+    """
+    return record_type(columns, interned)(
+        sys.intern(values.get(col, '').strip()) if col in interned else values.get(col, '')
+        for col in columns
+    )
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Streaming output sinks for extracted rows.
+
+Every sink takes rows one at a time (write) or a DataFrame batch at a time
+(write_frame) and writes them out as they arrive, so the whole catalogue is
+never held in memory. The format follows the output file's extension:
+
+    .xlsx               write-only openpyxl workbook
+    .csv                plain CSV
+    .parquet / .feather Arrow formats for downstream tooling (needs pyarrow)
+
+openpyxl, pandas and pyarrow are imported by the sinks that need them.
+"""
+
+import csv
+from pathlib import Path
+
+from instrumentation import METRICS
+
+def _blank_to_none(frame):
+    """Turn NaN and empty strings into None, as blank cells."""
+    return frame.astype(object).where(frame.notna() & frame.ne(''), None)
+
+class RowWriter:
+    """Base sink: subclasses implement write, _write_frame and _save (and _close if they hold a file open)."""
+
+    def __init__(self, path, columns):
+        self.path = path
+        self.columns = list(columns)
+        self.count = 0
+
+    def tee(self, rows):
+        """Write each row and pass it on to the next stage."""
+        for row in rows:
+            self.write(row)
+            yield row
+
+    def write_frame(self, frame):
+        with METRICS.timer('output_write'):
+            self._write_frame(frame)
+
+    def save(self):
+        with METRICS.timer('output_save'):
+            self._save()
+
+    def discard(self):
+        """Drop a partially written output, e.g. when its source failed halfway."""
+        self._close()
+        Path(self.path).unlink(missing_ok=True)
+
+    def _close(self):
+        pass
+
+class ExcelRowWriter(RowWriter):
+    """Sink that streams rows into a write-only openpyxl workbook.
+
+    Rows are appended as they arrive instead of being collected into a
+    DataFrame first, so memory stays flat however many rows are written.
+    """
+
+    def __init__(self, path, columns):
+        from openpyxl import Workbook
+
+        super().__init__(path, columns)
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet('Sheet1')
+        self._sheet.append(self.columns)
+
+    def write(self, row):
+        # Empty strings become blank cells, as pandas' to_excel writes them
+        values = (row.get(col) for col in self.columns)
+        self._sheet.append([value if value not in (None, '') else None for value in values])
+        self.count += 1
+
+    def _write_frame(self, frame):
+        """Append every row of a DataFrame; NaN and empty strings become blank cells."""
+        frame = _blank_to_none(frame.reindex(columns=self.columns))
+        for values in frame.itertuples(index=False, name=None):
+            self._sheet.append(values)
+        self.count += len(frame)
+
+    def _save(self):
+        self._workbook.save(self.path)
+
+    def _close(self):
+        # Finish the sheet's temporary file; left open, openpyxl writes to it
+        # after closing it at interpreter exit
+        if not self._sheet.closed:
+            self._sheet.close()
+
+class CsvRowWriter(RowWriter):
+    """Sink that writes rows straight to a CSV file."""
+
+    def __init__(self, path, columns):
+        super().__init__(path, columns)
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def write(self, row):
+        self._writer.writerow([row.get(col, '') for col in self.columns])
+        self.count += 1
+
+    def _write_frame(self, frame):
+        frame.reindex(columns=self.columns).to_csv(self._file, header=False, index=False)
+        self.count += len(frame)
+
+    def _save(self):
+        self._file.close()
+
+    def _close(self):
+        self._file.close()
+
+class ArrowRowWriter(RowWriter):
+    """Sink that writes Parquet or Feather files one record batch at a time.
+
+    numeric_columns are stored as float64 and every other column as string,
+    so each batch shares one schema. Rows passed to write() are buffered
+    and flushed every batch_size rows.
+    """
+
+    def __init__(self, path, columns, numeric_columns=(), batch_size=1000):
+        super().__init__(path, columns)
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("Parquet/Feather output needs pyarrow: pip install pyarrow")
+
+        self._pa = pa
+        self.batch_size = batch_size
+        self._buffer = []
+        self.schema = pa.schema([
+            (col, pa.float64() if col in numeric_columns else pa.string()) for col in self.columns
+        ])
+        if Path(path).suffix.lower() == '.parquet':
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(path, self.schema)
+        else:
+            # Feather v2 is the Arrow IPC file format
+            self._writer = pa.ipc.new_file(path, self.schema)
+
+    def write(self, row):
+        self._buffer.append(row)
+        self.count += 1
+        if len(self._buffer) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            import pandas as pd
+
+            rows, self._buffer = self._buffer, []
+            self._write_table(pd.DataFrame.from_records(rows, columns=self.columns))
+
+    def _write_table(self, frame):
+        frame = _blank_to_none(frame.reindex(columns=self.columns))
+        self._writer.write_table(self._pa.Table.from_pandas(frame, schema=self.schema, preserve_index=False))
+
+    def _write_frame(self, frame):
+        self._flush()
+        self._write_table(frame)
+        self.count += len(frame)
+
+    def _save(self):
+        self._flush()
+        self._writer.close()
+
+    def _close(self):
+        self._writer.close()
+
+# Output formats by file extension
+SINKS = {
+    '.xlsx': ExcelRowWriter,
+    '.csv': CsvRowWriter,
+    '.parquet': ArrowRowWriter,
+    '.feather': ArrowRowWriter,
+}
+
+def open_row_writer(path, columns, numeric_columns=()):
+    """Return the sink for path's extension (.xlsx, .csv, .parquet or .feather)."""
+    suffix = Path(path).suffix.lower()
+    sink = SINKS.get(suffix)
+    if sink is None:
+        raise ValueError(f"Unsupported output format '{suffix}' (use one of: {', '.join(SINKS)})")
+    if sink is ArrowRowWriter:
+        return sink(path, columns, numeric_columns)
+    return sink(path, columns)
+
+def read_table(path, numeric_columns=()):
+    """Read a file written by one of the sinks back into a DataFrame.
+
+    Text columns stay strings (part numbers keep their leading zeros);
+    numeric_columns found in the file are parsed to floats.
+    """
+    import pandas as pd
+    from frame_normalizer import parse_numbers
+
+    suffix = Path(path).suffix.lower()
+    if suffix == '.xlsx':
+        frame = pd.read_excel(path, dtype=str, keep_default_na=False)
+    elif suffix == '.csv':
+        frame = pd.read_csv(path, dtype=str, keep_default_na=False)
+    elif suffix == '.parquet':
+        return pd.read_parquet(path)
+    elif suffix == '.feather':
+        return pd.read_feather(path)
+    else:
+        raise ValueError(f"Unsupported input format '{suffix}' (use one of: {', '.join(SINKS)})")
+
+    parsed = {col: parse_numbers(frame[col].str.strip())[0] for col in numeric_columns if col in frame.columns}
+    return frame.assign(**parsed) if parsed else frame
+
+def export_table(input_path, output_path, numeric_columns=()):
+    """Copy a table file to another format (chosen by output_path's extension); returns the row count."""
+    frame = read_table(input_path, numeric_columns)
+    writer = open_row_writer(output_path, frame.columns, [col for col in numeric_columns if col in frame.columns])
+    writer.write_frame(frame)
+    writer.save()
+    return writer.count
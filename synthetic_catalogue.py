@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic CTC-style catalogue PDFs for benchmarks and local testing.
+
+The PDF is written directly (Helvetica text plus optional ruling lines), so
+no PDF library is needed and even thousand-page catalogues are produced in
+a few seconds. Layouts:
+
+    ruled     every cell boxed by lines, as table detection expects
+    unruled   the same columns as plain text rows, no lines
+    mixed     ruled, with header spellings varying from page to page
+
+    python synthetic_catalogue.py catalogue.pdf --pages 100 --layout mixed
+"""
+
+import random
+import argparse
+
+LAYOUTS = ['ruled', 'unruled', 'mixed']
+
+# Column header spellings; the first is used by the ruled/unruled layouts,
+# the mixed layout picks one per page
+HEADER_SPELLINGS = [
+    ['Part No', 'PART NUMBER', 'Part #'],
+    ['SS Part No', 'SS Part Number', 'SS PART NO.'],
+    ['Origin', 'ORIGIN'],
+    ['Description', 'Desc', 'DECC'],
+    ['Grade', 'App Grade', 'Application Grade'],
+    ['Main', 'MAIN'],
+    ['Sub', 'Subcategory'],
+    ['Size', 'SIZE'],
+    ['Brand', 'Brand Name'],
+    ['Remarks', 'Remark'],
+    ['Loc', 'Location'],
+    ['Cost', 'COST'],
+    ['Mkt', 'Market'],
+    ['Price A', 'PriceA'],
+    ['Price B', 'PriceB'],
+    ['Model', 'MODEL'],
+    ['Qty', 'Quantity'],
+]
+
+COLUMN_WIDTHS = [48, 52, 36, 70, 40, 40, 40, 36, 36, 44, 28, 40, 32, 44, 44, 40, 28]
+
+PAGE_WIDTH, PAGE_HEIGHT = 842, 595  # A4 landscape, in points
+MARGIN = 30
+FONT_SIZE = 6
+ROW_HEIGHT = 10
+ROWS_PER_PAGE = (PAGE_HEIGHT - 2 * MARGIN - 20) // ROW_HEIGHT - 1
+
+def _escape(text):
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def synthetic_row(n, rng):
+    """One catalogue row for item n, as cell strings in header order."""
+    return [
+        f"{n:07d}",
+        f"SS{n}",
+        rng.choice(['JAPAN', 'CHINA', 'KOREA', 'TAIWAN']),
+        f"{rng.choice(['BUSH', 'SEAL', 'GASKET', 'BEARING'])} {n % 97}",
+        rng.choice(['A', 'B', 'C']),
+        rng.choice(['ENGINE', 'BRAKE', 'CLUTCH']),
+        rng.choice(['BUSH', 'KIT', 'PIN']),
+        f"{rng.randint(5, 60)}x{rng.randint(5, 90)}",
+        rng.choice(['CTP', 'ITR', 'NOK', 'SKF']),
+        rng.choice(['', '', 'NEW', 'OEM']),
+        f"R{n % 9}",
+        f"{rng.randint(100, 90000):,}",
+        rng.choice(['', f"{rng.randint(100, 9000)}"]),
+        f"{rng.randint(100, 9000)}.000",
+        rng.choice(['', f"{rng.randint(100, 9000)}.000"]),
+        rng.choice(['D6C', 'HD785', 'PC200']),
+        str(rng.randint(1, 50)),
+    ]
+
+def _page_stream(title, header, rows, ruled):
+    """PDF content stream for one page of the table."""
+    edges = [MARGIN]
+    for width in COLUMN_WIDTHS:
+        edges.append(edges[-1] + width)
+
+    ops = [f"BT /F1 9 Tf 1 0 0 1 {MARGIN} {PAGE_HEIGHT - MARGIN} Tm ({_escape(title)}) Tj ET"]
+    top = PAGE_HEIGHT - MARGIN - 20
+    lines = [header] + rows
+    ops.append(f"BT /F1 {FONT_SIZE} Tf")
+    for line_idx, cells in enumerate(lines):
+        y = top - (line_idx + 1) * ROW_HEIGHT + 3
+        for x, cell in zip(edges, cells):
+            if cell:
+                ops.append(f"1 0 0 1 {x + 2} {y} Tm ({_escape(cell)}) Tj")
+    ops.append("ET")
+
+    if ruled:
+        bottom = top - len(lines) * ROW_HEIGHT
+        ops.append("0.5 w")
+        for line_idx in range(len(lines) + 1):
+            y = top - line_idx * ROW_HEIGHT
+            ops.append(f"{edges[0]} {y} m {edges[-1]} {y} l S")
+        for x in edges:
+            ops.append(f"{x} {top} m {x} {bottom} l S")
+    return '\n'.join(ops).encode('latin-1')
+
+def write_catalogue(path, pages, layout='ruled', seed=1):
+    """Write a synthetic catalogue PDF; returns the number of data rows."""
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout '{layout}' (use one of: {', '.join(LAYOUTS)})")
+    rng = random.Random(seed)
+
+    with open(path, 'wb') as f:
+        offsets = {}
+
+        def write_object(num, body):
+            offsets[num] = f.tell()
+            f.write(f"{num} 0 obj\n".encode() + body + b"\nendobj\n")
+
+        f.write(b"%PDF-1.4\n")
+        # 1: catalog, 2: page tree, 3: font; pages use objects 4, 5, ... in pairs
+        page_ids = [4 + 2 * i for i in range(pages)]
+        write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        kids = ' '.join(f"{num} 0 R" for num in page_ids)
+        write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode())
+        write_object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+
+        row_count = 0
+        for page_idx, page_id in enumerate(page_ids):
+            if layout == 'mixed':
+                header = [rng.choice(spellings) for spellings in HEADER_SPELLINGS]
+            else:
+                header = [spellings[0] for spellings in HEADER_SPELLINGS]
+            rows = [synthetic_row(row_count + i, rng) for i in range(ROWS_PER_PAGE)]
+            row_count += len(rows)
+
+            stream = _page_stream(f"CTC Item List - page {page_idx + 1}", header, rows, layout != 'unruled')
+            write_object(page_id, (
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}]"
+                f" /Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>"
+            ).encode())
+            write_object(page_id + 1, f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream")
+
+        xref_offset = f.tell()
+        count = 4 + 2 * pages
+        f.write(f"xref\n0 {count}\n0000000000 65535 f \n".encode())
+        for num in range(1, count):
+            f.write(f"{offsets[num]:010d} 00000 n \n".encode())
+        f.write(f"trailer\n<< /Size {count} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode())
+
+    return row_count
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic CTC-style catalogue PDF")
+    parser.add_argument('output', help="PDF file to write")
+    parser.add_argument('--pages', type=int, default=10, help="number of pages (default: 10)")
+    parser.add_argument('--layout', choices=LAYOUTS, default='ruled', help="page layout (default: ruled)")
+    parser.add_argument('--seed', type=int, default=1, help="random seed (default: 1)")
+    args = parser.parse_args()
+
+    rows = write_catalogue(args.output, args.pages, args.layout, args.seed)
+    print(f"✅ Wrote {args.pages} pages ({rows} rows) to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The scripts live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+@pytest.fixture
+def mock_api():
+    """A mock_parts_api server on a free port; yields (store, api_base_url)."""
+    from mock_parts_api import PartsStore, start_in_thread
+
+    store = PartsStore()
+    server, api_base_url = start_in_thread(store=store)
+    yield store, api_base_url
+    server.shutdown()
+    server.server_close()
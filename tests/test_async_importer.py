@@ -0,0 +1,45 @@
+import pytest
+
+from async_importer import _backoff_delay, import_items_async
+from mock_parts_api import FaultProfile, PartsStore, start_in_thread
+
+ITEMS = [{'part_no': f'P{n}', 'brand_name': 'CTP', 'description': f'ITEM {n}'} for n in range(20)]
+
+@pytest.fixture
+def faulty_api():
+    """Start a mock server with the given FaultProfile; yields a factory returning (store, api_base_url)."""
+    servers = []
+
+    def start(**faults):
+        store = PartsStore()
+        server, api_base_url = start_in_thread(store=store, faults=FaultProfile(seed=1, **faults))
+        servers.append(server)
+        return store, api_base_url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+def test_transient_failures_are_retried(faulty_api):
+    store, api_base_url = faulty_api(error_rate=0.3, error_status=503)
+    result = import_items_async(ITEMS, api_base_url=api_base_url, concurrency=4, max_retries=10, backoff_base=0.001)
+    assert result == (20, 0)
+    assert len(store.parts) == 20
+    assert store.responses['POST /api/parts']['503'] > 0
+
+def test_an_item_fails_once_its_retries_are_used_up(faulty_api):
+    store, api_base_url = faulty_api(error_rate=1.0, error_status=500)
+    result = import_items_async(ITEMS[:3], api_base_url=api_base_url, concurrency=2, max_retries=2, backoff_base=0.001)
+    assert result == (0, 3)
+    assert store.responses['POST /api/parts'] == {'500': 9}
+
+def test_client_errors_are_not_retried(faulty_api):
+    store, api_base_url = faulty_api()
+    store.create({'part_no': 'P0'})
+    assert import_items_async(ITEMS[:2], api_base_url=api_base_url, concurrency=2, backoff_base=0.001) == (1, 1)
+    assert store.responses['POST /api/parts'] == {'201': 1, '400': 1}
+
+def test_retry_after_overrides_the_backoff():
+    assert _backoff_delay(5, 0.5, retry_after='2') == 2.0
+    assert 0.25 <= _backoff_delay(0, 0.5) <= 0.75
@@ -0,0 +1,20 @@
+from convert_pdf_to_excel import is_repeated_header, iter_pdf_pages
+from synthetic_catalogue import write_catalogue
+
+HEADER = ['Part No', 'SS Part No', 'Origin', 'Brand', 'Remarks', 'Cost', 'Price A']
+
+def test_header_repeated_in_another_spelling_is_recognized():
+    assert is_repeated_header(['PART NUMBER', 'SS PART NO.', 'ORIGIN', 'Brand Name', 'Remark', 'COST', 'PriceA'], HEADER)
+
+def test_data_rows_with_header_words_are_kept():
+    assert not is_repeated_header(['0001234', 'SS1234', 'JAPAN', 'CTP', 'ORIGINAL', '1,200', '1500.000'], HEADER)
+    assert not is_repeated_header(['0001235', '', 'BRAND NEW', 'NOK', 'COST PRICE', '', ''], HEADER)
+
+def test_workers_give_the_same_pages_as_the_serial_path(tmp_path):
+    pdf = tmp_path / 'catalogue.pdf'
+    write_catalogue(pdf, pages=6)
+    serial = list(iter_pdf_pages(pdf))
+    parallel = list(iter_pdf_pages(pdf, workers=2))
+    assert [page_num for page_num, rows, headers in serial] == list(range(1, 7))
+    assert sum(len(rows) for page_num, rows, headers in serial) > 0
+    assert parallel == serial
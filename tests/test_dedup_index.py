@@ -0,0 +1,56 @@
+import json
+
+from dedup_index import DedupIndex
+
+FIELDS = ['part_no', 'brand_name', 'master_part_no', 'description', 'cost', 'status']
+
+def item(part_no, brand='CTP', **fields):
+    return dict({'part_no': part_no, 'brand_name': brand}, **fields)
+
+def test_exact_duplicates_are_dropped():
+    dedup = DedupIndex(FIELDS)
+    rows = [item('P1', cost=10.0), item('P2'), item('P1', cost=10.0)]
+    assert list(dedup.iter_unique(rows)) == rows[:2]
+    assert dedup.summary()['duplicate'] == 1
+
+def test_later_rows_fill_the_blanks_of_the_first():
+    dedup = DedupIndex(FIELDS)
+    rows = [item('P1', description='SEAL'), item('P1', cost=12.5, status='inactive'), item('P1', master_part_no='M1')]
+    unique = list(dedup.iter_unique(rows))
+    assert unique == [item('P1', description='SEAL', cost=12.5, master_part_no='M1')]
+    assert dedup.summary()['merged'] == 2
+
+def test_conflicts_follow_their_first_row_but_are_not_imported():
+    dedup = DedupIndex(FIELDS)
+    rows = [item('P1', cost=10.0), item('P2'), item('P1', cost=11.0)]
+    unique = list(dedup.iter_unique(rows))
+    assert unique == [rows[0], rows[2], rows[1]]
+    assert list(dedup.iter_importable(unique)) == [rows[0], rows[1]]
+    assert dedup.entries[0]['differences'] == {'cost': [10.0, 11.0]}
+
+def test_a_repeat_past_the_window_is_only_reported():
+    dedup = DedupIndex(FIELDS, window=1)
+    rows = [item('P1'), item('P2'), item('P1', cost=12.5)]
+    assert list(dedup.iter_unique(rows)) == [item('P1'), item('P2')]
+    assert dedup.entries[0]['values_not_kept'] == {'cost': 12.5}
+
+def test_part_no_of_another_brand_is_held_back():
+    dedup = DedupIndex(FIELDS)
+    rows = [item('P1', 'CTP'), item('P1', 'NOK')]
+    assert list(dedup.iter_importable(dedup.iter_unique(rows))) == rows[:1]
+    assert dedup.entries[0]['taken_by'] == 'CTP'
+
+def test_variants_are_grouped_by_master_part_in_the_report(tmp_path):
+    dedup = DedupIndex(FIELDS)
+    rows = [item('P1', master_part_no='M1'), item('P2', 'NOK', master_part_no='M1'), item('P3'), item('P1', cost=5.0)]
+    list(dedup.iter_importable(dedup.iter_unique(rows)))
+    summary = dedup.summary()
+    assert (summary['items'], summary['unique'], summary['merged']) == (4, 3, 1)
+    assert (summary['master_parts'], summary['master_parts_with_variants']) == (2, 1)
+
+    path = tmp_path / 'dedup.json'
+    dedup.save_report(path)
+    report = json.loads(path.read_text(encoding='utf-8'))
+    assert report['master_parts'] == {'M1': [{'part_no': 'P1', 'brand_name': 'CTP'}, {'part_no': 'P2', 'brand_name': 'NOK'}]}
+    assert report['entries'] == [{'action': 'merged', 'row': 4, 'part_no': 'P1', 'brand_name': 'CTP',
+                                  'master_part_no': None, 'first_row': 1, 'values_added': {'cost': 5.0}}]
@@ -0,0 +1,30 @@
+from header_resolver import HeaderResolver, clean_header
+
+ALIASES = {
+    'part_no': ['part no', 'part number'],
+    'ss_part_no': ['ss part no'],
+    'price_a': ['price a', 'price'],
+}
+
+def test_headers_are_cleaned_before_matching():
+    assert clean_header('  Part\nNo ') == 'part no'
+    assert HeaderResolver(ALIASES).resolve('PART\n NUMBER') == 'part_no'
+
+def test_the_longest_alias_inside_a_header_wins():
+    resolver = HeaderResolver(ALIASES)
+    assert resolver.resolve('SS Part No.') == 'ss_part_no'
+    assert resolver.resolve('Sale Price') == 'price_a'
+    assert resolver.resolve('Remarks') is None
+
+def test_exact_matching_only_without_substring():
+    resolver = HeaderResolver(ALIASES, substring=False)
+    assert resolver.resolve('SS Part No.') is None
+    assert resolver.resolve('ss part no') == 'ss_part_no'
+
+def test_column_plan_maps_header_cells_to_fields():
+    plan = HeaderResolver(ALIASES).column_plan(['Part No', None, 'Remarks', 'Price A'])
+    assert plan == [(0, 'part_no'), (3, 'price_a')]
+
+def test_key_plan_orders_keys_by_alias_priority():
+    plan = dict(HeaderResolver(ALIASES, substring=False).key_plan(['Price', 'Part No', 'price a']))
+    assert plan == {'price_a': ['price a', 'Price'], 'part_no': ['Part No']}
@@ -0,0 +1,17 @@
+from import_items_from_pdf import import_items_bulk
+
+def items(*part_nos):
+    return [{'part_no': part_no, 'brand_name': 'CTP', 'description': f'ITEM {part_no}', 'cost': 10.0}
+            for part_no in part_nos]
+
+def test_items_are_sent_in_batches(mock_api):
+    store, api_base_url = mock_api
+    assert import_items_bulk(iter(items('P1', 'P2', 'P3')), batch_size=2, api_base_url=api_base_url) == (3, 0)
+    assert store.responses['POST /api/parts/bulk-create'] == {'200': 2}
+    assert sorted(store.ids_by_part_no) == ['P1', 'P2', 'P3']
+
+def test_rows_refused_by_the_backend_are_counted_per_item(mock_api):
+    store, api_base_url = mock_api
+    store.create({'part_no': 'P2'})
+    assert import_items_bulk(items('P1', 'P2', 'P3'), batch_size=10, api_base_url=api_base_url) == (2, 1)
+    assert sorted(store.ids_by_part_no) == ['P1', 'P2', 'P3']
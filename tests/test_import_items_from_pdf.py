@@ -0,0 +1,19 @@
+from import_items_from_pdf import normalize_rows
+
+def normalize(row):
+    return next(normalize_rows([row]))
+
+def test_record_with_part_no_and_ss_part_no_keeps_them_apart():
+    item = normalize({'ss part no': 'SS-0001', 'Part No': '0001', 'brand': 'CTP'})
+    assert item['part_no'] == '0001'
+    assert item['ss_part_no'] == 'SS-0001'
+
+def test_blank_part_no_does_not_take_the_ss_part_no():
+    item = normalize({'Part No': '', 'SS Part No': 'SS-0001', 'Description': 'SEAL', 'Brand': 'CTP'})
+    assert item['part_no'] == 'SEAL'
+    assert item['ss_part_no'] == 'SS-0001'
+
+def test_json_export_without_part_no_uses_the_ss_part_no():
+    item = normalize({'Master Part no': '0021212', 'ss part no': '0021213', 'Discription': 'CUP BEARING', 'brand': 'CTP'})
+    assert item['part_no'] == '0021213'
+    assert item['master_part_no'] == '0021212'
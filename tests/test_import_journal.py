@@ -0,0 +1,34 @@
+from import_journal import ImportJournal
+from import_items_from_pdf import build_part_payload, import_items_bulk, skip_journaled_items, update_modified_items
+
+def item(part_no, description):
+    return {'part_no': part_no, 'brand_name': 'CTP', 'description': description}
+
+def test_lookup_classifies_payloads(tmp_path):
+    journal = ImportJournal(tmp_path / 'journal.sqlite3')
+    payload = build_part_payload(item('P1', 'SEAL'), 1)
+    assert journal.lookup(payload) == ('new', None)
+    journal.record(payload, True, 'id-1')
+    assert journal.lookup(payload) == ('unchanged', 'id-1')
+    assert journal.lookup(dict(payload, description='O-RING')) == ('modified', 'id-1')
+    journal.record(dict(payload, description='O-RING'), False, error='500')
+    assert journal.lookup(payload) == ('failed', 'id-1')
+    assert journal.counts() == {'failed': 1}
+    journal.close()
+
+def test_a_second_run_sends_only_the_changes(tmp_path, mock_api):
+    store, api_base_url = mock_api
+    journal = ImportJournal(tmp_path / 'journal.sqlite3')
+    assert import_items_bulk([item('P1', 'SEAL'), item('P2', 'BEARING')], api_base_url=api_base_url, journal=journal) == (2, 0)
+
+    modified = []
+    catalogue = [item('P1', 'SEAL'), item('P2', 'BEARING 6204'), item('P3', 'GASKET')]
+    new_items = list(skip_journaled_items(catalogue, journal, modified))
+    assert new_items == [item('P3', 'GASKET')]
+    assert journal.skipped == 1
+    assert [(changed['part_no'], part_id) for changed, part_id in modified] == [('P2', store.ids_by_part_no['P2'])]
+
+    assert update_modified_items(modified, journal, api_base_url) == (1, 0)
+    assert store.parts[store.ids_by_part_no['P2']]['description'] == 'BEARING 6204'
+    assert journal.lookup(build_part_payload(item('P2', 'BEARING 6204'), 2))[0] == 'unchanged'
+    journal.close()
@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from json_source import iter_json_array, iter_json_rows, parse_models
+
+ITEMS = [
+    {'ss part no': '0021213', 'Discription': 'CUP BEARING', 'cost': 2.5, 'size': None,
+     'models': [{'model': 'D6D', 'qty': 2}]},
+    {'ss part no': '0021214', 'Discription': 'SEAL "A", 3/4', 'cost': 1250, 'models': []},
+    [1, 2],
+]
+
+def write_json(tmp_path, text):
+    path = tmp_path / 'items.json'
+    path.write_text(text, encoding='utf-8')
+    return path
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64 * 1024])
+def test_elements_decode_the_same_at_any_chunk_size(tmp_path, chunk_size):
+    path = write_json(tmp_path, json.dumps(ITEMS, indent=2))
+    assert list(iter_json_array(path, chunk_size)) == ITEMS
+
+def test_empty_array(tmp_path):
+    assert list(iter_json_array(write_json(tmp_path, ' [ ] '))) == []
+
+@pytest.mark.parametrize('text, message', [
+    ('{"a": 1}', 'expected a JSON array'),
+    ('[1 2]', "expected ',' or ']'"),
+    ('[1, 2', 'unexpected end'),
+    ('[1, {"a": }]', 'invalid array element'),
+])
+def test_malformed_files_are_refused(tmp_path, text, message):
+    with pytest.raises(ValueError, match=message):
+        list(iter_json_array(write_json(tmp_path, text), chunk_size=4))
+
+def test_rows_are_flat_text(tmp_path):
+    rows = list(iter_json_rows(write_json(tmp_path, json.dumps(ITEMS))))
+    assert rows == [
+        {'ss part no': '0021213', 'Discription': 'CUP BEARING', 'cost': '2.5', 'size': '',
+         'models': '[{"model":"D6D","qty":2}]'},
+        {'ss part no': '0021214', 'Discription': 'SEAL "A", 3/4', 'cost': '1250', 'models': ''},
+    ]
+
+def test_models_become_the_post_payload():
+    assert parse_models('[{"model":"D6D","qty":2},{"name":"D7G","qty_used":"1,000"},{"model":""},{"model":"D8","qty":0}]') == [
+        {'name': 'D6D', 'qty_used': 2}, {'name': 'D7G', 'qty_used': 1000}, {'name': 'D8', 'qty_used': 1},
+    ]
+    assert parse_models('not json') == []
+    assert parse_models('') == []
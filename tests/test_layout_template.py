@@ -0,0 +1,43 @@
+from layout_template import LayoutTemplate
+
+ROW_HEIGHT = 10
+
+class FakePage:
+    """Stands in for a pdfplumber page: just its words."""
+
+    def __init__(self, lines):
+        self.words = []
+        for line_idx, cells in enumerate(lines):
+            top = 20 + line_idx * ROW_HEIGHT
+            for x, text in zip((2, 52), cells):
+                if text:
+                    self.words.append({'text': text, 'x0': x, 'x1': x + 30, 'top': top, 'bottom': top + 6})
+
+    def extract_words(self):
+        return list(self.words)
+
+def rows_page(count, footer=None):
+    lines = [['Part No', 'Brand']] + [[f"P{n}", 'CTP'] for n in range(1, count + 1)]
+    if footer:
+        lines += [[None, None]] * 5 + [[footer, None]]
+    return FakePage(lines)
+
+def sampled_template(rows):
+    """The template learned from sample pages holding `rows` rows below the header."""
+    return LayoutTemplate([0, 50, 100], ['Part No', 'Brand'], top=20, bottom=20 + rows * ROW_HEIGHT + 6)
+
+def test_later_page_longer_than_the_samples_keeps_every_row():
+    template = sampled_template(3)
+    header, *rows = template.extract_table(rows_page(12))
+    assert header == ['Part No', 'Brand']
+    assert [row[0] for row in rows] == [f"P{n}" for n in range(1, 13)]
+
+def test_text_well_below_the_table_is_not_read_as_a_row():
+    template = sampled_template(3)
+    header, *rows = template.extract_table(rows_page(8, footer='Page 2'))
+    assert [row[0] for row in rows] == [f"P{n}" for n in range(1, 9)]
+
+def test_shorter_page_reads_its_rows_only():
+    template = sampled_template(10)
+    header, *rows = template.extract_table(rows_page(2))
+    assert rows == [['P1', 'CTP'], ['P2', 'CTP']]
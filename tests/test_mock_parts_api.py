@@ -0,0 +1,53 @@
+import pytest
+
+from mock_parts_api import PartsStore, start_in_thread
+from import_items_from_pdf import SyncPlan, apply_sync_updates, fetch_live_parts, update_modified_items
+
+# Values only the app holds: the catalogue never carries them
+APP_ONLY = {'hs_code': '8483.30', 'weight': 2.5, 'reorder_level': 7, 'smc': 'SMC-1', 'price_m': 140.0}
+
+@pytest.fixture
+def api():
+    store = PartsStore()
+    status, part = store.create(dict(APP_ONLY, part_no='P1', master_part_no='M1', brand_name='CTP',
+                                     description='OLD SEAL', category_id='SEALS', cost=100.0))
+    assert status == 201
+    server, api_base_url = start_in_thread(store=store)
+    yield store, part['id'], api_base_url
+    server.shutdown()
+    server.server_close()
+
+def test_put_resets_the_fields_left_out():
+    store = PartsStore()
+    _, part = store.create(dict(APP_ONLY, part_no='P1', master_part_no='M1', brand_name='CTP', category_id='SEALS'))
+    status, part = store.update(part['id'], {'part_no': 'P1', 'description': 'NEW SEAL'})
+    assert status == 200
+    assert part['description'] == 'NEW SEAL'
+    assert (part['hs_code'], part['weight'], part['smc'], part['price_m']) == (None, None, None, None)
+    assert part['reorder_level'] == 0
+    assert (part['master_part_no'], part['brand_name'], part['category_name']) == (None, None, None)
+
+def assert_app_fields_kept(part):
+    assert {field: part[field] for field in APP_ONLY} == APP_ONLY
+    assert part['master_part_no'] == 'M1'
+    assert part['category_name'] == 'SEALS'
+    assert part['cost'] == 100.0
+
+def test_sync_field_update_keeps_the_app_only_fields(api):
+    store, part_id, api_base_url = api
+    plan = SyncPlan(fetch_live_parts(api_base_url))
+    plan.add_items([{'part_no': 'P1', 'brand_name': 'CTP', 'description': 'NEW SEAL', 'category': 'SEALS'}])
+    assert len(plan.field_updates) == 1
+
+    apply_sync_updates(plan, api_base_url)
+    part = store.parts[part_id]
+    assert part['description'] == 'NEW SEAL'
+    assert_app_fields_kept(part)
+
+def test_journal_update_keeps_the_app_only_fields(api):
+    store, part_id, api_base_url = api
+    item = {'part_no': 'P1', 'brand_name': 'CTP', 'description': 'NEW SEAL', 'category': 'SEALS'}
+    assert update_modified_items([(item, part_id)], api_base_url=api_base_url) == (1, 0)
+    part = store.parts[part_id]
+    assert part['description'] == 'NEW SEAL'
+    assert_app_fields_kept(part)
@@ -0,0 +1,51 @@
+import pytest
+
+from convert_pdf_to_excel import NUMERIC_COLUMNS, extract_pdf_to_excel
+from partial_results import extract_partial, merge_partials, shard_pages
+from row_sinks import read_table
+from synthetic_catalogue import write_catalogue
+
+@pytest.fixture(scope='module')
+def catalogue(tmp_path_factory):
+    """A five-page catalogue and its unsharded extract."""
+    work = tmp_path_factory.mktemp('catalogue')
+    pdf = work / 'catalogue.pdf'
+    write_catalogue(pdf, pages=5)
+    assert extract_pdf_to_excel(pdf, work / 'whole.csv')
+    return pdf, read_table(work / 'whole.csv', NUMERIC_COLUMNS)
+
+def test_shards_split_the_pages_evenly():
+    assert [shard_pages((index, 3), 10) for index in (1, 2, 3)] == [(1, 3), (4, 6), (7, 10)]
+    assert shard_pages((2, 4), 1) == (1, 0)
+
+def test_merged_shards_equal_one_unsharded_run(catalogue, tmp_path):
+    pdf, whole = catalogue
+    output = tmp_path / 'merged.csv'
+    paths = [extract_partial(pdf, output, shard=(index, 2)) for index in (1, 2)]
+    assert merge_partials(paths, output)
+    assert read_table(output, NUMERIC_COLUMNS).equals(whole)
+
+def test_overlapping_page_ranges_are_taken_once(catalogue, tmp_path, capsys):
+    pdf, whole = catalogue
+    output = tmp_path / 'merged.csv'
+    paths = [extract_partial(pdf, output, pages=pages) for pages in ((2, None), (1, 3))]
+    assert merge_partials(paths, output)
+    assert read_table(output, NUMERIC_COLUMNS).equals(whole)
+    assert '2 pages present in more than one partial' in capsys.readouterr().out
+
+def test_a_missing_shard_stops_the_merge(catalogue, tmp_path, capsys):
+    pdf, whole = catalogue
+    output = tmp_path / 'merged.csv'
+    path = extract_partial(pdf, output, shard=(1, 3))
+    assert not merge_partials([path], output)
+    assert not output.exists()
+    assert 'missing shards: 2/3, 3/3' in capsys.readouterr().out
+
+def test_an_unfinished_partial_stops_the_merge(catalogue, tmp_path, capsys):
+    pdf, whole = catalogue
+    output = tmp_path / 'merged.csv'
+    paths = [extract_partial(pdf, output, shard=(index, 2)) for index in (1, 2)]
+    lines = paths[1].read_text(encoding='utf-8').splitlines(keepends=True)
+    paths[1].write_text(''.join(lines[:-1]), encoding='utf-8')
+    assert not merge_partials(paths, output)
+    assert 'incomplete, the run did not finish' in capsys.readouterr().out
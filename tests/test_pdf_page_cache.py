@@ -0,0 +1,58 @@
+import pdfplumber
+
+import convert_pdf_to_excel
+from pdf_page_cache import PageCache, file_hash, page_digest
+
+def write_pdf(path, form_text, font='Helvetica'):
+    """One page that draws a form XObject, the form showing form_text."""
+    form = f"BT /F1 12 Tf 72 700 Td ({form_text}) Tj ET".encode()
+    content = b"/Fm0 Do"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792]"
+        b" /Resources << /XObject << /Fm0 5 0 R >> >> /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream",
+        b"<< /Type /XObject /Subtype /Form /BBox [0 0 612 792] /Resources << /Font << /F1 6 0 R >> >>"
+        b" /Length %d >>\nstream\n" % len(form) + form + b"\nendstream",
+        f"<< /Type /Font /Subtype /Type1 /BaseFont /{font} >>".encode(),
+    ]
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for num, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += f"{num} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(data)
+    data += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    data += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    data += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(data)
+    return path
+
+def digest_of(path):
+    with pdfplumber.open(path) as pdf:
+        return page_digest(pdf.pages[0])
+
+def test_same_content_stream_different_form_gets_another_digest(tmp_path):
+    first = digest_of(write_pdf(tmp_path / 'a.pdf', 'PART 0001'))
+    second = digest_of(write_pdf(tmp_path / 'b.pdf', 'PART 0002'))
+    assert first != second
+
+def test_different_font_gets_another_digest(tmp_path):
+    first = digest_of(write_pdf(tmp_path / 'a.pdf', 'PART 0001'))
+    second = digest_of(write_pdf(tmp_path / 'b.pdf', 'PART 0001', font='Courier'))
+    assert first != second
+
+def test_identical_pages_share_a_digest(tmp_path):
+    assert digest_of(write_pdf(tmp_path / 'a.pdf', 'PART 0001')) == digest_of(write_pdf(tmp_path / 'b.pdf', 'PART 0001'))
+
+def test_the_pdf_is_hashed_once_per_run(tmp_path, monkeypatch):
+    pdf = write_pdf(tmp_path / 'a.pdf', 'PART 0001')
+    calls = []
+    monkeypatch.setattr(convert_pdf_to_excel, 'file_hash', lambda path: calls.append(path) or file_hash(path))
+    for run in range(2):
+        cache = PageCache(tmp_path / 'cache')
+        list(convert_pdf_to_excel.iter_pdf_pages(pdf, cache=cache))
+        cache.close()
+    assert len(calls) == 2
+    assert (cache.hits, cache.misses) == (1, 0)
@@ -0,0 +1,68 @@
+import import_items_from_pdf
+from import_items_from_pdf import import_items_bulk, iter_payloads
+from reference_cache import ReferenceCache, name_key
+
+def test_name_key_ignores_case_and_spacing():
+    assert name_key('  Oil\tSeals ') == name_key('OIL SEALS') == 'oil seals'
+
+def loaded_cache(store, api_base_url):
+    references = store.references
+    references.create_brand('CTP')
+    _, category = references.create_category('Seals')
+    references.create_subcategory('Oil Seals', category['id'])
+    cache = ReferenceCache(api_base_url)
+    assert cache.load()
+    return cache, category['id']
+
+def test_names_are_sent_as_ids(mock_api):
+    store, api_base_url = mock_api
+    cache, seals_id = loaded_cache(store, api_base_url)
+    body = cache.apply({'part_no': 'P1', 'brand_name': 'ctp', 'category_id': 'SEALS', 'subcategory_id': 'oil  seals'})
+    assert body['brand_name'] == 'CTP'
+    assert body['category_id'] == seals_id
+    assert store.references.subcategories[body['subcategory_id']]['name'] == 'Oil Seals'
+    assert not any(cache.created.values())
+    cache.close()
+
+def test_a_subcategory_alone_brings_its_category(mock_api):
+    store, api_base_url = mock_api
+    cache, seals_id = loaded_cache(store, api_base_url)
+    assert cache.apply({'part_no': 'P1', 'subcategory_id': 'Oil Seals'})['category_id'] == seals_id
+    cache.close()
+
+def test_missing_references_are_created_once(mock_api):
+    store, api_base_url = mock_api
+    cache, _ = loaded_cache(store, api_base_url)
+    bodies = [cache.apply({'part_no': f'P{n}', 'brand_name': 'NOK', 'category_id': 'Bearings'}) for n in range(3)]
+    assert cache.created == {'brands': 1, 'categories': 1, 'subcategories': 0}
+    assert len({body['category_id'] for body in bodies}) == 1
+    assert store.responses['POST /api/dropdowns/categories'] == {'201': 1}
+    cache.close()
+
+def test_an_import_sends_ids_only(mock_api):
+    store, api_base_url = mock_api
+    cache, _ = loaded_cache(store, api_base_url)
+    items = [{'part_no': f'P{n}', 'brand_name': 'CTP', 'category': 'seals', 'subcategory': 'OIL SEALS'} for n in range(5)]
+    name_lookups = store.references.name_lookups
+    assert import_items_bulk(items, batch_size=5, api_base_url=api_base_url, references=cache) == (5, 0)
+    # The brand is still sent by name: POST /parts takes no brand id
+    assert store.references.name_lookups - name_lookups == 5
+    assert {part['category_name'] for part in store.parts.values()} == {'Seals'}
+    cache.close()
+
+def test_a_stream_is_resolved_a_batch_at_a_time(monkeypatch):
+    class Recorder:
+        def __init__(self):
+            self.applied = []
+
+        def apply(self, payload):
+            self.applied.append(payload['part_no'])
+            return payload
+
+    monkeypatch.setattr(import_items_from_pdf, 'REFERENCE_BATCH_SIZE', 2)
+    references = Recorder()
+    entries = iter_payloads((item for item in [{'part_no': f'P{n}'} for n in range(3)]), references)
+    next(entries)
+    assert references.applied == ['P0', 'P1']
+    assert [entry[2]['part_no'] for entry in entries] == ['P1', 'P2']
+    assert references.applied == ['P0', 'P1', 'P2']
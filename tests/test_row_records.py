@@ -0,0 +1,19 @@
+import pickle
+import sys
+
+from row_records import make_row
+
+COLUMNS = ['Part No', 'Brand', 'Description']
+
+def test_rows_read_like_dicts():
+    row = make_row(COLUMNS, {'Part No': 'P1', 'Brand': ' CTP '}, {'Brand'})
+    assert row['Brand'] == 'CTP'
+    assert row.get('Description') == ''
+    assert row.get('Origin', 'n/a') == 'n/a'
+    assert row.as_dict() == {'Part No': 'P1', 'Brand': 'CTP', 'Description': ''}
+
+def test_interned_columns_stay_interned_after_unpickling():
+    brand = ''.join(['CT', 'P'])
+    row = pickle.loads(pickle.dumps(make_row(COLUMNS, {'Part No': 'P1', 'Brand': brand}, {'Brand'})))
+    assert row['Brand'] is sys.intern('CTP')
+    assert type(row).interned == {'Brand'}
@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from row_sinks import open_row_writer, read_table
+
+COLUMNS = ['Part No', 'Description', 'Price']
+SUFFIXES = ['.xlsx', '.csv', '.parquet', '.feather']
+
+@pytest.mark.parametrize('suffix', SUFFIXES)
+def test_rows_and_frames_are_written_in_order(tmp_path, suffix):
+    path = tmp_path / f'out{suffix}'
+    writer = open_row_writer(path, COLUMNS, ['Price'])
+    writer.write({'Part No': '0001', 'Description': 'SEAL', 'Price': 1.5})
+    writer.write_frame(pd.DataFrame({'Part No': ['0002'], 'Price': [2.0]}))
+    writer.save()
+
+    frame = read_table(path, ['Price'])
+    assert writer.count == 2
+    assert list(frame.columns) == COLUMNS
+    assert frame['Part No'].tolist() == ['0001', '0002']
+    assert frame['Price'].tolist() == [1.5, 2.0]
+    # Blank text cells read back as '' (Excel, CSV) or null (Arrow)
+    assert frame['Description'][1] == '' or pd.isna(frame['Description'][1])
+
+def test_tee_writes_the_rows_it_passes_on(tmp_path):
+    writer = open_row_writer(tmp_path / 'out.csv', COLUMNS)
+    rows = [{'Part No': 'P1'}, {'Part No': 'P2'}]
+    assert list(writer.tee(iter(rows))) == rows
+    assert writer.count == 2
+    writer.save()
+
+@pytest.mark.parametrize('suffix', SUFFIXES)
+def test_discard_leaves_no_file(tmp_path, suffix):
+    path = tmp_path / f'out{suffix}'
+    writer = open_row_writer(path, COLUMNS)
+    writer.write({'Part No': 'P1'})
+    writer.discard()
+    assert not path.exists()
+
+def test_unknown_extension_is_refused(tmp_path):
+    with pytest.raises(ValueError, match='Unsupported output format'):
+        open_row_writer(tmp_path / 'out.txt', COLUMNS)
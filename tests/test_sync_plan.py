@@ -0,0 +1,52 @@
+from import_items_from_pdf import SyncPlan, apply_sync_updates, diff_part, fetch_live_parts
+
+def live_part(part_no, brand='CTP', **fields):
+    return dict({'id': f'id-{part_no}', 'part_no': part_no, 'brand_name': brand, 'description': part_no,
+                 'uom': 'pcs', 'status': 'active', 'cost': 100.0}, **fields)
+
+def item(part_no, brand='CTP', **fields):
+    return dict({'part_no': part_no, 'brand_name': brand, 'description': part_no, 'cost': 100.0}, **fields)
+
+def plan_for(live_parts, items):
+    plan = SyncPlan({(part['part_no'], part['brand_name']): part for part in live_parts})
+    plan.add_items(plan.iter_listed(items))
+    return plan
+
+def test_diff_ignores_blank_catalogue_cells_and_number_formatting():
+    part = live_part('P1', size='10MM', cost='100.00')
+    assert diff_part({'part_no': 'P1', 'cost': 100.0}, part) == {}
+    assert diff_part({'part_no': 'P1', 'cost': 120.0, 'size': '12MM'}, part) == {'cost': ('100.00', 120.0), 'size': ('10MM', '12MM')}
+
+def test_items_are_sorted_into_creates_and_updates():
+    plan = plan_for(
+        [live_part('P1'), live_part('P2'), live_part('P3'), live_part('P9')],
+        [item('P1'), item('P2', cost=150.0), item('P3', description='NEW'), item('P4')],
+    )
+    assert plan.unchanged == 1
+    assert [(part_id, changes) for part_id, payload, changes in plan.price_updates] == [('id-P2', {'cost': (100.0, 150.0)})]
+    assert [(part['id'], changes) for part, payload, changes in plan.field_updates] == [('id-P3', {'description': ('P3', 'NEW')})]
+    assert [created['part_no'] for created in plan.creates] == ['P4']
+    assert [part['part_no'] for part in plan.missing()] == ['P9']
+
+def test_a_part_listed_under_another_brand_only_is_moved():
+    plan = plan_for([live_part('P1', 'CTP')], [item('P1', 'NOK')])
+    assert plan.moves == 1 and not plan.creates
+    assert plan.field_updates[0][2] == {'brand_name': ('CTP', 'NOK')}
+    assert plan.missing() == []
+
+def test_a_part_still_listed_under_its_brand_is_not_moved():
+    plan = plan_for([live_part('P1', 'CTP')], [item('P1', 'NOK'), item('P1', 'CTP')])
+    assert plan.moves == 0
+    assert plan.unchanged == 1
+
+def test_updates_and_deletions_reach_the_app(mock_api):
+    store, api_base_url = mock_api
+    for part_no in ('P1', 'P2', 'P9'):
+        store.create(item(part_no))
+    plan = SyncPlan(fetch_live_parts(api_base_url))
+    plan.add_items(plan.iter_listed([item('P1', cost=150.0), item('P2', 'NOK')]))
+    assert apply_sync_updates(plan, api_base_url, delete_missing=True) == 1
+    parts = {part['part_no']: part for part in store.parts.values()}
+    assert sorted(parts) == ['P1', 'P2']
+    assert parts['P1']['cost'] == 150.0
+    assert parts['P2']['brand_name'] == 'NOK'